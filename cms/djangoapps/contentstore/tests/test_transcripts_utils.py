@@ -12,6 +12,8 @@ from django.utils import translation
 
 from nose.plugins.skip import SkipTest
 
+from opaque_keys.edx.locator import CourseLocator
+
 from xmodule.modulestore.tests.factories import CourseFactory
 from xmodule.contentstore.content import StaticContent
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
@@ -610,6 +612,46 @@ class TestTranscript(unittest.TestCase):
             transcripts_utils.Transcript.convert(self.srt_transcript, 'srt', 'sjson')
 
 
+class TestTranscriptConversionCache(unittest.TestCase):
+    """
+    Tests for the converted transcripts cache.
+    """
+    def setUp(self):
+        super(TestTranscriptConversionCache, self).setUp()
+        self.sjson_transcript = '{"start": [10500], "end": [13000], "text": ["Elephant&#39;s Dream"]}'
+        transcripts_utils.transcript_conversion_cache.clear()
+        self.addCleanup(transcripts_utils.transcript_conversion_cache.clear)
+
+    def test_evicts_least_recently_used(self):
+        cache = transcripts_utils.TranscriptConversionCache(max_size=10)
+        cache.set('a', '12345')
+        cache.set('b', '12345')
+        self.assertEqual(cache.get('a'), '12345')
+        cache.set('c', '12345')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), '12345')
+        self.assertEqual(cache.get('c'), '12345')
+
+    def test_skips_values_larger_than_max_size(self):
+        cache = transcripts_utils.TranscriptConversionCache(max_size=4)
+        cache.set('a', '12345')
+        self.assertIsNone(cache.get('a'))
+
+    @patch('xmodule.video_module.transcripts_utils.contentstore')
+    def test_convert_asset_is_cached_by_digest(self, mock_contentstore):
+        content = Mock(content_digest='digest', stream_data=Mock(return_value=iter([self.sjson_transcript])))
+        mock_contentstore.return_value.find.return_value = content
+        location = CourseLocator('org', 'course', 'run').make_usage_key('video', 'video')
+
+        expected = transcripts_utils.Transcript.convert(self.sjson_transcript, 'sjson', 'txt')
+        for __ in range(2):
+            actual = transcripts_utils.Transcript.convert_asset(location, 'subs.srt.sjson', 'sjson', 'txt')
+            self.assertEqual(actual, expected)
+
+        # The second call is served from the cache without reading the asset's data.
+        self.assertEqual(content.stream_data.call_count, 1)
+
+
 class TestSubsFilename(unittest.TestCase):
     """
     Tests for subs_filename funtion.
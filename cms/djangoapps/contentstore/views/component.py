@@ -28,7 +28,7 @@ from opaque_keys.edx.keys import UsageKey
 from student.auth import has_course_author_access
 from django.utils.translation import ugettext as _
 
-from xblock_django.api import disabled_xblocks, authorable_xblocks
+from xblock_django.api import disabled_xblock_types, authorable_xblocks
 from xblock_django.models import XBlockStudioConfigurationFlag
 
 
@@ -308,7 +308,7 @@ def get_component_templates(courselike, library=False):
 
         # Add any advanced problem types. Note that these are different xblocks being stored as Advanced Problems.
         if category == 'problem':
-            disabled_block_names = [block.name for block in disabled_xblocks()]
+            disabled_block_names = disabled_xblock_types()
             advanced_problem_types = [advanced_problem_type for advanced_problem_type in ADVANCED_PROBLEM_TYPES
                                       if advanced_problem_type['component'] not in disabled_block_names]
             for advanced_problem_type in advanced_problem_types:
@@ -401,7 +401,7 @@ def _filter_disabled_blocks(all_blocks):
     """
     Filter out disabled xblocks from the provided list of xblock names.
     """
-    disabled_block_names = [block.name for block in disabled_xblocks()]
+    disabled_block_names = disabled_xblock_types()
     return [block_name for block_name in all_blocks if block_name not in disabled_block_names]
 
 
@@ -130,6 +130,10 @@ STATIC_ROOT_BASE = ENV_TOKENS.get('STATIC_ROOT_BASE', None)
 if STATIC_ROOT_BASE:
     STATIC_ROOT = path(STATIC_ROOT_BASE) / EDX_PLATFORM_REVISION
 
+MAKO_PRECOMPILE_TEMPLATES = ENV_TOKENS.get('MAKO_PRECOMPILE_TEMPLATES', MAKO_PRECOMPILE_TEMPLATES)
+
+EDX_API_DATA_STALE_TTL = ENV_TOKENS.get('EDX_API_DATA_STALE_TTL', EDX_API_DATA_STALE_TTL)
+
 EMAIL_BACKEND = ENV_TOKENS.get('EMAIL_BACKEND', EMAIL_BACKEND)
 EMAIL_FILE_PATH = ENV_TOKENS.get('EMAIL_FILE_PATH', None)
 
@@ -238,12 +238,17 @@ sys.path.append(COMMON_ROOT / 'djangoapps')
 # For geolocation ip database
 GEOIP_PATH = REPO_ROOT / "common/static/data/geoip/GeoIP.dat"
 GEOIPV6_PATH = REPO_ROOT / "common/static/data/geoip/GeoIPv6.dat"
+# Number of IP address lookups remembered by each process
+GEOIP_CACHE_SIZE = 10000
 
 ############################# TEMPLATE CONFIGURATION #############################
 # Mako templating
 # TODO: Move the Mako templating into a different engine in TEMPLATES below.
 import tempfile
 MAKO_MODULE_DIR = os.path.join(tempfile.gettempdir(), 'mako_cms')
+# Whether to compile all the mako templates when the wsgi application is loaded,
+# rather than when they are first rendered.
+MAKO_PRECOMPILE_TEMPLATES = False
 MAKO_TEMPLATES = {}
 MAKO_TEMPLATES['main'] = [
     PROJECT_ROOT / 'templates',
@@ -1179,6 +1184,10 @@ OAUTH_OIDC_ISSUER = 'https://www.example.com/oauth2'
 # 5 minute expiration time for JWT id tokens issued for external API requests.
 OAUTH_ID_TOKEN_EXPIRATION = 5 * 60
 
+# Seconds for which data from the edX REST APIs is still served once its cache_ttl has elapsed,
+# while it is refreshed in the background.
+EDX_API_DATA_STALE_TTL = 60 * 60
+
 USERNAME_PATTERN = r'(?P<username>[\w.@+-]+)'
 
 # Partner support link for CMS footer
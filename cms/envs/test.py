@@ -75,6 +75,10 @@ COMMON_TEST_DATA_ROOT = COMMON_ROOT / "test" / "data"
 FEATURES['ENABLE_EXPORT_GIT'] = True
 GIT_REPO_EXPORT_DIR = TEST_ROOT / "export_course_repos"
 
+# Tests mock the GeoIP lookups to return different countries for the
+# same IP addresses, so the lookups must not be cached across tests.
+GEOIP_CACHE_SIZE = 0
+
 # Makes the tests run much faster...
 SOUTH_TESTS_MIGRATE = False  # To disable migrations and use syncdb instead
 
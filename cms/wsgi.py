@@ -1,3 +1,8 @@
+# Time the imports of the modules loaded while starting, when requested by the
+# EDX_IMPORT_TIME_REPORT environment variable.
+from openedx.core.lib import import_timing
+import_timing.start_from_environment()
+
 # Patch the xml libs before anything else.
 from safe_lxml import defuse_xml_libs
 defuse_xml_libs()
@@ -15,7 +20,17 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "cms.envs.aws")
 import cms.startup as startup
 startup.run()
 
+from django.conf import settings
+from edxmako.paths import precompile_templates
+
+# Compile the mako templates before HTTP requests are accepted, rather than
+# while serving the first requests.
+if settings.MAKO_PRECOMPILE_TEMPLATES:
+    precompile_templates()
+
 # This application object is used by the development server
 # as well as any WSGI server configured to use this file.
 from django.core.wsgi import get_wsgi_application
 application = get_wsgi_application()
+
+import_timing.report()
@@ -0,0 +1,22 @@
+"""
+Management command for compiling the mako templates ahead of the first requests.
+"""
+
+from django.core.management import BaseCommand
+
+from edxmako.paths import precompile_templates
+
+
+class Command(BaseCommand):
+    """
+    Compile the mako templates into MAKO_MODULE_DIR.
+
+    Run as a deployment step, so that the workers load the compiled templates
+    rather than compiling them while serving their first requests.
+    """
+
+    help = 'Compile the mako templates of all the lookup paths into MAKO_MODULE_DIR.'
+
+    def handle(self, *args, **options):
+        compiled = precompile_templates()
+        self.stdout.write(u"Compiled {} mako templates.".format(compiled))
@@ -4,6 +4,7 @@ Set up lookup paths for mako templates.
 
 import hashlib
 import contextlib
+import logging
 import os
 import pkg_resources
 
@@ -12,12 +13,18 @@ from mako.lookup import TemplateLookup
 from mako.exceptions import TopLevelLookupException
 
 from . import LOOKUP
+from openedx.core.djangoapps.theming import helpers as theming_helpers
 from openedx.core.djangoapps.theming.helpers import (
     get_template as themed_template,
     get_template_path_with_theme,
     strip_site_theme_templates_path,
 )
 
+log = logging.getLogger(__name__)
+
+# The extensions of the files compiled by precompile_templates.
+PRECOMPILED_TEMPLATE_EXTENSIONS = ('.html', '.txt', '.xml')
+
 
 class DynamicTemplateLookup(TemplateLookup):
     """
@@ -27,6 +34,9 @@ class DynamicTemplateLookup(TemplateLookup):
     def __init__(self, *args, **kwargs):
         super(DynamicTemplateLookup, self).__init__(*args, **kwargs)
         self.__original_module_directory = self.template_args['module_directory']
+        # The uris that (site theme directory name, uri) were resolved to by
+        # get_template, so that the theme isn't probed again for each render.
+        self._resolved_uri_cache = {}
 
     def __repr__(self):
         return "<{0.__class__.__name__} {0.directories}>".format(self)
@@ -51,6 +61,7 @@ class DynamicTemplateLookup(TemplateLookup):
         # Also clear the internal caches. Ick.
         self._collection.clear()
         self._uri_cache.clear()
+        self._resolved_uri_cache.clear()
 
     def get_template(self, uri):
         """
@@ -62,6 +73,8 @@ class DynamicTemplateLookup(TemplateLookup):
 
         If still unable to find a template, it will fallback to the default template directories after stripping off
         the prefix path to theme.
+
+        The uri a template was found at is cached for the site theme, until the lookup path changes.
         """
         # try to get template for the given file from microsite
         template = themed_template(uri)
@@ -69,15 +82,54 @@ class DynamicTemplateLookup(TemplateLookup):
         # if microsite template is not present or request is not in microsite then
         # let mako find and serve a template
         if not template:
+            site_theme = theming_helpers.get_current_site_theme()
+            cache_key = (site_theme.theme_dir_name if site_theme else None, uri)
+            resolved_uri = self._resolved_uri_cache.get(cache_key)
+            if resolved_uri is not None:
+                return super(DynamicTemplateLookup, self).get_template(resolved_uri)
+
             try:
                 # Try to find themed template, i.e. see if current theme overrides the template
-                template = super(DynamicTemplateLookup, self).get_template(get_template_path_with_theme(uri))
+                resolved_uri = get_template_path_with_theme(uri)
+                template = super(DynamicTemplateLookup, self).get_template(resolved_uri)
             except TopLevelLookupException:
                 # strip off the prefix path to theme and look in default template dirs
-                template = super(DynamicTemplateLookup, self).get_template(strip_site_theme_templates_path(uri))
+                resolved_uri = strip_site_theme_templates_path(uri)
+                template = super(DynamicTemplateLookup, self).get_template(resolved_uri)
+            self._resolved_uri_cache[cache_key] = resolved_uri
 
         return template
 
+    def precompile(self):
+        """
+        Compile all the templates found in the lookup path, and load them
+        into the lookup.
+
+        The templates are compiled into the module directory of the current
+        lookup path, so that the processes using the same lookup path can
+        load the compiled modules rather than compiling the templates again.
+        The templates of the comprehensive themes are compiled as well when
+        their directory is in the lookup path.
+
+        Returns:
+            int: The number of templates compiled.
+        """
+        compiled = 0
+        for directory in self.directories:
+            for dirpath, __, filenames in os.walk(directory):
+                for filename in filenames:
+                    if not filename.endswith(PRECOMPILED_TEMPLATE_EXTENSIONS):
+                        continue
+                    uri = os.path.relpath(os.path.join(dirpath, filename), directory)
+                    try:
+                        super(DynamicTemplateLookup, self).get_template(uri)
+                    except Exception:  # pylint: disable=broad-except
+                        # Not every file in the lookup path is a mako template.
+                        log.debug(u"Could not compile the mako template %s", uri, exc_info=True)
+                    else:
+                        compiled += 1
+        return compiled
+
 
 def clear_lookups(namespace):
     """
@@ -116,6 +168,29 @@ def lookup_template(namespace, name):
     return LOOKUP[namespace].get_template(name)
 
 
+def precompile_templates():
+    """
+    Compile the templates of all the mako template lookups.
+
+    Run before the first request is served, so that the first renders of
+    the templates don't compile them.
+
+    Returns:
+        int: The number of templates compiled.
+    """
+    compiled = 0
+    for namespace, templates in LOOKUP.items():
+        count = templates.precompile()
+        log.info(
+            u"Compiled %d mako templates of the %s lookup in %s",
+            count,
+            namespace,
+            templates.template_args['module_directory'],
+        )
+        compiled += count
+    return compiled
+
+
 @contextlib.contextmanager
 def save_lookups():
     """
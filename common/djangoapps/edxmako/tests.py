@@ -1,5 +1,8 @@
 
 from mock import patch, Mock
+import os
+import shutil
+import tempfile
 import unittest
 import ddt
 
@@ -12,6 +15,7 @@ from django.test.client import RequestFactory
 from django.core.urlresolvers import reverse
 from edxmako.request_context import get_template_request_context
 from edxmako import add_lookup, LOOKUP
+from edxmako.paths import DynamicTemplateLookup
 from edxmako.shortcuts import (
     marketing_link,
     is_marketing_link_set,
@@ -81,6 +85,45 @@ class AddLookupTests(TestCase):
         self.assertTrue(dirs[0].endswith('management'))
 
 
+class DynamicTemplateLookupTests(TestCase):
+    """
+    Test the template resolution cache and the precompilation of `DynamicTemplateLookup`.
+    """
+    def setUp(self):
+        super(DynamicTemplateLookupTests, self).setUp()
+        self.template_dir = tempfile.mkdtemp()
+        self.module_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.template_dir)
+        self.addCleanup(shutil.rmtree, self.module_dir)
+
+        os.mkdir(os.path.join(self.template_dir, 'emails'))
+        for name in ('main.html', os.path.join('emails', 'body.txt'), 'logo.png'):
+            with open(os.path.join(self.template_dir, name), 'w') as template_file:
+                template_file.write('${1 + 1}')
+
+        self.lookup = DynamicTemplateLookup(module_directory=self.module_dir)
+        self.lookup.add_directory(self.template_dir)
+
+    def test_resolution_is_cached(self):
+        with patch('edxmako.paths.get_template_path_with_theme', side_effect=lambda uri: uri) as mock_resolve:
+            self.assertEqual(self.lookup.get_template('main.html').render(), '2')
+            self.assertEqual(self.lookup.get_template('main.html').render(), '2')
+            self.assertEqual(mock_resolve.call_count, 1)
+
+            # Changing the lookup path resolves the templates again.
+            self.lookup.add_directory(self.module_dir)
+            self.lookup.get_template('main.html')
+            self.assertEqual(mock_resolve.call_count, 2)
+
+    def test_precompile(self):
+        self.assertEqual(self.lookup.precompile(), 2)
+        self.assertTrue(self.lookup.has_template('main.html'))
+        module_dir = self.lookup.template_args['module_directory']
+        self.assertTrue(os.path.exists(os.path.join(module_dir, 'main.html.py')))
+        self.assertTrue(os.path.exists(os.path.join(module_dir, 'emails', 'body.txt.py')))
+        self.assertFalse(os.path.exists(os.path.join(module_dir, 'logo.png.py')))
+
+
 class MakoRequestContextTest(TestCase):
     """
     Test MakoMiddleware.
@@ -192,6 +192,43 @@ def add_enrollment(user_id, course_id, mode=None, is_active=True):
     return _data_api().create_course_enrollment(user_id, course_id, mode, is_active)
 
 
+def add_enrollments(user_ids, course_id, mode=None):
+    """Enrolls several users in a course at once.
+
+    The course mode is validated once for all the users, and the enrollments are written with bulk queries. Unlike
+    add_enrollment, this doesn't check whether enrollment in the course is closed or full, so it is meant for staff
+    and partner integrations onboarding many learners at a time.
+
+    Arguments:
+        user_ids (list of str): The usernames of the users to enroll.
+        course_id (str): The course to enroll the users in.
+
+    Keyword Arguments:
+        mode (str): Optional argument for the type of enrollment to create. Ex. 'audit', 'honor', 'verified',
+            'professional'. If not specified, this defaults to the default course mode.
+
+    Returns:
+        A dictionary with the usernames of the users now enrolled in the course under "enrolled", and the reason
+        each of the other users could not be enrolled under "errors".
+
+    Raises:
+        CourseModeNotFoundError: If the mode is not available for the course.
+
+    Example:
+        >>> add_enrollments(["Bob", "Alice", "Eve"], "edX/DemoX/2014T2", mode="audit")
+        {
+            "enrolled": ["Bob", "Alice"],
+            "errors": {
+                "Eve": "Not user with username 'Eve' found."
+            }
+        }
+    """
+    if mode is None:
+        mode = _default_course_mode(course_id)
+    _validate_course_mode(course_id, mode, is_active=True)
+    return _data_api().create_course_enrollments(user_ids, course_id, mode)
+
+
 def update_enrollment(user_id, course_id, mode=None, is_active=None, enrollment_attributes=None, include_expired=False):
     """Updates the course mode for the enrolled user.
 
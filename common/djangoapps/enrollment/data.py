@@ -5,6 +5,7 @@ source to be used throughout the API.
 import logging
 
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 from opaque_keys.edx.keys import CourseKey
 
 from enrollment.errors import (
@@ -22,6 +23,9 @@ from student.models import (
 
 log = logging.getLogger(__name__)
 
+# The number of users create_course_enrollments enrolls with each set of bulk queries.
+BULK_ENROLLMENT_BATCH_SIZE = 1000
+
 
 def get_course_enrollments(user_id):
     """Retrieve a list representing all aggregated data for a user's course enrollments.
@@ -35,12 +39,13 @@ def get_course_enrollments(user_id):
         A serializable list of dictionaries of all aggregated enrollment data for a user.
 
     """
-    qset = CourseEnrollment.objects.filter(
+    course_enrollments = list(CourseEnrollment.objects.filter(
         user__username=user_id,
         is_active=True
-    ).order_by('created')
+    ).order_by('created'))
+    CourseEnrollment.prefetch_course_overviews(course_enrollments)
 
-    enrollments = CourseEnrollmentSerializer(qset, many=True).data
+    enrollments = CourseEnrollmentSerializer(course_enrollments, many=True).data
 
     # Find deleted courses and filter them out of the results
     deleted = []
@@ -129,6 +134,59 @@ def create_course_enrollment(username, course_id, mode, is_active):
         raise CourseEnrollmentExistsError(err.message, enrollment)
 
 
+def create_course_enrollments(usernames, course_id, mode):
+    """Enroll several users in a course with bulk queries.
+
+    Args:
+        usernames (list of str): The names of the users to enroll.
+        course_id (str): The course to enroll the users in.
+        mode (str): The mode of the enrollments.
+
+    Returns:
+        A dictionary with the names of the users now enrolled in the course under "enrolled", and a dictionary of
+        the reason each of the other users could not be enrolled under "errors".
+
+    """
+    course_key = CourseKey.from_string(course_id)
+    enrolled = []
+    errors = {}
+
+    for index in range(0, len(usernames), BULK_ENROLLMENT_BATCH_SIZE):
+        batch = usernames[index:index + BULK_ENROLLMENT_BATCH_SIZE]
+        # Usernames are matched regardless of case by MySQL, so the given ones are mapped to
+        # their users the same way.
+        users_by_username = {user.username.lower(): user for user in User.objects.filter(username__in=batch)}
+        found_users = []
+        for username in batch:
+            user = users_by_username.get(username.lower())
+            if user is None:
+                msg = u"Not user with username '{username}' found.".format(username=username)
+                log.warn(msg)
+                errors[username] = msg
+            else:
+                found_users.append((username, user))
+
+        try:
+            CourseEnrollment.bulk_enroll([user for __, user in found_users], course_key, mode)
+        except IntegrityError:
+            # Some of the users were enrolled in the course concurrently, so they are enrolled one by one.
+            log.warning(u"Could not bulk enroll users in course %s, enrolling them one by one.", course_id)
+            for username, user in found_users:
+                try:
+                    with transaction.atomic():
+                        CourseEnrollment.enroll(user, course_key, mode=mode)
+                except IntegrityError:
+                    msg = u"Could not enroll user with username '{username}'.".format(username=username)
+                    log.warning(msg)
+                    errors[username] = msg
+                else:
+                    enrolled.append(username)
+        else:
+            enrolled.extend(username for username, __ in found_users)
+
+    return {'enrolled': enrolled, 'errors': errors}
+
+
 def update_course_enrollment(username, course_id, mode=None, is_active=None):
     """Modify a course enrollment for a user.
 
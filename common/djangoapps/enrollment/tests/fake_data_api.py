@@ -40,6 +40,13 @@ def create_course_enrollment(student_id, course_id, mode='honor', is_active=True
     return add_enrollment(student_id, course_id, mode=mode, is_active=is_active)
 
 
+def create_course_enrollments(student_ids, course_id, mode):
+    """Stubbed out bulk Enrollment creation request. """
+    for student_id in student_ids:
+        add_enrollment(student_id, course_id, mode=mode)
+    return {'enrolled': list(student_ids), 'errors': {}}
+
+
 def update_course_enrollment(student_id, course_id, mode=None, is_active=None):
     """Stubbed out Enrollment data request."""
     enrollment = _get_fake_enrollment(student_id, course_id)
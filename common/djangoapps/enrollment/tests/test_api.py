@@ -91,6 +91,17 @@ class EnrollmentTest(CacheIsolationTestCase):
         # Enroll in the course and verify that we raise CourseModeNotFoundError
         api.add_enrollment(self.USERNAME, self.COURSE_ID)
 
+    def test_add_enrollments(self):
+        fake_data_api.add_course(self.COURSE_ID, course_modes=['honor', 'verified'])
+        result = api.add_enrollments([self.USERNAME, "Alice"], self.COURSE_ID, mode='verified')
+        self.assertEqual(result, {'enrolled': [self.USERNAME, "Alice"], 'errors': {}})
+        self.assertEqual(api.get_enrollment("Alice", self.COURSE_ID)['mode'], 'verified')
+
+    @raises(CourseModeNotFoundError)
+    def test_add_enrollments_invalid_mode(self):
+        fake_data_api.add_course(self.COURSE_ID, course_modes=['professional'])
+        api.add_enrollments([self.USERNAME, "Alice"], self.COURSE_ID, mode='verified')
+
     @raises(CourseModeNotFoundError)
     def test_prof_ed_enroll(self):
         # Add a fake course enrollment information to the fake data API
@@ -6,10 +6,13 @@ import datetime
 import unittest
 
 import ddt
-from mock import patch
+from mock import Mock, patch
 from nose.tools import raises
 from pytz import UTC
 from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import IntegrityError
+from django.db.models.signals import post_save
 
 from course_modes.models import CourseMode
 from enrollment import data
@@ -228,6 +231,76 @@ class EnrollmentDataTest(ModuleStoreTestCase):
                 mode_display_name=mode_slug,
             )
 
+    def test_create_course_enrollments(self):
+        self._create_course_modes(['audit', 'verified'])
+        new_user = UserFactory.create()
+        inactive_user = UserFactory.create()
+        CourseEnrollment.enroll(inactive_user, self.course.id, mode='audit')
+        CourseEnrollment.unenroll(inactive_user, self.course.id)
+        CourseEnrollment.enroll(self.user, self.course.id, mode='audit')
+
+        with patch('student.models.tracker') as mock_tracker:
+            result = data.create_course_enrollments(
+                [self.user.username, new_user.username, inactive_user.username, "some_fake_user"],
+                unicode(self.course.id),
+                'verified',
+            )
+
+        self.assertItemsEqual(result['enrolled'], [self.user.username, new_user.username, inactive_user.username])
+        self.assertEqual(result['errors'].keys(), ["some_fake_user"])
+        for user in (self.user, new_user, inactive_user):
+            self.assertEqual(CourseEnrollment.enrollment_mode_for_user(user, self.course.id), ('verified', True))
+        # Activation events for the new and reactivated enrollments, and mode change events for the existing ones.
+        self.assertEqual(mock_tracker.emit.call_count, 4)
+
+    def test_create_course_enrollments_sends_signals(self):
+        self._create_course_modes(['audit', 'verified'])
+        CourseEnrollment.enroll(self.user, self.course.id, mode='audit')
+        new_user = UserFactory.create()
+        handler = Mock()
+        post_save.connect(handler, sender=CourseEnrollment, weak=False)
+        self.addCleanup(post_save.disconnect, handler, sender=CourseEnrollment)
+
+        data.create_course_enrollments([self.user.username, new_user.username], unicode(self.course.id), 'verified')
+
+        sent = {call[1]['instance'].user_id: call[1] for call in handler.call_args_list}
+        self.assertEqual(len(sent), 2)
+        self.assertTrue(sent[new_user.id]['created'])
+        self.assertFalse(sent[self.user.id]['created'])
+        self.assertEqual(sent[self.user.id]['instance']._old_mode, 'audit')  # pylint: disable=protected-access
+
+    def test_create_course_enrollments_is_idempotent(self):
+        CourseEnrollment.enroll(self.user, self.course.id, mode='honor')
+        with patch('student.tasks.send_bulk_enrollment_signals.delay') as mock_delay:
+            result = data.create_course_enrollments([self.user.username], unicode(self.course.id), 'honor')
+        self.assertEqual(result['enrolled'], [self.user.username])
+        self.assertFalse(mock_delay.called)
+
+    def test_create_course_enrollments_ignores_case(self):
+        # The test database matches usernames case-sensitively, unlike MySQL.
+        with patch.object(User.objects, 'filter', return_value=[self.user]):
+            with patch('student.tasks.send_bulk_enrollment_signals.delay'):
+                result = data.create_course_enrollments([self.USERNAME.lower()], unicode(self.course.id), 'honor')
+        self.assertEqual(result, {'enrolled': [self.USERNAME.lower()], 'errors': {}})
+        self.assertTrue(CourseEnrollment.is_enrolled(self.user, self.course.id))
+
+    def test_create_course_enrollments_conflict(self):
+        self._create_course_modes(['audit', 'verified'])
+        CourseEnrollment.enroll(self.user, self.course.id, mode='audit')
+        new_user = UserFactory.create()
+
+        with patch.object(CourseEnrollment.objects, 'bulk_create', side_effect=IntegrityError):
+            result = data.create_course_enrollments(
+                [self.user.username, new_user.username, "some_fake_user"],
+                unicode(self.course.id),
+                'verified',
+            )
+
+        self.assertItemsEqual(result['enrolled'], [self.user.username, new_user.username])
+        self.assertEqual(result['errors'].keys(), ["some_fake_user"])
+        for user in (self.user, new_user):
+            self.assertEqual(CourseEnrollment.enrollment_mode_for_user(user, self.course.id), ('verified', True))
+
     @raises(UserNotFoundError)
     def test_enrollment_for_non_existent_user(self):
         data.create_course_enrollment("some_fake_user", unicode(self.course.id), 'honor', True)
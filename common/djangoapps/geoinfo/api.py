@@ -0,0 +1,67 @@
+"""
+Lookup of the countries of IP addresses.
+
+Each process opens the GeoIP databases once, memory-mapped, so that their
+pages are shared with the other worker processes through the page cache
+rather than read again for every lookup. The countries of the most recently
+looked up addresses are kept in a small LRU cache of GEOIP_CACHE_SIZE entries.
+"""
+from collections import OrderedDict
+import threading
+
+import pygeoip
+from django.conf import settings
+
+_DATABASES = {}
+_CACHE = OrderedDict()
+_LOCK = threading.Lock()
+_MISSING = object()
+
+
+def country_code_from_ip(ip_addr):
+    """
+    Return the country code associated with an IP address.
+    Handles both IPv4 and IPv6 addresses.
+
+    Args:
+        ip_addr (str): The IP address to look up.
+
+    Returns:
+        str: A 2-letter country code.
+    """
+    with _LOCK:
+        country_code = _CACHE.pop(ip_addr, _MISSING)
+        if country_code is not _MISSING:
+            # Move the address to the most recently used end of the cache.
+            _CACHE[ip_addr] = country_code
+            return country_code
+
+    country_code = _database_for(ip_addr).country_code_by_addr(ip_addr)
+
+    cache_size = settings.GEOIP_CACHE_SIZE
+    if cache_size > 0:
+        with _LOCK:
+            _CACHE[ip_addr] = country_code
+            while len(_CACHE) > cache_size:
+                _CACHE.popitem(last=False)
+
+    return country_code
+
+
+def clear_cache():
+    """
+    Forget the countries of the addresses looked up so far.
+    """
+    with _LOCK:
+        _CACHE.clear()
+
+
+def _database_for(ip_addr):
+    """
+    Return the process' GeoIP database for the IP address' version.
+    """
+    path = settings.GEOIPV6_PATH if ip_addr.find(':') >= 0 else settings.GEOIP_PATH
+    database = _DATABASES.get(path)
+    if database is None:
+        database = _DATABASES[path] = pygeoip.GeoIP(path, pygeoip.MMAP_CACHE)
+    return database
@@ -0,0 +1,63 @@
+"""
+Tests for the GeoIP lookups.
+"""
+from django.test import TestCase
+from django.test.utils import override_settings
+from mock import patch
+import pygeoip
+
+from geoinfo import api
+
+
+@override_settings(GEOIP_CACHE_SIZE=2)
+class CountryCodeFromIpTests(TestCase):
+    """
+    Tests of country_code_from_ip.
+    """
+    def setUp(self):
+        super(CountryCodeFromIpTests, self).setUp()
+        api.clear_cache()
+        self.addCleanup(api.clear_cache)
+        patcher = patch.object(pygeoip.GeoIP, 'country_code_by_addr', side_effect=self.mock_country_code_by_addr)
+        self.mock_lookup = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def mock_country_code_by_addr(self, ip_addr):
+        """
+        Gives us a fake set of IPs
+        """
+        return {'117.79.83.1': 'CN', '2001:da8:20f:1502:edcf:550b:4a9c:207d': 'CN'}.get(ip_addr, 'US')
+
+    def test_lookup(self):
+        self.assertEqual(api.country_code_from_ip('117.79.83.1'), 'CN')
+        self.assertEqual(api.country_code_from_ip('2001:da8:20f:1502:edcf:550b:4a9c:207d'), 'CN')
+        self.assertEqual(api.country_code_from_ip('4.0.0.0'), 'US')
+
+    def test_databases_are_opened_once(self):
+        with patch('geoinfo.api.pygeoip.GeoIP', wraps=pygeoip.GeoIP) as mock_geoip:
+            api._DATABASES.clear()  # pylint: disable=protected-access
+            for ip_addr in ('117.79.83.1', '4.0.0.0', '2001:da8:20f:1502:edcf:550b:4a9c:207d', '::1'):
+                api.country_code_from_ip(ip_addr)
+        self.assertEqual(mock_geoip.call_count, 2)
+
+    def test_lookups_are_cached(self):
+        api.country_code_from_ip('117.79.83.1')
+        api.country_code_from_ip('117.79.83.1')
+        self.assertEqual(self.mock_lookup.call_count, 1)
+
+    def test_least_recently_used_lookups_are_evicted(self):
+        for ip_addr in ('1.0.0.1', '1.0.0.2', '1.0.0.1', '1.0.0.3'):
+            api.country_code_from_ip(ip_addr)
+        self.assertEqual(self.mock_lookup.call_count, 3)
+
+        # 1.0.0.2 was the least recently used address, so it was evicted.
+        api.country_code_from_ip('1.0.0.1')
+        self.assertEqual(self.mock_lookup.call_count, 3)
+        api.country_code_from_ip('1.0.0.2')
+        self.assertEqual(self.mock_lookup.call_count, 4)
+
+    @override_settings(GEOIP_CACHE_SIZE=0)
+    def test_cache_disabled(self):
+        api.country_code_from_ip('117.79.83.1')
+        api.country_code_from_ip('117.79.83.1')
+        self.assertEqual(self.mock_lookup.call_count, 2)
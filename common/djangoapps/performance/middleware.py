@@ -0,0 +1,67 @@
+"""
+Middleware checking the queries made by each request against the budget of
+its endpoint.
+"""
+import logging
+
+import dogstats_wrapper as dog_stats_api
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from performance.queries import QueryRecorder, get_budget
+
+log = logging.getLogger(__name__)
+
+# The number of duplicated queries logged for a request exceeding its budget.
+LOGGED_DUPLICATED_QUERIES = 5
+
+
+class QueryBudgetMiddleware(object):
+    """
+    Records the queries made by each request, sends them as metrics tagged
+    with the view name of the request's URL, and logs the requests whose
+    queries exceed the budget of their endpoint (see QUERY_BUDGETS).
+
+    Only used when the ENABLE_QUERY_BUDGETS feature is enabled.
+    """
+    def __init__(self):
+        if not settings.FEATURES.get('ENABLE_QUERY_BUDGETS'):
+            raise MiddlewareNotUsed()
+
+    def process_request(self, request):
+        """
+        Start recording the queries of the request.
+        """
+        request.query_recorder = QueryRecorder()
+        request.query_recorder.start()
+
+    def process_response(self, request, response):
+        """
+        Stop recording the queries of the request, and check them against its budget.
+        """
+        recorder = getattr(request, 'query_recorder', None)
+        if recorder is None:
+            return response
+        del request.query_recorder
+        recorder.stop()
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        endpoint = resolver_match.view_name if resolver_match is not None else 'unresolved'
+        tags = [u'endpoint:{}'.format(endpoint)]
+        for metric, value in recorder.metrics().iteritems():
+            dog_stats_api.histogram(u'common.performance.queries.{}'.format(metric), value, tags=tags)
+
+        exceeded = recorder.exceeded(get_budget(endpoint))
+        if exceeded:
+            for metric in exceeded:
+                dog_stats_api.increment(
+                    'common.performance.queries.budget_exceeded',
+                    tags=tags + [u'metric:{}'.format(metric)],
+                )
+            log.warning(
+                u"Request to %s exceeded its query budget (value, limit): %s. Most duplicated queries: %s",
+                endpoint,
+                exceeded,
+                recorder.duplicated_queries.most_common(LOGGED_DUPLICATED_QUERIES),
+            )
+        return response
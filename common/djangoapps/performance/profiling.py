@@ -0,0 +1,283 @@
+"""
+Opt-in profiling of the time spent in each middleware and in the view of
+the requests.
+
+ProfilingWSGIHandler is used as the wsgi application when the
+ENABLE_REQUEST_PROFILING feature is enabled. It times the methods of each
+middleware it loads as well as the whole request, the view being charged
+with the time that isn't spent in middleware, and adds the times to
+histograms kept per endpoint (the view name of the resolved URL).
+
+A fraction of the requests, REQUEST_PROFILING_SAMPLE_RATE, is also profiled
+with a statistical stack sampler, which records the stack of the request
+every REQUEST_PROFILING_SAMPLER_INTERVAL seconds of CPU time. The sampled
+stacks are kept folded, one line per distinct stack, the format expected
+by flame graph tools.
+
+The profiles are kept in the memory of each process.
+"""
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from functools import wraps
+import random
+import signal
+import threading
+import time
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+
+# The upper bounds, in milliseconds, of the buckets of the latency histograms.
+# The last bucket counts the requests that took longer.
+HISTOGRAM_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# The names of the components of a request that aren't middleware.
+VIEW = 'view'
+TOTAL = 'total'
+
+UNRESOLVED_ENDPOINT = 'unresolved'
+
+# The number of distinct stacks kept for each endpoint, so that the memory
+# used by the profiles is bounded.
+MAX_FOLDED_STACKS = 5000
+
+_ENDPOINTS = {}
+_LOCK = threading.Lock()
+_LOCAL = threading.local()
+
+
+class LatencyHistogram(object):
+    """
+    A histogram of the durations of a component of the requests to an endpoint.
+    """
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+
+    def add(self, duration):
+        """
+        Add a duration, in seconds, to the histogram.
+        """
+        milliseconds = duration * 1000
+        self.count += 1
+        self.total += milliseconds
+        self.buckets[bisect_left(HISTOGRAM_BUCKETS, milliseconds)] += 1
+
+    def to_dict(self):
+        """
+        Return the histogram as a dictionary, the buckets being keyed by their upper bound.
+        """
+        bounds = [str(bound) for bound in HISTOGRAM_BUCKETS] + ['+Inf']
+        return {
+            'count': self.count,
+            'total_ms': self.total,
+            'mean_ms': self.total / self.count if self.count else 0,
+            'buckets': dict(zip(bounds, self.buckets)),
+        }
+
+
+class EndpointProfile(object):
+    """
+    The latency histograms and sampled stacks of the requests to an endpoint.
+    """
+    def __init__(self):
+        self.latencies = defaultdict(LatencyHistogram)
+        self.sampled_requests = 0
+        self.stacks = Counter()
+
+    def add(self, duration, timings, stacks=None):
+        """
+        Add a request that took `duration` seconds, `timings` of which were
+        spent in the middleware they are keyed by.
+        """
+        for component, component_duration in timings.iteritems():
+            self.latencies[component].add(component_duration)
+        self.latencies[VIEW].add(max(duration - sum(timings.itervalues()), 0))
+        self.latencies[TOTAL].add(duration)
+
+        if stacks is not None:
+            self.sampled_requests += 1
+            for stack, count in stacks.iteritems():
+                if stack in self.stacks or len(self.stacks) < MAX_FOLDED_STACKS:
+                    self.stacks[stack] += count
+
+    def to_dict(self):
+        """
+        Return the latency histograms of the endpoint as a dictionary.
+        """
+        return {
+            'requests': self.latencies[TOTAL].count,
+            'sampled_requests': self.sampled_requests,
+            'latencies': {
+                component: histogram.to_dict()
+                for component, histogram in self.latencies.iteritems()
+            },
+        }
+
+
+class StackSampler(object):
+    """
+    Records the stack of the main thread each time it has used `interval`
+    more seconds of CPU time.
+
+    Signals can only be handled by the main thread, so requests served by
+    other threads can't be sampled.
+    """
+    def __init__(self, interval):
+        self.interval = interval
+        self.stacks = Counter()
+        self._previous_handler = None
+
+    def start(self):
+        """
+        Start sampling. Returns whether sampling could be started.
+        """
+        try:
+            self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        except ValueError:
+            # Not running in the main thread.
+            return False
+        # Restart the system calls interrupted by the signal rather than failing them with EINTR.
+        signal.siginterrupt(signal.SIGPROF, False)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return True
+
+    def stop(self):
+        """
+        Stop sampling.
+        """
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+
+    def _sample(self, signum, frame):  # pylint: disable=unused-argument
+        """
+        Record the stack of the interrupted frame.
+        """
+        self.stacks[fold_stack(frame)] += 1
+
+
+class ProfilingWSGIHandler(WSGIHandler):
+    """
+    A wsgi application that profiles the requests it handles.
+    """
+    def load_middleware(self):
+        super(ProfilingWSGIHandler, self).load_middleware()
+        for attr in (
+                '_request_middleware',
+                '_view_middleware',
+                '_template_response_middleware',
+                '_response_middleware',
+                '_exception_middleware',
+        ):
+            setattr(self, attr, [_timed(method) for method in getattr(self, attr)])
+
+    def get_response(self, request):
+        _LOCAL.timings = timings = defaultdict(float)
+        sampler = None
+        if random.random() < settings.REQUEST_PROFILING_SAMPLE_RATE:
+            sampler = StackSampler(settings.REQUEST_PROFILING_SAMPLER_INTERVAL)
+            if not sampler.start():
+                sampler = None
+
+        start = time.time()
+        try:
+            return super(ProfilingWSGIHandler, self).get_response(request)
+        finally:
+            duration = time.time() - start
+            if sampler is not None:
+                sampler.stop()
+            _LOCAL.timings = None
+            record(_endpoint(request), duration, timings, sampler.stacks if sampler is not None else None)
+
+
+def fold_stack(frame):
+    """
+    Return the stack ending at `frame` as a line of folded stacks, from the
+    outermost frame to `frame`, e.g. 'module:outer;module:inner'.
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(u'{}:{}'.format(frame.f_globals.get('__name__', code.co_filename), code.co_name))
+        frame = frame.f_back
+    return u';'.join(reversed(names))
+
+
+def record(endpoint, duration, timings, stacks=None):
+    """
+    Add a request to the profile of its endpoint.
+
+    Arguments:
+        endpoint (unicode): The view name of the request's URL.
+        duration (float): The time the request took, in seconds.
+        timings (dict): The seconds spent in each middleware, keyed by the middleware's class path.
+        stacks (Counter): The number of times each folded stack was sampled, if the request was sampled.
+    """
+    with _LOCK:
+        profile = _ENDPOINTS.get(endpoint)
+        if profile is None:
+            profile = _ENDPOINTS[endpoint] = EndpointProfile()
+        profile.add(duration, timings, stacks)
+
+
+def get_report():
+    """
+    Return the latency histograms of each endpoint, keyed by endpoint.
+    """
+    with _LOCK:
+        return {endpoint: profile.to_dict() for endpoint, profile in _ENDPOINTS.iteritems()}
+
+
+def get_folded_stacks(endpoint=None):
+    """
+    Return the stacks sampled for the endpoint, or for all endpoints, as
+    folded stacks whose outermost frame is the endpoint.
+    """
+    with _LOCK:
+        lines = [
+            u'{};{} {}'.format(name, stack, count)
+            for name, profile in _ENDPOINTS.iteritems()
+            if endpoint is None or name == endpoint
+            for stack, count in profile.stacks.iteritems()
+        ]
+    return u'\n'.join(sorted(lines))
+
+
+def clear():
+    """
+    Forget the profiles of all the endpoints.
+    """
+    with _LOCK:
+        _ENDPOINTS.clear()
+
+
+def _timed(method):
+    """
+    Wrap a middleware method to add the time it takes to the timings of the
+    current request.
+    """
+    middleware_class = method.__self__.__class__
+    component = u'{}.{}'.format(middleware_class.__module__, middleware_class.__name__)
+
+    @wraps(method)
+    def timed(*args, **kwargs):  # pylint: disable=missing-docstring
+        timings = getattr(_LOCAL, 'timings', None)
+        if timings is None:
+            return method(*args, **kwargs)
+        start = time.time()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            timings[component] += time.time() - start
+    return timed
+
+
+def _endpoint(request):
+    """
+    Return the view name of the URL the request was resolved to.
+    """
+    resolver_match = getattr(request, 'resolver_match', None)
+    if resolver_match is None:
+        return UNRESOLVED_ENDPOINT
+    return resolver_match.view_name
@@ -0,0 +1,228 @@
+"""
+Recording of the queries made while handling a request, and of the budgets
+they are checked against.
+
+While a QueryRecorder is recording, it counts:
+
+* the SQL queries of every database connection and the time they took,
+* the queries repeating an earlier query with different parameters, the
+  usual sign of a query run once per item of a list (an N+1 query),
+* the queries to mongo made by the split modulestore, as timed by its
+  QueryTimer,
+* the hits and misses of the django caches.
+
+Recording SQL queries relies on the debug cursor of the connections, which
+formats and keeps each query, so it is only done by the QueryBudgetMiddleware
+when the ENABLE_QUERY_BUDGETS feature is enabled, and by tests.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+import re
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+
+from xmodule.modulestore.split_mongo.mongo_connection import TIMER as SPLIT_MONGO_TIMER
+
+# The split modulestore operations timed by its QueryTimer that query mongo.
+MONGO_OPERATIONS = frozenset([
+    'get_structure.find_one',
+    'find_structures_by_id',
+    'find_course_blocks_by_id',
+    'find_structures_derived_from',
+    'find_ancestor_structures',
+    'insert_structure',
+    'get_course_index',
+    'find_matching_course_indexes',
+    'insert_course_index',
+    'update_course_index',
+    'delete_course_index',
+    'get_definition',
+    'get_definitions',
+    'insert_definition',
+])
+
+# The metrics a budget can limit.
+METRICS = ('sql_queries', 'sql_time', 'duplicate_queries', 'mongo_calls', 'cache_hits', 'cache_misses')
+
+_LOCAL = threading.local()
+_MISSING = object()
+
+_STRING_OR_NUMBER = re.compile(r"'(?:[^'\\]|\\.|'')*'|\b\d+(?:\.\d+)?\b")
+_LIST_OF_VALUES = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+
+def fingerprint(sql):
+    """
+    Return the SQL query with its values replaced by placeholders, so that
+    queries differing only by their parameters have the same fingerprint.
+    """
+    sql = _STRING_OR_NUMBER.sub('?', sql)
+    sql = _LIST_OF_VALUES.sub('(?)', sql)
+    return u' '.join(sql.split())
+
+
+class QueryRecorder(object):
+    """
+    Records the queries made by the current thread between start() and stop().
+    """
+    def __init__(self):
+        self.sql_queries = []
+        self.mongo_operations = Counter()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._connection_states = {}
+
+    def start(self):
+        """
+        Start recording.
+        """
+        for connection in connections.all():
+            self._connection_states[connection.alias] = (connection.force_debug_cursor, len(connection.queries_log))
+            connection.force_debug_cursor = True
+        for alias in settings.CACHES:
+            _instrument_cache(caches[alias])
+        _recorders().append(self)
+
+    def stop(self):
+        """
+        Stop recording.
+        """
+        _recorders().remove(self)
+        for connection in connections.all():
+            if connection.alias not in self._connection_states:
+                continue
+            force_debug_cursor, first_query = self._connection_states.pop(connection.alias)
+            connection.force_debug_cursor = force_debug_cursor
+            self.sql_queries.extend(list(connection.queries_log)[first_query:])
+
+    @property
+    def fingerprints(self):
+        """
+        The number of times each SQL query fingerprint was run.
+        """
+        return Counter(fingerprint(query['sql']) for query in self.sql_queries)
+
+    @property
+    def duplicated_queries(self):
+        """
+        The fingerprints of the SQL queries run more than once, with the number of times they were run.
+        """
+        return Counter({sql: count for sql, count in self.fingerprints.iteritems() if count > 1})
+
+    def metrics(self):
+        """
+        Return the recorded metrics, keyed by name.
+        """
+        return {
+            'sql_queries': len(self.sql_queries),
+            'sql_time': sum(float(query.get('time') or 0) for query in self.sql_queries),
+            'duplicate_queries': len(self.sql_queries) - len(self.fingerprints),
+            'mongo_calls': sum(
+                count for operation, count in self.mongo_operations.iteritems() if operation in MONGO_OPERATIONS
+            ),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+        }
+
+    def exceeded(self, budget):
+        """
+        Return the metrics exceeding their limit in `budget`, a dictionary of
+        limits keyed by metric name, as {metric: (value, limit)}.
+        """
+        metrics = self.metrics()
+        return {
+            metric: (metrics[metric], limit)
+            for metric, limit in budget.iteritems()
+            if limit is not None and metrics[metric] > limit
+        }
+
+
+@contextmanager
+def record_queries():
+    """
+    Context manager recording the queries made in its block, yielding the QueryRecorder.
+    """
+    recorder = QueryRecorder()
+    recorder.start()
+    try:
+        yield recorder
+    finally:
+        recorder.stop()
+
+
+def get_budget(endpoint):
+    """
+    Return the budget of the endpoint: DEFAULT_QUERY_BUDGET overridden by the
+    endpoint's limits in QUERY_BUDGETS.
+    """
+    budget = dict(settings.DEFAULT_QUERY_BUDGET)
+    budget.update(settings.QUERY_BUDGETS.get(endpoint, {}))
+    return budget
+
+
+def _recorders():
+    """
+    Return the recorders recording in the current thread.
+    """
+    if not hasattr(_LOCAL, 'recorders'):
+        _LOCAL.recorders = []
+    return _LOCAL.recorders
+
+
+def _record_mongo_operation(operation, duration):  # pylint: disable=unused-argument
+    """
+    Count a split modulestore operation in the recorders of the current thread.
+    """
+    for recorder in getattr(_LOCAL, 'recorders', ()):
+        recorder.mongo_operations[operation] += 1
+
+
+def _record_cache_lookups(hits, misses):
+    """
+    Count cache hits and misses in the recorders of the current thread.
+    """
+    for recorder in getattr(_LOCAL, 'recorders', ()):
+        recorder.cache_hits += hits
+        recorder.cache_misses += misses
+
+
+def _instrument_cache(cache):
+    """
+    Wrap the get and get_many methods of a cache, so that its hits and misses
+    are counted.
+
+    Django creates a cache object per thread, so this only wraps the methods
+    of the cache object of the current thread, once.
+    """
+    if getattr(cache, '_query_recorder_instrumented', False):
+        return
+    cache._query_recorder_instrumented = True  # pylint: disable=protected-access
+
+    get = cache.get
+    get_many = cache.get_many
+
+    @wraps(get)
+    def counted_get(key, default=None, version=None):  # pylint: disable=missing-docstring
+        value = get(key, _MISSING, version=version)
+        if value is _MISSING:
+            _record_cache_lookups(0, 1)
+            return default
+        _record_cache_lookups(1, 0)
+        return value
+
+    @wraps(get_many)
+    def counted_get_many(keys, version=None):  # pylint: disable=missing-docstring
+        keys = list(keys)
+        values = get_many(keys, version=version)
+        _record_cache_lookups(len(values), len(keys) - len(values))
+        return values
+
+    cache.get = counted_get
+    cache.get_many = counted_get_many
+
+
+SPLIT_MONGO_TIMER.add_listener(_record_mongo_operation)
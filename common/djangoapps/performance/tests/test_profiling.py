@@ -0,0 +1,150 @@
+"""Tests of the request profiling."""
+from collections import Counter
+import json
+import signal
+import sys
+import unittest
+
+from django.conf import settings
+from django.core.urlresolvers import reverse
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
+from mock import patch
+
+from performance import profiling
+from student.tests.factories import AdminFactory, UserFactory
+from util.testing import UrlResetMixin
+
+
+@unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
+@override_settings(
+    MIDDLEWARE_CLASSES=(
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'django.middleware.common.CommonMiddleware',
+    ),
+    REQUEST_PROFILING_SAMPLE_RATE=0,
+)
+class ProfilingWSGIHandlerTest(TestCase):
+    """
+    Tests that ProfilingWSGIHandler times the middleware and the views of the requests.
+    """
+    def setUp(self):
+        super(ProfilingWSGIHandlerTest, self).setUp()
+        profiling.clear()
+        self.addCleanup(profiling.clear)
+        self.handler = profiling.ProfilingWSGIHandler()
+        self.handler.load_middleware()
+
+    def test_request_is_profiled(self):
+        response = self.handler.get_response(RequestFactory().post('/performance'))
+        self.assertEqual(response.status_code, 204)
+
+        report = profiling.get_report()
+        self.assertEqual(report.keys(), ['performance.views.performance_log'])
+        endpoint = report['performance.views.performance_log']
+        self.assertEqual(endpoint['requests'], 1)
+        self.assertEqual(endpoint['sampled_requests'], 0)
+        self.assertEqual(
+            set(endpoint['latencies']),
+            {
+                'django.contrib.sessions.middleware.SessionMiddleware',
+                'django.middleware.common.CommonMiddleware',
+                profiling.VIEW,
+                profiling.TOTAL,
+            }
+        )
+        for histogram in endpoint['latencies'].itervalues():
+            self.assertEqual(histogram['count'], 1)
+            self.assertEqual(sum(histogram['buckets'].itervalues()), 1)
+
+    def test_unresolved_request(self):
+        self.handler.get_response(RequestFactory().get('/no/such/page'))
+        self.assertIn(profiling.UNRESOLVED_ENDPOINT, profiling.get_report())
+
+    @override_settings(REQUEST_PROFILING_SAMPLE_RATE=1)
+    def test_request_is_sampled(self):
+        with patch.object(profiling.StackSampler, 'start', return_value=True) as mock_start:
+            with patch.object(profiling.StackSampler, 'stop') as mock_stop:
+                self.handler.get_response(RequestFactory().post('/performance'))
+        self.assertTrue(mock_start.called)
+        self.assertTrue(mock_stop.called)
+        self.assertEqual(profiling.get_report()['performance.views.performance_log']['sampled_requests'], 1)
+
+
+class ProfilesTest(TestCase):
+    """
+    Tests of the recorded profiles.
+    """
+    def setUp(self):
+        super(ProfilesTest, self).setUp()
+        profiling.clear()
+        self.addCleanup(profiling.clear)
+
+    def test_fold_stack(self):
+        stack = profiling.fold_stack(sys._getframe())  # pylint: disable=protected-access
+        self.assertTrue(stack.endswith(u';performance.tests.test_profiling:test_fold_stack'))
+
+    def test_histogram(self):
+        profiling.record('endpoint', 0.3, {'middleware': 0.02})
+        profiling.record('endpoint', 20, {'middleware': 0.002})
+        latencies = profiling.get_report()['endpoint']['latencies']
+        self.assertEqual(latencies['middleware']['buckets']['5'], 1)
+        self.assertEqual(latencies['middleware']['buckets']['25'], 1)
+        self.assertEqual(latencies[profiling.VIEW]['buckets']['500'], 1)
+        self.assertEqual(latencies[profiling.TOTAL]['buckets']['+Inf'], 1)
+        self.assertEqual(latencies[profiling.TOTAL]['count'], 2)
+
+    def test_folded_stacks(self):
+        profiling.record('first', 0.1, {}, Counter({'a:main;a:inner': 3}))
+        profiling.record('first', 0.1, {}, Counter({'a:main;a:inner': 1, 'a:main': 1}))
+        profiling.record('second', 0.1, {}, Counter({'b:main': 2}))
+        self.assertEqual(
+            profiling.get_folded_stacks(),
+            u'first;a:main 1\nfirst;a:main;a:inner 4\nsecond;b:main 2',
+        )
+        self.assertEqual(profiling.get_folded_stacks('second'), u'second;b:main 2')
+
+    @patch('signal.setitimer')
+    @patch('signal.siginterrupt')
+    def test_sampler_restarts_system_calls(self, mock_siginterrupt, _mock_setitimer):
+        sampler = profiling.StackSampler(0.005)
+        self.assertTrue(sampler.start())
+        self.addCleanup(sampler.stop)
+        mock_siginterrupt.assert_called_once_with(signal.SIGPROF, False)
+
+    @patch('performance.profiling.MAX_FOLDED_STACKS', 1)
+    def test_folded_stacks_are_bounded(self):
+        profiling.record('endpoint', 0.1, {}, Counter({'a:main': 1, 'a:main;a:inner': 1}))
+        self.assertEqual(len(profiling.get_folded_stacks().splitlines()), 1)
+
+
+@unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
+class ProfilingReportViewTest(UrlResetMixin, TestCase):
+    """
+    Tests of the staff-only view of the request profiles.
+    """
+    @patch.dict('django.conf.settings.FEATURES', {'ENABLE_REQUEST_PROFILING': True})
+    def setUp(self):
+        super(ProfilingReportViewTest, self).setUp()
+        profiling.clear()
+        self.addCleanup(profiling.clear)
+        profiling.record('endpoint', 0.1, {}, Counter({'a:main': 2}))
+        self.url = reverse('performance_profile')
+
+    def test_staff_only(self):
+        user = UserFactory(password='test')
+        self.client.login(username=user.username, password='test')
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_report(self):
+        staff = AdminFactory(password='test')
+        self.client.login(username=staff.username, password='test')
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['endpoint']['requests'], 1)
+
+        response = self.client.get(self.url, {'format': 'folded'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, 'endpoint;a:main 2')
@@ -0,0 +1,146 @@
+"""Tests of the recording of queries and of the query budgets."""
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
+from mock import patch
+
+from performance.middleware import QueryBudgetMiddleware
+from performance.queries import SPLIT_MONGO_TIMER, fingerprint, get_budget, record_queries
+from performance.testutils import QueryBudgetTestMixin
+from student.tests.factories import UserFactory
+
+
+class FingerprintTest(TestCase):
+    """
+    Tests of the fingerprints of SQL queries.
+    """
+    def test_values_are_replaced(self):
+        self.assertEqual(
+            fingerprint(u"SELECT * FROM auth_user WHERE id = 12 AND username = 'o''neil'"),
+            u"SELECT * FROM auth_user WHERE id = ? AND username = ?",
+        )
+
+    def test_lists_of_values_are_collapsed(self):
+        self.assertEqual(
+            fingerprint(u"SELECT * FROM auth_user2 WHERE id IN (1, 2,\n 3)"),
+            u"SELECT * FROM auth_user2 WHERE id IN (?)",
+        )
+
+
+class RecordQueriesTest(QueryBudgetTestMixin, TestCase):
+    """
+    Tests of the QueryRecorder.
+    """
+    def setUp(self):
+        super(RecordQueriesTest, self).setUp()
+        self.users = [UserFactory() for __ in range(3)]
+
+    def test_sql_queries(self):
+        with record_queries() as recorder:
+            for user in self.users:
+                User.objects.get(id=user.id)
+            list(User.objects.all())
+
+        metrics = recorder.metrics()
+        self.assertEqual(metrics['sql_queries'], 4)
+        self.assertEqual(metrics['duplicate_queries'], 2)
+        self.assertEqual(recorder.duplicated_queries.values(), [3])
+
+    def test_mongo_calls(self):
+        with record_queries() as recorder:
+            for operation in ('get_structure', 'get_structure.find_one', 'structure_from_mongo', 'get_definitions'):
+                with SPLIT_MONGO_TIMER.timer(operation, 'course'):
+                    pass
+        self.assertEqual(recorder.metrics()['mongo_calls'], 2)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_cache_lookups(self):
+        cache.set('query-budget-test', 'value')
+        with record_queries() as recorder:
+            self.assertEqual(cache.get('query-budget-test'), 'value')
+            self.assertEqual(cache.get('query-budget-missing', 'default'), 'default')
+            self.assertEqual(
+                cache.get_many(['query-budget-test', 'query-budget-missing']),
+                {'query-budget-test': 'value'},
+            )
+
+        metrics = recorder.metrics()
+        self.assertEqual(metrics['cache_hits'], 2)
+        self.assertEqual(metrics['cache_misses'], 2)
+
+    def test_nested_recorders(self):
+        with record_queries() as outer:
+            User.objects.get(id=self.users[0].id)
+            with record_queries() as inner:
+                User.objects.get(id=self.users[1].id)
+        self.assertEqual(outer.metrics()['sql_queries'], 2)
+        self.assertEqual(inner.metrics()['sql_queries'], 1)
+
+    def test_assert_query_budget(self):
+        with self.assertQueryBudget(sql_queries=1):
+            User.objects.get(id=self.users[0].id)
+
+        with self.assertRaises(AssertionError):
+            with self.assertQueryBudget(duplicate_queries=0):
+                for user in self.users:
+                    User.objects.get(id=user.id)
+
+    @override_settings(QUERY_BUDGETS={'dashboard': {'sql_queries': 0}})
+    def test_assert_endpoint_query_budget(self):
+        with self.assertRaises(AssertionError):
+            with self.assertQueryBudget('dashboard'):
+                User.objects.get(id=self.users[0].id)
+
+    @override_settings(
+        DEFAULT_QUERY_BUDGET={'sql_queries': 100, 'mongo_calls': 10},
+        QUERY_BUDGETS={'dashboard': {'sql_queries': 20}},
+    )
+    def test_get_budget(self):
+        self.assertEqual(get_budget('dashboard'), {'sql_queries': 20, 'mongo_calls': 10})
+        self.assertEqual(get_budget('courseware'), {'sql_queries': 100, 'mongo_calls': 10})
+
+
+@override_settings(DEFAULT_QUERY_BUDGET={'sql_queries': 1}, QUERY_BUDGETS={})
+class QueryBudgetMiddlewareTest(TestCase):
+    """
+    Tests of the QueryBudgetMiddleware.
+    """
+    def setUp(self):
+        super(QueryBudgetMiddlewareTest, self).setUp()
+        with patch.dict('django.conf.settings.FEATURES', {'ENABLE_QUERY_BUDGETS': True}):
+            self.middleware = QueryBudgetMiddleware()
+        self.request = RequestFactory().get('/')
+        self.user = UserFactory()
+
+    def test_disabled(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            QueryBudgetMiddleware()
+
+    @patch('performance.middleware.log')
+    def test_within_budget(self, mock_log):
+        self.middleware.process_request(self.request)
+        User.objects.get(id=self.user.id)
+        self.middleware.process_response(self.request, HttpResponse())
+        self.assertFalse(mock_log.warning.called)
+
+    @patch('performance.middleware.dog_stats_api')
+    @patch('performance.middleware.log')
+    def test_budget_exceeded(self, mock_log, mock_dog_stats_api):
+        self.middleware.process_request(self.request)
+        User.objects.get(id=self.user.id)
+        User.objects.get(id=self.user.id)
+        self.middleware.process_response(self.request, HttpResponse())
+
+        self.assertTrue(mock_log.warning.called)
+        mock_dog_stats_api.increment.assert_called_once_with(
+            'common.performance.queries.budget_exceeded',
+            tags=[u'endpoint:unresolved', u'metric:sql_queries'],
+        )
+
+    def test_response_without_request(self):
+        response = HttpResponse()
+        self.assertIs(self.middleware.process_response(self.request, response), response)
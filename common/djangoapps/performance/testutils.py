@@ -0,0 +1,33 @@
+"""
+Test utilities for checking the queries made by the code under test against
+a budget.
+"""
+from contextlib import contextmanager
+
+from performance.queries import get_budget, record_queries
+
+
+class QueryBudgetTestMixin(object):
+    """
+    Mixin for test cases asserting that blocks of code don't make more
+    queries than their budget allows.
+    """
+    @contextmanager
+    def assertQueryBudget(self, endpoint=None, **limits):  # pylint: disable=invalid-name
+        """
+        Assert that the block doesn't exceed the budget of `endpoint` (see
+        QUERY_BUDGETS), if given, nor the `limits`, keyed by the metrics of
+        performance.queries.METRICS, e.g. `duplicate_queries=0`.
+        """
+        budget = get_budget(endpoint) if endpoint is not None else {}
+        budget.update(limits)
+        with record_queries() as recorder:
+            yield recorder
+
+        exceeded = recorder.exceeded(budget)
+        if exceeded:
+            self.fail(
+                u"Query budget exceeded (value, limit): {}. Duplicated queries: {}".format(
+                    exceeded, recorder.duplicated_queries.most_common()
+                )
+            )
@@ -4,7 +4,10 @@ import logging
 
 from django.http import HttpResponse
 
+from performance import profiling
 from track.utils import DateTimeJSONEncoder
+from util.json_request import JsonResponse
+from util.views import require_global_staff
 
 
 perflog = logging.getLogger("perflog")
@@ -52,3 +55,18 @@ def performance_log(request):
     perflog.info(json.dumps(event, cls=DateTimeJSONEncoder))
 
     return HttpResponse(status=204)
+
+
+@require_global_staff
+def profiling_report(request):
+    """
+    Return the request profiles of this process, as JSON latency histograms
+    per endpoint or, with `format=folded`, as the folded stacks sampled for
+    the `endpoint` (all endpoints by default), for flame graph tools.
+    """
+    if request.GET.get('format') == 'folded':
+        return HttpResponse(
+            profiling.get_folded_stacks(request.GET.get('endpoint')),
+            content_type='text/plain; charset=utf-8',
+        )
+    return JsonResponse(profiling.get_report())
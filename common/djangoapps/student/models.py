@@ -40,6 +40,7 @@ from django.core.cache import cache
 from django_countries.fields import CountryField
 import dogstats_wrapper as dog_stats_api
 from eventtracking import tracker
+from milestones.models import UserMilestone
 from model_utils.models import TimeStampedModel
 from opaque_keys.edx.keys import CourseKey
 from opaque_keys.edx.locations import SlashSeparatedCourseKey
@@ -108,6 +109,10 @@ TRANSITION_STATES = (
 )
 
 
+# Maximum number of anonymous ids that are saved or looked up with a single query.
+ANONYMOUS_ID_BATCH_SIZE = 1000
+
+
 class AnonymousUserId(models.Model):
     """
     This table contains user, course_Id and anonymous_user_id
@@ -144,18 +149,7 @@ def anonymous_id_for_user(user, course_id, save=True):
     if cached_id is not None:
         return cached_id
 
-    # include the secret key as a salt, and to make the ids unique across different LMS installs.
-    hasher = hashlib.md5()
-    hasher.update(settings.SECRET_KEY)
-    hasher.update(unicode(user.id))
-    if course_id:
-        hasher.update(unicode(course_id).encode('utf-8'))
-    digest = hasher.hexdigest()
-
-    if not hasattr(user, '_anonymous_id'):
-        user._anonymous_id = {}  # pylint: disable=protected-access
-
-    user._anonymous_id[course_id] = digest  # pylint: disable=protected-access
+    digest = _compute_anonymous_id(user, course_id)
 
     if save is False:
         return digest
@@ -166,17 +160,7 @@ def anonymous_id_for_user(user, course_id, save=True):
             user=user,
             course_id=course_id
         )
-        if anonymous_user_id.anonymous_user_id != digest:
-            log.error(
-                u"Stored anonymous user id %(anonymous_user_id)r for "
-                u"user %(user)r in course %(course_id)r doesn't match "
-                u"computed id %(digest)r", {
-                    "anonymous_user_id": anonymous_user_id.anonymous_user_id,
-                    "user": user,
-                    "course_id": course_id,
-                    "digest": digest,
-                }
-            )
+        _check_stored_anonymous_id(anonymous_user_id.anonymous_user_id, user, course_id, digest)
     except IntegrityError:
         # Another thread has already created this entry, so
         # continue
@@ -185,6 +169,102 @@ def anonymous_id_for_user(user, course_id, save=True):
     return digest
 
 
+def anonymous_ids_for_users(users, course_id, save=True):
+    """
+    Return the unique ids of many users for a course, as returned by
+    `anonymous_id_for_user`, in a dict keyed by user id.
+
+    The ids are remembered on the given user objects, so that later calls
+    to `anonymous_id_for_user` for them don't hit the database. When `save`
+    is True, the ids are persisted with one query to find the existing
+    AnonymousUserId objects and one bulk insert of the missing ones per
+    chunk of ANONYMOUS_ID_BATCH_SIZE users.
+
+    Keyword arguments:
+    save -- Whether the ids should be saved in AnonymousUserId objects.
+    """
+    users = [user for user in users if not user.is_anonymous()]
+    anonymous_ids = {user.id: _compute_anonymous_id(user, course_id) for user in users}
+
+    if save:
+        for index in range(0, len(users), ANONYMOUS_ID_BATCH_SIZE):
+            _save_anonymous_ids(users[index:index + ANONYMOUS_ID_BATCH_SIZE], course_id, anonymous_ids)
+
+    return anonymous_ids
+
+
+def _save_anonymous_ids(users, course_id, anonymous_ids):
+    """
+    Stores the given anonymous ids of the users in a course, skipping
+    the ones that already are.
+    """
+    users_by_id = {user.id: user for user in users}
+    stored_ids = AnonymousUserId.objects.filter(
+        user_id__in=users_by_id, course_id=course_id
+    ).values_list('user_id', 'anonymous_user_id')
+    for user_id, stored_id in stored_ids:
+        _check_stored_anonymous_id(stored_id, users_by_id.pop(user_id, user_id), course_id, anonymous_ids[user_id])
+    if not users_by_id:
+        return
+
+    try:
+        with transaction.atomic():
+            AnonymousUserId.objects.bulk_create([
+                AnonymousUserId(user=user, course_id=course_id, anonymous_user_id=anonymous_ids[user.id])
+                for user in users_by_id.itervalues()
+            ])
+    except IntegrityError:
+        # Another thread has created some of these entries in the meantime,
+        # so fall back to creating the others one at a time.
+        for user in users_by_id.itervalues():
+            try:
+                AnonymousUserId.objects.get_or_create(
+                    defaults={'anonymous_user_id': anonymous_ids[user.id]},
+                    user=user,
+                    course_id=course_id
+                )
+            except IntegrityError:
+                pass
+
+
+def _compute_anonymous_id(user, course_id):
+    """
+    Computes the unique id of a (user, course) pair, and remembers it on
+    the user object.
+    """
+    # include the secret key as a salt, and to make the ids unique across different LMS installs.
+    hasher = hashlib.md5()
+    hasher.update(settings.SECRET_KEY)
+    hasher.update(unicode(user.id))
+    if course_id:
+        hasher.update(unicode(course_id).encode('utf-8'))
+    digest = hasher.hexdigest()
+
+    if not hasattr(user, '_anonymous_id'):
+        user._anonymous_id = {}  # pylint: disable=protected-access
+
+    user._anonymous_id[course_id] = digest  # pylint: disable=protected-access
+    return digest
+
+
+def _check_stored_anonymous_id(stored_id, user, course_id, digest):
+    """
+    Logs an error if the stored anonymous id of a (user, course) pair
+    doesn't match the computed one.
+    """
+    if stored_id != digest:
+        log.error(
+            u"Stored anonymous user id %(anonymous_user_id)r for "
+            u"user %(user)r in course %(course_id)r doesn't match "
+            u"computed id %(digest)r", {
+                "anonymous_user_id": stored_id,
+                "user": user,
+                "course_id": course_id,
+                "digest": digest,
+            }
+        )
+
+
 def user_by_anonymous_id(uid):
     """
     Return user by anonymous_user_id using AnonymousUserId lookup table.
@@ -203,6 +283,23 @@ def user_by_anonymous_id(uid):
         return None
 
 
+def users_by_anonymous_ids(uids):
+    """
+    Return the users with the given anonymous_user_ids, in a dict keyed by
+    anonymous_user_id, using one query per chunk of ANONYMOUS_ID_BATCH_SIZE
+    ids. Ids without a user are left out of the dict.
+    """
+    uids = list(set(uid for uid in uids if uid is not None))
+    users = {}
+    for index in range(0, len(uids), ANONYMOUS_ID_BATCH_SIZE):
+        anonymous_user_ids = AnonymousUserId.objects.filter(
+            anonymous_user_id__in=uids[index:index + ANONYMOUS_ID_BATCH_SIZE]
+        ).select_related('user')
+        for anonymous_user_id in anonymous_user_ids:
+            users[anonymous_user_id.anonymous_user_id] = anonymous_user_id.user
+    return users
+
+
 class UserStanding(models.Model):
     """
     This table contains a student's account's status.
@@ -1171,34 +1268,63 @@ class CourseEnrollment(models.Model):
         """
         Emits an event to explicitly track course enrollment and unenrollment.
         """
+        self.emit_events(event_name, [self])
+
+    @classmethod
+    def emit_events(cls, event_name, enrollments):
+        """
+        Emits an event to explicitly track the enrollment or unenrollment of
+        each of the given enrollments, which must all be in the same course.
+
+        The tracking context is only resolved once for all of them.
+        """
+        if not enrollments:
+            return
+
+        course_id = enrollments[0].course_id
+        try:
+            context = contexts.course_context_from_course_id(course_id)
+            assert isinstance(course_id, CourseKey)
+
+            with tracker.get_tracker().context(event_name, context):
+                tracking_context = None
+                if hasattr(settings, 'LMS_SEGMENT_KEY') and settings.LMS_SEGMENT_KEY:
+                    tracking_context = tracker.get_tracker().resolve_context()
 
+                for enrollment in enrollments:
+                    enrollment._emit_event(event_name, tracking_context)  # pylint: disable=protected-access
+
+        except:  # pylint: disable=bare-except
+            if event_name and course_id:
+                log.exception(u'Unable to emit event %s for course %s', event_name, course_id)
+
+    def _emit_event(self, event_name, tracking_context):
+        """
+        Emits the event of this enrollment within its course's tracking
+        context, and sends it to Segment if a tracking_context is given.
+        """
         try:
-            context = contexts.course_context_from_course_id(self.course_id)
-            assert isinstance(self.course_id, CourseKey)
             data = {
                 'user_id': self.user.id,
                 'course_id': self.course_id.to_deprecated_string(),
                 'mode': self.mode,
             }
-
-            with tracker.get_tracker().context(event_name, context):
-                tracker.emit(event_name, data)
-
-                if hasattr(settings, 'LMS_SEGMENT_KEY') and settings.LMS_SEGMENT_KEY:
-                    tracking_context = tracker.get_tracker().resolve_context()
-                    analytics.track(self.user_id, event_name, {
-                        'category': 'conversion',
-                        'label': self.course_id.to_deprecated_string(),
-                        'org': self.course_id.org,
-                        'course': self.course_id.course,
-                        'run': self.course_id.run,
-                        'mode': self.mode,
-                    }, context={
-                        'ip': tracking_context.get('ip'),
-                        'Google Analytics': {
-                            'clientId': tracking_context.get('client_id')
-                        }
-                    })
+            tracker.emit(event_name, data)
+
+            if tracking_context is not None:
+                analytics.track(self.user_id, event_name, {
+                    'category': 'conversion',
+                    'label': self.course_id.to_deprecated_string(),
+                    'org': self.course_id.org,
+                    'course': self.course_id.course,
+                    'run': self.course_id.run,
+                    'mode': self.mode,
+                }, context={
+                    'ip': tracking_context.get('ip'),
+                    'Google Analytics': {
+                        'clientId': tracking_context.get('client_id')
+                    }
+                })
 
         except:  # pylint: disable=bare-except
             if event_name and self.course_id:
@@ -1291,6 +1417,92 @@ class CourseEnrollment(models.Model):
 
         return enrollment
 
+    @classmethod
+    def bulk_enroll(cls, users, course_key, mode):
+        """
+        Enroll several users in a course in the given mode, using a few
+        set-based queries instead of calling enroll() for each of them. This
+        saves immediately.
+
+        Users who are already actively enrolled in the mode are left as they
+        are. Unlike enroll(), this does not check that the users may enroll,
+        and the post_save signal handlers of the created and changed
+        enrollments run in a background task, as do the enrollment badges.
+
+        `users` is a list of saved Django User objects.
+
+        `course_key` is the CourseKey of the course.
+
+        `mode` is the slug of the enrollment mode, which is expected to
+               have been validated by the caller.
+
+        Returns the list of the created and changed CourseEnrollment objects.
+        Note that, depending on the database, the created ones may not have
+        their primary key set.
+
+        Raises IntegrityError, and enrolls none of the users, if some of them
+        were enrolled in the course concurrently.
+        """
+        # To avoid circular imports.
+        from student.tasks import send_bulk_enrollment_signals
+
+        users_by_id = {user.id: user for user in users}
+        existing_enrollments = cls.objects.filter(course_id=course_key, user_id__in=users_by_id.keys())
+        existing_user_ids = set()
+        changed_enrollments = []
+        for enrollment in existing_enrollments:
+            existing_user_ids.add(enrollment.user_id)
+            if not enrollment.is_active or enrollment.mode != mode:
+                enrollment.user = users_by_id[enrollment.user_id]
+                changed_enrollments.append(enrollment)
+
+        created_enrollments = [
+            cls(user=user, course_id=course_key, mode=mode, is_active=True)
+            for user_id, user in users_by_id.iteritems()
+            if user_id not in existing_user_ids
+        ]
+        activated_enrollments = [enrollment for enrollment in changed_enrollments if not enrollment.is_active]
+        mode_changed_enrollments = [enrollment for enrollment in changed_enrollments if enrollment.mode != mode]
+        old_modes = [(enrollment.user_id, enrollment.mode) for enrollment in changed_enrollments]
+
+        with transaction.atomic():
+            cls.objects.bulk_create(created_enrollments)
+            if changed_enrollments:
+                cls.objects.filter(pk__in=[enrollment.pk for enrollment in changed_enrollments]).update(
+                    is_active=True,
+                    mode=mode,
+                )
+        for enrollment in changed_enrollments:
+            enrollment.is_active = True
+            enrollment.mode = mode
+
+        enrollments = created_enrollments + changed_enrollments
+        if not enrollments:
+            return enrollments
+
+        cache.delete_many(
+            [cls.cache_key_name(enrollment.user_id, unicode(course_key)) for enrollment in enrollments] +
+            [COURSE_ACCESS_DECISIONS_CACHE_KEY.format(user_id=enrollment.user_id) for enrollment in enrollments]
+        )
+
+        cls.emit_events(EVENT_NAME_ENROLLMENT_ACTIVATED, created_enrollments + activated_enrollments)
+        cls.emit_events(EVENT_NAME_ENROLLMENT_MODE_CHANGED, mode_changed_enrollments)
+        dog_stats_api.increment(
+            "common.student.enrollment",
+            len(created_enrollments) + len(activated_enrollments),
+            tags=[u"org:{}".format(course_key.org),
+                  u"offering:{}".format(course_key.offering),
+                  u"mode:{}".format(mode)]
+        )
+
+        send_bulk_enrollment_signals.delay(
+            unicode(course_key),
+            [enrollment.user_id for enrollment in created_enrollments],
+            old_modes,
+        )
+
+        return enrollments
+
     @classmethod
     def enroll_by_email(cls, email, course_id, mode=None, ignore_errors=True):
         """
@@ -1446,11 +1658,30 @@ class CourseEnrollment(models.Model):
     def enrollments_for_user(cls, user):
         return cls.objects.filter(user=user, is_active=1)
 
-    def is_paid_course(self):
+    @classmethod
+    def prefetch_course_overviews(cls, enrollments):
+        """
+        Loads the CourseOverviews of the given enrollments in bulk, so that
+        accessing their course_overview property doesn't query them one at a
+        time. Enrollments whose overview hasn't been generated yet still load
+        it on access.
+
+        Arguments:
+            enrollments (list of CourseEnrollment): The enrollments.
+        """
+        course_overviews = CourseOverview.get_from_ids(enrollment.course_id for enrollment in enrollments)
+        for enrollment in enrollments:
+            enrollment._course_overview = course_overviews.get(enrollment.course_id)  # pylint: disable=protected-access
+
+    def is_paid_course(self, modes_dict=None):
         """
         Returns True, if course is paid
+
+        Keyword Args:
+            modes_dict (dict): If provided, use these course modes.
+                Useful for avoiding unnecessary database queries.
         """
-        paid_course = CourseMode.is_white_label(self.course_id)
+        paid_course = CourseMode.is_white_label(self.course_id, modes_dict=modes_dict)
         if paid_course or CourseMode.is_professional_slug(self.mode):
             return True
 
@@ -1733,6 +1964,22 @@ class CourseAccessRole(models.Model):
         return "[CourseAccessRole] user: {}   role: {}   org: {}   course: {}".format(self.user.username, self.role, self.org, self.course_id)
 
 
+# The decisions about the access of a user to courses are cached under this
+# key by courseware.access_cache.
+COURSE_ACCESS_DECISIONS_CACHE_KEY = u"courseware.access_decisions.{user_id}"
+
+
+@receiver(models.signals.post_save, sender=CourseEnrollment)
+@receiver(models.signals.post_delete, sender=CourseEnrollment)
+@receiver(models.signals.post_save, sender=CourseAccessRole)
+@receiver(models.signals.post_delete, sender=CourseAccessRole)
+@receiver(models.signals.post_save, sender=UserMilestone)
+@receiver(models.signals.post_delete, sender=UserMilestone)
+def invalidate_course_access_decisions(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached decisions about the access of the user to courses."""
+    cache.delete(COURSE_ACCESS_DECISIONS_CACHE_KEY.format(user_id=instance.user_id))
+
+
 #### Helper methods for use from python manage.py shell and other classes.
 
 
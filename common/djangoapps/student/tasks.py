@@ -0,0 +1,53 @@
+"""
+Asynchronous tasks related to the student app.
+"""
+import logging
+
+from celery.task import task
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.signals import post_save
+from opaque_keys.edx.keys import CourseKey
+
+from lms.djangoapps.badges.utils import badges_enabled
+from student.models import CourseEnrollment
+
+log = logging.getLogger('edx.celery.task')
+
+
+@task()
+def send_bulk_enrollment_signals(course_id, created_user_ids, old_modes):
+    """
+    Runs, for the enrollments written by CourseEnrollment.bulk_enroll, what
+    saving them one at a time would have: the post_save signal handlers and
+    the enrollment badges.
+
+    Arguments:
+        course_id (unicode): The id of the course.
+        created_user_ids (list): The ids of the users whose enrollment was created.
+        old_modes (list): (user id, previous mode) pairs for the users whose
+            existing enrollment was changed.
+    """
+    old_modes = dict(old_modes)
+    enrollments = CourseEnrollment.objects.filter(
+        course_id=CourseKey.from_string(course_id),
+        user_id__in=list(created_user_ids) + old_modes.keys(),
+    ).select_related('user')
+
+    for enrollment in enrollments:
+        # Handlers compare the mode against the one set aside by the pre_save
+        # handlers, which bulk writes don't run.
+        enrollment._old_mode = old_modes.get(enrollment.user_id)  # pylint: disable=protected-access
+        post_save.send(
+            sender=CourseEnrollment,
+            instance=enrollment,
+            created=enrollment.user_id not in old_modes,
+            raw=False,
+            using=DEFAULT_DB_ALIAS,
+            update_fields=None,
+        )
+
+        if badges_enabled():
+            from lms.djangoapps.badges.events.course_meta import award_enrollment_badge
+            award_enrollment_badge(enrollment.user)
+
+    log.info(u'Sent the enrollment signals of %d users in course %s.', len(enrollments), course_id)
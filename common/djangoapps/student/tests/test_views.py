@@ -42,7 +42,7 @@ class TestStudentDashboardUnenrollments(SharedModuleStoreTestCase):
         self.cert_status = None
         self.client.login(username=self.user.username, password=PASSWORD)
 
-    def mock_cert(self, _user, _course_overview, _course_mode):
+    def mock_cert(self, _user, _course_overview, _course_mode, _cert_status=None):
         """ Return a preset certificate status. """
         if self.cert_status is not None:
             return {
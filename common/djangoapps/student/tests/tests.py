@@ -35,8 +35,8 @@ from openedx.core.djangoapps.programs.tests import factories as programs_factori
 from openedx.core.djangoapps.programs.tests.mixins import ProgramsApiConfigMixin
 import shoppingcart  # pylint: disable=import-error
 from student.models import (
-    anonymous_id_for_user, user_by_anonymous_id, CourseEnrollment,
-    unique_id_for_user, LinkedInAddToProfileConfiguration, UserAttribute
+    anonymous_id_for_user, anonymous_ids_for_users, user_by_anonymous_id, users_by_anonymous_ids,
+    AnonymousUserId, CourseEnrollment, unique_id_for_user, LinkedInAddToProfileConfiguration, UserAttribute
 )
 from student.tests.factories import UserFactory, CourseModeFactory, CourseEnrollmentFactory
 from student.views import (
@@ -891,6 +891,36 @@ class AnonymousLookupTable(ModuleStoreTestCase):
         self.assertEqual(self.user, real_user)
         self.assertEqual(anonymous_id, anonymous_id_for_user(self.user, course2.id, save=False))
 
+    def test_bulk_roundtrip(self):
+        users = [self.user] + [UserFactory() for __ in range(3)]
+        expected_ids = {
+            user.id: anonymous_id_for_user(User.objects.get(id=user.id), self.course.id, save=False)
+            for user in users
+        }
+        anonymous_id_for_user(User.objects.get(id=users[0].id), self.course.id)
+
+        # One query for the stored ids and one for the insert, wrapped in a savepoint.
+        with self.assertNumQueries(4):
+            anonymous_ids = anonymous_ids_for_users(users, self.course.id)
+        self.assertEqual(anonymous_ids, expected_ids)
+        self.assertEqual(AnonymousUserId.objects.filter(course_id=self.course.id).count(), len(users))
+
+        # The ids are remembered on the users.
+        with self.assertNumQueries(0):
+            for user in users:
+                self.assertEqual(anonymous_id_for_user(user, self.course.id), expected_ids[user.id])
+
+        with self.assertNumQueries(1):
+            real_users = users_by_anonymous_ids(expected_ids.values() + ['unknown', None])
+        self.assertEqual(real_users, {expected_ids[user.id]: user for user in users})
+
+    def test_bulk_without_saving(self):
+        users = [self.user, UserFactory(), AnonymousUser()]
+        with self.assertNumQueries(0):
+            anonymous_ids = anonymous_ids_for_users(users, None, save=False)
+        self.assertEqual(anonymous_ids, {user.id: anonymous_id_for_user(user, None) for user in users[:2]})
+        self.assertFalse(AnonymousUserId.objects.exists())
+
 
 @attr(shard=3)
 @httpretty.activate
@@ -59,7 +59,9 @@ from student.forms import AccountCreationForm, PasswordResetFormNoActive, get_re
 from lms.djangoapps.commerce.utils import EcommerceService  # pylint: disable=import-error
 from lms.djangoapps.verify_student.models import SoftwareSecurePhotoVerification  # pylint: disable=import-error
 from bulk_email.models import Optout, BulkEmailFlag  # pylint: disable=import-error
-from certificates.models import CertificateStatuses, certificate_status_for_student
+from certificates.models import (
+    CertificateStatuses, certificate_status_for_student, certificate_statuses_for_student
+)
 from certificates.api import (  # pylint: disable=import-error
     get_certificate_url,
     has_html_certificates_enabled,
@@ -206,7 +208,7 @@ def process_survey_link(survey_link, user):
     return survey_link.format(UNIQUE_ID=unique_id_for_user(user))
 
 
-def cert_info(user, course_overview, course_mode):
+def cert_info(user, course_overview, course_mode, cert_status=None):
     """
     Get the certificate info needed to render the dashboard section for the given
     student and course.
@@ -215,6 +217,9 @@ def cert_info(user, course_overview, course_mode):
         user (User): A user.
         course_overview (CourseOverview): A course.
         course_mode (str): The enrollment mode (honor, verified, audit, etc.)
+        cert_status (dict): If provided, the status of the user's certificate,
+            as returned by certificate_status_for_student.  Useful for avoiding
+            unnecessary database queries.
 
     Returns:
         dict: Empty dict if certificates are disabled or hidden, or a dictionary with keys:
@@ -229,12 +234,9 @@ def cert_info(user, course_overview, course_mode):
     """
     if not course_overview.may_certify():
         return {}
-    return _cert_info(
-        user,
-        course_overview,
-        certificate_status_for_student(user, course_overview.id),
-        course_mode
-    )
+    if cert_status is None:
+        cert_status = certificate_status_for_student(user, course_overview.id)
+    return _cert_info(user, course_overview, cert_status, course_mode)
 
 
 def reverification_info(statuses):
@@ -274,7 +276,10 @@ def get_course_enrollments(user, org_to_include, orgs_to_exclude):
         generator[CourseEnrollment]: a sequence of enrollments to be displayed
         on the user's dashboard.
     """
-    for enrollment in CourseEnrollment.enrollments_for_user(user):
+    enrollments = list(CourseEnrollment.enrollments_for_user(user))
+    CourseEnrollment.prefetch_course_overviews(enrollments)
+
+    for enrollment in enrollments:
 
         # If the course is missing or broken, log an error and skip it.
         course_overview = enrollment.course_overview
@@ -603,10 +608,21 @@ def dashboard(request):
         staff_access = True
         errored_courses = modulestore().get_errored_courses()
 
+    # get list of courses having pre-requisites yet to be completed
+    courses_having_prerequisites = frozenset(
+        enrollment.course_id for enrollment in course_enrollments
+        if enrollment.course_overview.pre_requisite_courses
+    )
+    courses_requirements_not_met = get_pre_requisite_courses_not_completed(user, courses_having_prerequisites)
+
+    # The prerequisites of all of the courses are checked at once above, rather
+    # than course by course with has_access 'view_courseware_with_prerequisites'.
     show_courseware_links_for = frozenset(
         enrollment.course_id for enrollment in course_enrollments
-        if has_access(request.user, 'load', enrollment.course_overview)
-        and has_access(request.user, 'view_courseware_with_prerequisites', enrollment.course_overview)
+        if has_access(request.user, 'load', enrollment.course_overview) and (
+            enrollment.course_id not in courses_requirements_not_met
+            or has_access(request.user, 'staff', enrollment.course_overview)
+        )
     )
 
     # Find programs associated with courses being displayed. This information
@@ -641,8 +657,16 @@ def dashboard(request):
     # If a course is not included in this dictionary,
     # there is no verification messaging to display.
     verify_status_by_course = check_verify_status_by_course(user, course_enrollments)
+    certificate_statuses_by_course = certificate_statuses_for_student(
+        user, enrolled_course_ids, course_modes=unexpired_course_modes
+    )
     cert_statuses = {
-        enrollment.course_id: cert_info(request.user, enrollment.course_overview, enrollment.mode)
+        enrollment.course_id: cert_info(
+            request.user,
+            enrollment.course_overview,
+            enrollment.mode,
+            certificate_statuses_by_course[enrollment.course_id]
+        )
         for enrollment in course_enrollments
     }
 
@@ -666,21 +690,29 @@ def dashboard(request):
         if enrollment.refundable()
     )
 
+    # Load the registration codes redeemed by the user in all of the courses at once
+    redeemed_registration_codes = defaultdict(list)
+    for registration_code in CourseRegistrationCode.objects.filter(
+            course_id__in=enrolled_course_ids,
+            registrationcoderedemption__redeemed_by=request.user
+    ).select_related('invoice_item__invoice'):
+        redeemed_registration_codes[registration_code.course_id].append(registration_code)
+
     block_courses = frozenset(
         enrollment.course_id for enrollment in course_enrollments
         if is_course_blocked(
             request,
-            CourseRegistrationCode.objects.filter(
-                course_id=enrollment.course_id,
-                registrationcoderedemption__redeemed_by=request.user
-            ),
+            redeemed_registration_codes[enrollment.course_id],
             enrollment.course_id
         )
     )
 
     enrolled_courses_either_paid = frozenset(
         enrollment.course_id for enrollment in course_enrollments
-        if enrollment.is_paid_course()
+        if enrollment.is_paid_course(modes_dict={
+            slug: mode for slug, mode in course_modes_by_course[enrollment.course_id].iteritems()
+            if slug not in CourseMode.CREDIT_MODES
+        })
     )
 
     # If there are *any* denied reverifications that have not been toggled off,
@@ -690,13 +722,6 @@ def dashboard(request):
     # Populate the Order History for the side-bar.
     order_history_list = order_history(user, course_org_filter=course_org_filter, org_filter_out_set=org_filter_out_set)
 
-    # get list of courses having pre-requisites yet to be completed
-    courses_having_prerequisites = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if enrollment.course_overview.pre_requisite_courses
-    )
-    courses_requirements_not_met = get_pre_requisite_courses_not_completed(user, courses_having_prerequisites)
-
     if 'notlive' in request.GET:
         redirect_message = _("The course you are looking for does not start until {date}.").format(
             date=request.GET['notlive']
@@ -1,29 +1,121 @@
 """
 API methods related to xblock state.
+
+The current XBlock configuration is read once per process into a snapshot,
+which is replaced when an `XBlockConfiguration` or `XBlockStudioConfiguration`
+is saved or deleted: saving one deletes the version of the snapshot stored in
+the default cache, and the processes whose snapshot doesn't have the current
+version read the configuration again.
+
+The version is deleted before the transaction saving the configuration
+commits, so a process may read the configuration being replaced under a new
+version. Versions expire after XBLOCK_CONFIGURATION_VERSION_TIMEOUT seconds
+so that such snapshots are eventually replaced.
 """
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.utils.functional import cached_property
+
+from xblock_django.models import (
+    XBLOCK_CONFIGURATION_VERSION_CACHE_KEY, XBlockConfiguration, XBlockStudioConfiguration
+)
+
+# How long a version of the XBlock configuration snapshot is used, in seconds.
+XBLOCK_CONFIGURATION_VERSION_TIMEOUT = 5 * 60
+
+_SNAPSHOT = None
+
+
+class XBlockConfigurationSnapshot(object):
+    """
+    The XBlock configuration current when the snapshot version was set.
+
+    Each part of the configuration is only read when first used.
+    """
+    def __init__(self, version):
+        self.version = version
+
+    @cached_property
+    def configurations(self):
+        """
+        The current `XBlockConfiguration`s.
+        """
+        return tuple(XBlockConfiguration.objects.current_set())
+
+    @cached_property
+    def disabled_types(self):
+        """
+        The frozenset of the names of the disabled XBlock types.
+        """
+        return frozenset(block.name for block in self.configurations if not block.enabled)
+
+    @cached_property
+    def deprecated_types(self):
+        """
+        The frozenset of the names of the deprecated XBlock types.
+        """
+        return frozenset(block.name for block in self.configurations if block.deprecated)
+
+    @cached_property
+    def studio_configurations(self):
+        """
+        The current enabled `XBlockStudioConfiguration`s.
+        """
+        return tuple(XBlockStudioConfiguration.objects.current_set().filter(enabled=True))
 
-from xblock_django.models import XBlockConfiguration, XBlockStudioConfiguration
+
+def xblock_configuration():
+    """
+    Return the XBlockConfigurationSnapshot of the current XBlock configuration.
+    """
+    global _SNAPSHOT  # pylint: disable=global-statement
+
+    version = cache.get(XBLOCK_CONFIGURATION_VERSION_CACHE_KEY)
+    if version is None:
+        version = uuid4().hex
+        if not cache.add(XBLOCK_CONFIGURATION_VERSION_CACHE_KEY, version, XBLOCK_CONFIGURATION_VERSION_TIMEOUT):
+            version = cache.get(XBLOCK_CONFIGURATION_VERSION_CACHE_KEY, version)
+
+    snapshot = _SNAPSHOT
+    if snapshot is None or snapshot.version != version:
+        snapshot = _SNAPSHOT = XBlockConfigurationSnapshot(version)
+    return snapshot
 
 
 def deprecated_xblocks():
     """
-    Return the QuerySet of deprecated XBlock types. Note that this method is independent of
+    Return the list of `XBlockConfiguration`s of deprecated XBlock types. Note that this method is independent of
     `XBlockStudioConfigurationFlag` and `XBlockStudioConfiguration`.
     """
-    return XBlockConfiguration.objects.current_set().filter(deprecated=True)
+    return [block for block in xblock_configuration().configurations if block.deprecated]
 
 
 def disabled_xblocks():
     """
-    Return the QuerySet of disabled XBlock types (which should not render in the LMS).
+    Return the list of `XBlockConfiguration`s of disabled XBlock types (which should not render in the LMS).
     Note that this method is independent of `XBlockStudioConfigurationFlag` and `XBlockStudioConfiguration`.
     """
-    return XBlockConfiguration.objects.current_set().filter(enabled=False)
+    return [block for block in xblock_configuration().configurations if not block.enabled]
+
+
+def deprecated_xblock_types():
+    """
+    Return the frozenset of the names of the deprecated XBlock types.
+    """
+    return xblock_configuration().deprecated_types
+
+
+def disabled_xblock_types():
+    """
+    Return the frozenset of the names of the disabled XBlock types (which should not render in the LMS).
+    """
+    return xblock_configuration().disabled_types
 
 
 def authorable_xblocks(allow_unsupported=False, name=None):
     """
-    This method returns the QuerySet of XBlocks that can be created in Studio (by default, only fully supported
+    This method returns the list of XBlocks that can be created in Studio (by default, only fully supported
     and provisionally supported XBlocks), as stored in `XBlockStudioConfiguration`.
     Note that this method does NOT check the value `XBlockStudioConfigurationFlag`, nor does it take into account
     fully disabled xblocks (as returned by `disabled_xblocks`) or deprecated xblocks
@@ -37,15 +129,12 @@ def authorable_xblocks(allow_unsupported=False, name=None):
         name (str): If provided, filters the returned XBlocks to those with the provided name. This is
             useful for XBlocks with lots of template types.
     Returns:
-        QuerySet: Returns authorable XBlocks, taking into account `support_level`, `enabled` and `name`
+        list: Returns authorable XBlocks, taking into account `support_level`, `enabled` and `name`
         (if specified) as specified by `XBlockStudioConfiguration`. Does not take into account whether or not
         `XBlockStudioConfigurationFlag` is enabled.
     """
-    blocks = XBlockStudioConfiguration.objects.current_set().filter(enabled=True)
-    if not allow_unsupported:
-        blocks = blocks.exclude(support_level=XBlockStudioConfiguration.UNSUPPORTED)
-
-    if name:
-        blocks = blocks.filter(name=name)
-
-    return blocks
+    return [
+        block for block in xblock_configuration().studio_configurations
+        if (allow_unsupported or block.support_level != XBlockStudioConfiguration.UNSUPPORTED) and
+        (not name or block.name == name)
+    ]
@@ -2,11 +2,17 @@
 Models.
 """
 
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 
 from config_models.models import ConfigurationModel
 
+# Where the version of the XBlock configuration snapshot of xblock_django.api is cached.
+XBLOCK_CONFIGURATION_VERSION_CACHE_KEY = 'xblock_django.configuration.version'
+
 
 class XBlockConfiguration(ConfigurationModel):
     """
@@ -73,3 +79,14 @@ class XBlockStudioConfiguration(ConfigurationModel):
         return (
             "XBlockStudioConfiguration(name={}, template={}, enabled={}, support_level={})"
         ).format(self.name, self.template, self.enabled, self.support_level)
+
+
+@receiver(post_save, sender=XBlockConfiguration)
+@receiver(post_delete, sender=XBlockConfiguration)
+@receiver(post_save, sender=XBlockStudioConfiguration)
+@receiver(post_delete, sender=XBlockStudioConfiguration)
+def invalidate_xblock_configuration(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Make every process read the XBlock configuration again when it changes.
+    """
+    cache.delete(XBLOCK_CONFIGURATION_VERSION_CACHE_KEY)
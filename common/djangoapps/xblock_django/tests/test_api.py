@@ -1,8 +1,17 @@
 """
 Tests related to XBlock support API.
 """
-from xblock_django.models import XBlockConfiguration, XBlockStudioConfiguration, XBlockStudioConfigurationFlag
-from xblock_django.api import deprecated_xblocks, disabled_xblocks, authorable_xblocks
+from django.core.cache import cache
+from mock import ANY, patch
+
+from xblock_django.models import (
+    XBLOCK_CONFIGURATION_VERSION_CACHE_KEY, XBlockConfiguration, XBlockStudioConfiguration,
+    XBlockStudioConfigurationFlag
+)
+from xblock_django.api import (
+    XBLOCK_CONFIGURATION_VERSION_TIMEOUT,
+    authorable_xblocks, deprecated_xblock_types, deprecated_xblocks, disabled_xblock_types, disabled_xblocks
+)
 from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 
 
@@ -127,3 +136,51 @@ class XBlockSupportTestCase(CacheIsolationTestCase):
         verify_xblock_fields("problem", "", XBlockStudioConfiguration.FULL_SUPPORT, no_template)
         verify_xblock_fields("problem", "circuit_schematic_builder", XBlockStudioConfiguration.UNSUPPORTED, circuit)
         verify_xblock_fields("problem", "multiple_choice", XBlockStudioConfiguration.FULL_SUPPORT, multiple_choice)
+
+
+class XBlockConfigurationSnapshotTestCase(CacheIsolationTestCase):
+    """
+    Tests for the per-process snapshot of the XBlock configuration.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(XBlockConfigurationSnapshotTestCase, self).setUp()
+        XBlockConfiguration(name="poll", enabled=True, deprecated=True).save()
+        XBlockConfiguration(name="survey", enabled=False, deprecated=False).save()
+        XBlockStudioConfiguration(
+            name="done", enabled=True, support_level=XBlockStudioConfiguration.FULL_SUPPORT
+        ).save()
+
+    def test_snapshot_reused(self):
+        self.assertEqual(disabled_xblock_types(), frozenset(["survey"]))
+        with self.assertNumQueries(0):
+            self.assertEqual(disabled_xblock_types(), frozenset(["survey"]))
+            self.assertEqual(deprecated_xblock_types(), frozenset(["poll"]))
+            self.assertEqual([block.name for block in disabled_xblocks()], ["survey"])
+
+        self.assertEqual([block.name for block in authorable_xblocks()], ["done"])
+        with self.assertNumQueries(0):
+            self.assertEqual([block.name for block in authorable_xblocks()], ["done"])
+
+    def test_snapshot_invalidated_on_save(self):
+        self.assertEqual(disabled_xblock_types(), frozenset(["survey"]))
+        self.assertEqual([block.name for block in authorable_xblocks()], ["done"])
+
+        XBlockConfiguration(name="poll", enabled=False, deprecated=True).save()
+        self.assertEqual(disabled_xblock_types(), frozenset(["survey", "poll"]))
+
+        XBlockStudioConfiguration(name="done", enabled=False).save()
+        self.assertEqual(authorable_xblocks(), [])
+
+    def test_snapshot_invalidated_on_delete(self):
+        self.assertEqual(deprecated_xblock_types(), frozenset(["poll"]))
+        XBlockConfiguration.objects.filter(name="poll").delete()
+        self.assertEqual(deprecated_xblock_types(), frozenset())
+
+    def test_snapshot_version_expires(self):
+        with patch('xblock_django.api.cache.add', wraps=cache.add) as mock_add:
+            self.assertEqual(disabled_xblock_types(), frozenset(["survey"]))
+        mock_add.assert_called_once_with(
+            XBLOCK_CONFIGURATION_VERSION_CACHE_KEY, ANY, XBLOCK_CONFIGURATION_VERSION_TIMEOUT
+        )
@@ -16,9 +16,11 @@ This is used by capa_module.
 from collections import OrderedDict
 from copy import deepcopy
 from datetime import datetime
+import hashlib
 import logging
 import os.path
 import re
+import threading
 
 from lxml import etree
 from pytz import UTC
@@ -69,6 +71,74 @@ html_problem_semantics = [
 
 log = logging.getLogger(__name__)
 
+# Maximum number of parsed problem templates kept by each process.
+PROBLEM_TEMPLATE_CACHE_MAX_ENTRIES = 1000
+
+
+class ProblemTemplate(object):
+    """
+    The seed-independent part of a LoncapaProblem: its XML tree, parsed and
+    with includes resolved, ids assigned and a11y data extracted, along with
+    that a11y data.
+
+    Templates are shared between problems and must never be modified; each
+    problem works on its own copy of the tree.
+    """
+    def __init__(self, tree, problem_data):
+        self.tree = tree
+        self.problem_data = problem_data
+
+
+class ProblemTemplateCache(object):
+    """
+    Process-wide LRU cache of ProblemTemplates, keyed by problem id and a
+    digest of the problem's xml, so that every learner of a problem shares
+    the same parsed template.
+    """
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(problem_id, problem_text):
+        """
+        Returns the cache key for the problem `problem_id` defined by `problem_text`.
+        """
+        if isinstance(problem_text, unicode):
+            problem_text = problem_text.encode('utf-8')
+        return (problem_id, hashlib.sha1(problem_text).hexdigest())
+
+    def get(self, key):
+        """
+        Returns the template cached for `key`, or None, marking the entry as most recently used.
+        """
+        with self._lock:
+            template = self._entries.pop(key, None)
+            if template is not None:
+                self._entries[key] = template
+            return template
+
+    def set(self, key, template):
+        """
+        Caches `template` under `key`, evicting the least recently used entry if needed.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_entries:
+                self._entries.popitem(last=False)
+            self._entries[key] = template
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+problem_template_cache = ProblemTemplateCache(PROBLEM_TEMPLATE_CACHE_MAX_ENTRIES)
+
 #-----------------------------------------------------------------------------
 # main class for this module
 
@@ -172,22 +242,19 @@ class LoncapaProblem(object):
         problem_text = re.sub(r"endouttext\s*/", "/text", problem_text)
         self.problem_text = problem_text
 
-        # parse problem XML file into an element tree
-        self.tree = etree.XML(problem_text)
-
-        self.make_xml_compatible(self.tree)
-
-        # handle any <include file="foo"> tags
-        self._process_includes()
+        # Parsing and preprocessing the XML doesn't depend on the seed, so it is
+        # done once per problem and shared; each problem works on a copy of it.
+        template = self._get_template(problem_text)
+        self.tree = deepcopy(template.tree)
+        self.problem_data = deepcopy(template.problem_data)
 
         # construct script processor context (eg for customresponse problems)
         self.context = self._extract_context(self.tree)
 
-        # Pre-parse the XML tree: modifies it to add ID's and perform some in-place
-        # transformations.  This also creates the dict (self.responders) of Response
-        # instances for each question in the problem. The dict has keys = xml subtree of
-        # Response, values = Response instance
-        self.problem_data = self._preprocess_problem(self.tree)
+        # This creates the dict (self.responders) of Response instances for each
+        # question in the problem. The dict has keys = xml subtree of Response,
+        # values = Response instance
+        self._preprocess_problem(self.tree)
 
         if not self.student_answers:  # True when student_answers is an empty dict
             self.set_initial_display()
@@ -587,12 +654,40 @@ class LoncapaProblem(object):
 
     # ======= Private Methods Below ========
 
-    def _process_includes(self):
+    def _get_template(self, problem_text):
+        """
+        Returns the ProblemTemplate of this problem, building and caching it if needed.
+
+        Problems that include files aren't cached, since the included files
+        can change without the problem text changing.
+        """
+        key = ProblemTemplateCache.make_key(self.problem_id, problem_text)
+        template = problem_template_cache.get(key)
+        if template is None:
+            # parse problem XML file into an element tree
+            tree = etree.XML(problem_text)
+
+            self.make_xml_compatible(tree)
+
+            # handle any <include file="foo"> tags
+            has_includes = tree.find('.//include') is not None
+            self._process_includes(tree)
+
+            # Pre-parse the XML tree: modifies it to add ID's and perform some in-place
+            # transformations.
+            problem_data = self._preprocess_template(tree)
+
+            template = ProblemTemplate(tree, problem_data)
+            if not has_includes:
+                problem_template_cache.set(key, template)
+        return template
+
+    def _process_includes(self, tree):
         """
         Handle any <include file="foo"> tags by reading in the specified file and inserting it
         into our XML tree.  Fail gracefully if debugging.
         """
-        includes = self.tree.findall('.//include')
+        includes = tree.findall('.//include')
         for inc in includes:
             filename = inc.get('file')
             if filename is not None:
@@ -838,20 +933,17 @@ class LoncapaProblem(object):
 
         return tree
 
-    def _preprocess_problem(self, tree):  # private
+    def _preprocess_template(self, tree):  # private
         """
         Assign IDs to all the responses
         Assign sub-IDs to all entries (textline, schematic, etc.)
-        Annoted correctness and value
+        Extract a11y data of the responses
         In-place transformation
 
-        Also create capa Response instances for each responsetype and save as self.responders
-
-        Obtain all responder answers and save as self.responder_answers dict (key = response)
+        Returns the a11y data, keyed by input id.
         """
         response_id = 1
         problem_data = {}
-        self.responders = {}
         for response in tree.xpath('//' + "|//".join(responsetypes.registry.registered_tags())):
             responsetype_id = self.problem_id + "_" + str(response_id)
             # create and save ID for this response
@@ -859,11 +951,7 @@ class LoncapaProblem(object):
             response_id += 1
 
             answer_id = 1
-            input_tags = inputtypes.registry.registered_tags()
-            inputfields = tree.xpath(
-                "|".join(['//' + response.tag + '[@id=$id]//' + x for x in input_tags]),
-                id=responsetype_id
-            )
+            inputfields = self._get_inputfields(tree, response)
 
             # assign one answer_id for each input type
             for entry in inputfields:
@@ -874,6 +962,38 @@ class LoncapaProblem(object):
 
             self.response_a11y_data(response, inputfields, responsetype_id, problem_data)
 
+        # <solution>...</solution> may not be associated with any specific response; give
+        # IDs for those separately
+        # TODO: We should make the namespaces consistent and unique (e.g. %s_problem_%i).
+        solution_id = 1
+        for solution in tree.findall('.//solution'):
+            solution.attrib['id'] = "%s_solution_%i" % (self.problem_id, solution_id)
+            solution_id += 1
+
+        return problem_data
+
+    def _get_inputfields(self, tree, response):  # private
+        """
+        Returns the input fields of `response`, once it has been assigned an ID.
+        """
+        input_tags = inputtypes.registry.registered_tags()
+        return tree.xpath(
+            "|".join(['//' + response.tag + '[@id=$id]//' + x for x in input_tags]),
+            id=response.get('id')
+        )
+
+    def _preprocess_problem(self, tree):  # private
+        """
+        Create capa Response instances for each responsetype and save as self.responders
+
+        Obtain all responder answers and save as self.responder_answers dict (key = response)
+
+        Expects the tree to have been preprocessed by _preprocess_template.
+        """
+        self.responders = {}
+        for response in tree.xpath('//' + "|//".join(responsetypes.registry.registered_tags())):
+            inputfields = self._get_inputfields(tree, response)
+
             # instantiate capa Response
             responsetype_cls = responsetypes.registry.get_class_for_tag(response.tag)
             responder = responsetype_cls(response, inputfields, self.context, self.capa_system, self.capa_module)
@@ -891,16 +1011,6 @@ class LoncapaProblem(object):
                           self.responders[response])  # FIXME
                 raise
 
-        # <solution>...</solution> may not be associated with any specific response; give
-        # IDs for those separately
-        # TODO: We should make the namespaces consistent and unique (e.g. %s_problem_%i).
-        solution_id = 1
-        for solution in tree.findall('.//solution'):
-            solution.attrib['id'] = "%s_solution_%i" % (self.problem_id, solution_id)
-            solution_id += 1
-
-        return problem_data
-
     def response_a11y_data(self, response, inputfields, responsetype_id, problem_data):
         """
         Construct data to be used for a11y.
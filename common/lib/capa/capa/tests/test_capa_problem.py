@@ -4,8 +4,10 @@ Test capa problem.
 import ddt
 import textwrap
 from lxml import etree
+from mock import patch
 import unittest
 
+from capa.capa_problem import LoncapaProblem, problem_template_cache
 from . import new_loncapa_problem
 
 
@@ -507,3 +509,58 @@ class CAPAMultiInputProblemTest(unittest.TestCase):
         """.format(group_label, input1_label, input2_label, inputtype=inputtype))
         problem = self.capa_problem(xml)
         self.assert_problem_html(problem.get_html(), group_label, input1_label, input2_label)
+
+
+class ProblemTemplateCacheTest(unittest.TestCase):
+    """ Tests for sharing parsed problem templates between problems """
+
+    xml = textwrap.dedent("""
+    <problem>
+        <script type="loncapa/python">
+    answer = str(random.randint(0, 1000))
+        </script>
+        <stringresponse answer="$answer">
+            <label>Enter the number</label>
+            <textline size="20"/>
+        </stringresponse>
+        <solution><p>It is $answer.</p></solution>
+    </problem>
+    """)
+
+    def setUp(self):
+        super(ProblemTemplateCacheTest, self).setUp()
+        problem_template_cache.clear()
+        self.addCleanup(problem_template_cache.clear)
+
+    def new_problems(self, xml, *seeds):
+        """
+        Returns problems created from `xml` with each of `seeds`, along with the number of templates built.
+        """
+        with patch.object(
+            LoncapaProblem, '_preprocess_template', autospec=True, side_effect=LoncapaProblem._preprocess_template
+        ) as mock_preprocess:
+            problems = [new_loncapa_problem(xml, seed=seed) for seed in seeds]
+        return problems, mock_preprocess.call_count
+
+    def test_template_is_shared_between_seeds(self):
+        (first, second), call_count = self.new_problems(self.xml, 1, 2)
+        self.assertEqual(call_count, 1)
+        self.assertNotEqual(first.context['answer'], second.context['answer'])
+        self.assertEqual(first.get_question_answers()['1_2_1'], first.context['answer'])
+        self.assertEqual(second.get_question_answers()['1_2_1'], second.context['answer'])
+        self.assertEqual(first.problem_data, second.problem_data)
+
+    def test_problems_get_their_own_tree(self):
+        (first, second), __ = self.new_problems(self.xml, 1, 1)
+        self.assertIsNot(first.tree, second.tree)
+        first.tree.find('.//stringresponse').set('answer', 'changed')
+        self.assertEqual(second.tree.find('.//stringresponse').get('answer'), '$answer')
+
+    def test_problems_with_includes_are_not_cached(self):
+        xml = """
+        <problem>
+            <include file="snuggletex_correct.html"/>
+        </problem>
+        """
+        __, call_count = self.new_problems(xml, 1, 2)
+        self.assertEqual(call_count, 2)
@@ -26,6 +26,7 @@ from xmodule.exceptions import NotFoundError
 from xblock.fields import Scope, String, Boolean, Dict, Integer, Float
 from .fields import Timedelta, Date
 from django.utils.timezone import UTC
+from django.utils.translation import get_language
 from xmodule.capa_base_constants import RANDOMIZATION, SHOWANSWER
 from django.conf import settings
 
@@ -40,6 +41,9 @@ NUM_RANDOMIZATION_BINS = 20
 # Never produce more than this many different seeds, no matter what.
 MAX_RANDOMIZATION_BINS = 1000
 
+# How long, in seconds, rendered problem html is cached for.
+PROBLEM_HTML_CACHE_TIMEOUT = 60 * 60
+
 
 def randomization_bin(seed, problem_id):
     """
@@ -637,15 +641,7 @@ class CapaMixin(CapaFields):
         and state.
         encapsulate: if True (the default) embed the html in a problem <div>
         """
-        try:
-            html = self.lcp.get_html()
-
-        # If we cannot construct the problem HTML,
-        # then generate an error message instead.
-        except Exception as err:  # pylint: disable=broad-except
-            html = self.handle_problem_html_error(err)
-
-        html = self.remove_tags_from_html(html)
+        html = self.get_lcp_html()
 
         # The convention is to pass the name of the check button if we want
         # to show a check button, and False otherwise This works because
@@ -699,6 +695,56 @@ class CapaMixin(CapaFields):
 
         return html
 
+    def get_lcp_html(self):
+        """
+        Return the html of the capa problem itself, without the buttons and
+        other per-user content that surrounds it.
+
+        The html only depends on the problem definition, its seed and the
+        learner's answers, so it is cached and shared by every learner in the
+        same state, e.g. everyone that hasn't attempted the problem yet.
+        """
+        cache_key = self.lcp_html_cache_key()
+        html = self.runtime.cache.get(cache_key) if cache_key else None
+        if html is not None:
+            return html
+
+        try:
+            html = self.lcp.get_html()
+
+        # If we cannot construct the problem HTML,
+        # then generate an error message instead.
+        except Exception as err:  # pylint: disable=broad-except
+            return self.remove_tags_from_html(self.handle_problem_html_error(err))
+
+        html = self.remove_tags_from_html(html)
+        if cache_key:
+            self.runtime.cache.set(cache_key, html, PROBLEM_HTML_CACHE_TIMEOUT)
+        return html
+
+    def lcp_html_cache_key(self):
+        """
+        Return the key the html of self.lcp is cached under, or None if it can't be cached.
+
+        The key covers the problem definition, the seed and the state of the
+        learner's answers, along with the language the problem is rendered in.
+        """
+        # The anonymous student id is available to problem scripts and
+        # templates, which makes the html of such problems specific to a learner.
+        if 'anonymous_student_id' in self.lcp.problem_text:
+            return None
+
+        try:
+            key_data = json.dumps(
+                [self.lcp.problem_id, self.lcp.problem_text, get_language(), self.lcp.get_state()],
+                sort_keys=True,
+                cls=ComplexEncoder,
+            )
+        except TypeError:
+            # Some input types keep state that can't be serialized.
+            return None
+        return u'capa.problem_html.{}'.format(hashlib.sha1(key_data).hexdigest())
+
     def remove_tags_from_html(self, html):
         """
         The capa xml includes many tags such as <additional_answer> or <demandhint> which are not
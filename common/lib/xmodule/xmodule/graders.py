@@ -12,12 +12,20 @@ import sys
 
 from collections import namedtuple
 
+import numpy
+
 log = logging.getLogger("edx.courseware")
 
 # This is a tuple for holding scores, either from problems or sections.
 # Section either indicates the name of the problem or the name of the section
 Score = namedtuple("Score", "earned possible graded section module_id")
 
+# This is a tuple for holding the scores of several students in the sections of
+# a format, for grading them all at once with CourseGrader.grade_batch.
+# earned and possible are 2-D arrays with a row per student and a column per
+# section, and sections is the list of the names of the sections.
+BatchScores = namedtuple("BatchScores", "earned possible sections")
+
 
 def float_sum(iterable):
     """
@@ -163,6 +171,36 @@ class CourseGrader(object):
         '''Given a grade sheet, return a dict containing grading information'''
         raise NotImplementedError
 
+    def grade_batch(self, grade_sheet, num_students):
+        """
+        Grades several students at once, evaluating the grading policy on all
+        of their scores together with array operations.
+
+        The grade_sheet is keyed by section format, like the one grade() takes,
+        but its values are BatchScores holding the scores of all the students
+        in every section of that format. Every student must have a score for
+        each of these sections, with a positive possible score; sections that
+        a student hasn't started can be given an earned score of 0.
+
+        Returns a list with, for each student, the dictionary grade() would
+        return for their scores.
+        """
+        return self._grade_batch(grade_sheet, num_students, include_breakdowns=True)[1]
+
+    def percent_batch(self, grade_sheet, num_students):
+        """
+        Like grade_batch, but only returns an array of the final percentages
+        of the students, which skips building their breakdowns.
+        """
+        return self._grade_batch(grade_sheet, num_students, include_breakdowns=False)[0]
+
+    def _grade_batch(self, grade_sheet, num_students, include_breakdowns):
+        """
+        Returns a tuple of the array of the percentages of the students and,
+        if include_breakdowns is True, the list of their grade() results.
+        """
+        raise NotImplementedError
+
 
 class WeightedSubsectionsGrader(CourseGrader):
     """
@@ -202,6 +240,36 @@ class WeightedSubsectionsGrader(CourseGrader):
                 'section_breakdown': section_breakdown,
                 'grade_breakdown': grade_breakdown}
 
+    def _grade_batch(self, grade_sheet, num_students, include_breakdowns):
+        total_percents = numpy.zeros(num_students)
+        results = [
+            {'percent': 0.0, 'section_breakdown': [], 'grade_breakdown': []}
+            for __ in range(num_students)
+        ] if include_breakdowns else None
+
+        for subgrader, category, weight in self.sections:
+            subgrade_percents, subgrade_results = subgrader._grade_batch(  # pylint: disable=protected-access
+                grade_sheet, num_students, include_breakdowns
+            )
+
+            weighted_percents = subgrade_percents * weight
+            total_percents += weighted_percents
+
+            if include_breakdowns:
+                for result, subgrade_result, weighted_percent in zip(results, subgrade_results, weighted_percents):
+                    weighted_percent = float(weighted_percent)
+                    section_detail = u"{0} = {1:.2%} of a possible {2:.2%}".format(category, weighted_percent, weight)
+
+                    result['section_breakdown'] += subgrade_result['section_breakdown']
+                    result['grade_breakdown'].append(
+                        {'percent': weighted_percent, 'detail': section_detail, 'category': category}
+                    )
+
+        if include_breakdowns:
+            for result, total_percent in zip(results, total_percents):
+                result['percent'] = float(total_percent)
+        return total_percents, results
+
 
 class SingleSectionGrader(CourseGrader):
     """
@@ -232,16 +300,39 @@ class SingleSectionGrader(CourseGrader):
                 earned = found_score.earned
                 possible = found_score.possible
 
-            percent = earned / possible
+            return self._result(earned / possible, earned, possible)
+
+        return self._result(0.0)
+
+    def _grade_batch(self, grade_sheet, num_students, include_breakdowns):
+        scores = grade_sheet.get(self.type)
+        if scores is None or self.name not in scores.sections:
+            percents = numpy.zeros(num_students)
+            return percents, [self._result(0.0) for __ in range(num_students)] if include_breakdowns else None
+
+        index = list(scores.sections).index(self.name)
+        earned = numpy.asarray(scores.earned, dtype=float)[:, index]
+        possible = numpy.asarray(scores.possible, dtype=float)[:, index]
+        percents = earned / possible
+        results = [
+            self._result(float(percent), earned[student], possible[student])
+            for student, percent in enumerate(percents)
+        ] if include_breakdowns else None
+        return percents, results
+
+    def _result(self, percent, earned=None, possible=None):
+        """
+        Returns the grade() result for the given percentage and, if the
+        section was found, its earned and possible scores.
+        """
+        if earned is not None:
             detail = u"{name} - {percent:.0%} ({earned:.3n}/{possible:.3n})".format(
                 name=self.name,
                 percent=percent,
                 earned=float(earned),
                 possible=float(possible)
             )
-
         else:
-            percent = 0.0
             detail = u"{name} - 0% (?/?)".format(name=self.name)
 
         breakdown = [{'percent': percent, 'label': self.short_label,
@@ -331,7 +422,7 @@ class AssignmentFormatGrader(CourseGrader):
 
         #Figure the homework scores
         scores = grade_sheet.get(self.type, [])
-        breakdown = []
+        sections = []
         for i in range(max(self.min_count, len(scores))):
             if i < len(scores) or generate_random_scores:
                 if generate_random_scores:  	# for debugging!
@@ -344,7 +435,70 @@ class AssignmentFormatGrader(CourseGrader):
                     possible = scores[i].possible
                     section_name = scores[i].section
 
-                percentage = earned / possible
+                sections.append((earned / possible, section_name, earned, possible))
+            else:
+                sections.append(None)
+
+        breakdown = self._section_breakdown(sections)
+        total_percent, dropped_indices = total_with_drops(breakdown, self.drop_count)
+        return self._result(breakdown, total_percent, dropped_indices)
+
+    def _grade_batch(self, grade_sheet, num_students, include_breakdowns):
+        scores = grade_sheet.get(self.type)
+        num_scores = len(scores.sections) if scores is not None else 0
+        num_sections = max(self.min_count, num_scores)
+
+        # The percentages of the students in each section, with 0 for the
+        # sections that haven't been released yet.
+        percents = numpy.zeros((num_students, num_sections))
+        if num_scores:
+            earned = numpy.asarray(scores.earned, dtype=float)
+            possible = numpy.asarray(scores.possible, dtype=float)
+            percents[:, :num_scores] = earned / possible
+
+        dropped = numpy.zeros((num_students, num_sections), dtype=bool)
+        if self.drop_count > 0 and num_sections:
+            # A stable sort on the negated percentages drops the same sections
+            # as grade() does when several have the same percentage.
+            order = numpy.argsort(-percents, axis=1, kind='mergesort')
+            dropped[numpy.arange(num_students)[:, numpy.newaxis], order[:, -self.drop_count:]] = True
+
+        # Sum the sections one at a time, in the same order as grade(), so that
+        # the totals are exactly the same.
+        total_percents = numpy.zeros(num_students)
+        for index in range(num_sections):
+            total_percents += numpy.where(dropped[:, index], 0.0, percents[:, index])
+        if num_sections - self.drop_count > 0:
+            total_percents /= num_sections - self.drop_count
+
+        results = None
+        if include_breakdowns:
+            section_names = list(scores.sections) if num_scores else []
+            results = []
+            for student in range(num_students):
+                sections = [
+                    (float(percents[student, index]), section_names[index], earned[student, index],
+                     possible[student, index])
+                    if index < num_scores else None
+                    for index in range(num_sections)
+                ]
+                results.append(self._result(
+                    self._section_breakdown(sections),
+                    float(total_percents[student]),
+                    numpy.flatnonzero(dropped[student]).tolist(),
+                ))
+        return total_percents, results
+
+    def _section_breakdown(self, sections):
+        """
+        Returns the breakdown of the given sections, which are tuples of their
+        percentage, name, earned and possible scores, or None for the sections
+        that haven't been released yet.
+        """
+        breakdown = []
+        for i, section in enumerate(sections):
+            if section is not None:
+                percentage, section_name, earned, possible = section
                 summary_format = u"{section_type} {index} - {name} - {percent:.0%} ({earned:.3n}/{possible:.3n})"
                 summary = summary_format.format(
                     index=i + self.starting_index,
@@ -368,9 +522,13 @@ class AssignmentFormatGrader(CourseGrader):
 
             breakdown.append({'percent': percentage, 'label': short_label,
                               'detail': summary, 'category': self.category})
+        return breakdown
 
-        total_percent, dropped_indices = total_with_drops(breakdown, self.drop_count)
-
+    def _result(self, breakdown, total_percent, dropped_indices):
+        """
+        Returns the grade() result for the given section breakdown, total
+        percentage and indices of the dropped sections.
+        """
         for dropped_index in dropped_indices:
             breakdown[dropped_index]['mark'] = {
                 'detail': u"The lowest {drop_count} {section_type} scores are dropped.".format(
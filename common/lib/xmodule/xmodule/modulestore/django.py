@@ -49,9 +49,9 @@ except ImportError:
     HAS_USER_SERVICE = False
 
 try:
-    from xblock_django.api import disabled_xblocks
+    from xblock_django.api import disabled_xblock_types
 except ImportError:
-    disabled_xblocks = None
+    disabled_xblock_types = None
 
 log = logging.getLogger(__name__)
 ASSET_IGNORE_REGEX = getattr(settings, "ASSET_IGNORE_REGEX", r"(^\._.*$)|(^\.DS_Store$)|(^.*~$)")
@@ -192,21 +192,19 @@ def create_modulestore_instance(
 
     def fetch_disabled_xblock_types():
         """
-        Get the disabled xblock names, using the request_cache if possible to avoid hitting
-        a database every time the list is needed.
+        Get the frozenset of disabled xblock names, using the request_cache if possible to avoid
+        checking the version of the XBlock configuration every time the set is needed.
         """
-        # If the import could not be loaded, return an empty list.
-        if disabled_xblocks is None:
-            return []
+        # If the import could not be loaded, return an empty set.
+        if disabled_xblock_types is None:
+            return frozenset()
 
         if request_cache:
             if 'disabled_xblock_types' not in request_cache.data:
-                request_cache.data['disabled_xblock_types'] = [block.name for block in disabled_xblocks()]
+                request_cache.data['disabled_xblock_types'] = disabled_xblock_types()
             return request_cache.data['disabled_xblock_types']
-        else:
-            disabled_xblock_types = [block.name for block in disabled_xblocks()]
 
-        return disabled_xblock_types
+        return disabled_xblock_types()
 
     return class_(
         contentstore=content_store,
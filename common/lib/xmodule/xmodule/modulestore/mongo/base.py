@@ -66,9 +66,22 @@ SORT_REVISION_FAVOR_DRAFT = ('_id.revision', pymongo.DESCENDING)
 # sort order that returns PUBLISHED items first
 SORT_REVISION_FAVOR_PUBLISHED = ('_id.revision', pymongo.ASCENDING)
 
-BLOCK_TYPES_WITH_CHILDREN = list(set(
-    name for name, class_ in XBlock.load_classes() if getattr(class_, 'has_children', False)
-))
+_BLOCK_TYPES_WITH_CHILDREN = None
+
+
+def block_types_with_children():
+    """
+    Return the list of the XBlock types that can have children.
+
+    Loading every XBlock class is slow, so it is only done when the list is first needed
+    rather than when this module is imported.
+    """
+    global _BLOCK_TYPES_WITH_CHILDREN  # pylint: disable=global-statement
+    if _BLOCK_TYPES_WITH_CHILDREN is None:
+        _BLOCK_TYPES_WITH_CHILDREN = list(set(
+            name for name, class_ in XBlock.load_classes() if getattr(class_, 'has_children', False)
+        ))
+    return _BLOCK_TYPES_WITH_CHILDREN
 
 # Allow us to call _from_deprecated_(son|string) throughout the file
 # pylint: disable=protected-access
@@ -694,7 +707,7 @@ class MongoModuleStore(ModuleStoreDraftAndPublished, ModuleStoreWriteBase, Mongo
             ('_id.tag', 'i4x'),
             ('_id.org', course_id.org),
             ('_id.course', course_id.course),
-            ('_id.category', {'$in': BLOCK_TYPES_WITH_CHILDREN})
+            ('_id.category', {'$in': block_types_with_children()})
         ])
         # if we're only dealing in the published branch, then only get published containers
         if self.get_branch_setting() == ModuleStoreEnum.Branch.published_only:
@@ -113,6 +113,16 @@ class QueryTimer(object):
         """
         self._metric_base = metric_base
         self._sample_rate = sample_rate
+        self._listeners = []
+
+    def add_listener(self, listener):
+        """
+        Call ``listener(metric_name, duration)`` at the end of each block timed
+        by this :class:`QueryTimer`, with the ``metric_name`` given to :meth:`timer`
+        and the duration of the block in seconds.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
 
     @contextmanager
     def timer(self, metric_name, course_context):
@@ -128,6 +138,7 @@ class QueryTimer(object):
             course_context: The course which the query is being made for.
         """
         tagger = Tagger(self._sample_rate)
+        operation = metric_name
         metric_name = "{}.{}".format(self._metric_base, metric_name)
 
         start = time()
@@ -135,6 +146,8 @@ class QueryTimer(object):
             yield tagger
         finally:
             end = time()
+            for listener in self._listeners:
+                listener(operation, end - start)
             tags = tagger.tags
             tags.append('course:{}'.format(course_context))
             for name, size in tagger.measures:
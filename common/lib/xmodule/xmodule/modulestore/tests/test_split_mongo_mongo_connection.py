@@ -1,7 +1,7 @@
 """ Test the behavior of split_mongo/MongoConnection """
 import unittest
-from mock import patch
-from xmodule.modulestore.split_mongo.mongo_connection import MongoConnection
+from mock import Mock, patch
+from xmodule.modulestore.split_mongo.mongo_connection import MongoConnection, QueryTimer
 from xmodule.exceptions import HeartbeatFailure
 
 
@@ -17,3 +17,20 @@ class TestHeartbeatFailureException(unittest.TestCase):
 
             with self.assertRaises(HeartbeatFailure):
                 useless_conn.heartbeat()
+
+
+class TestQueryTimer(unittest.TestCase):
+    """ Test the listeners of QueryTimer """
+    def test_listener_is_called(self):
+        timer = QueryTimer('test', 0)
+        listener = Mock()
+        timer.add_listener(listener)
+        timer.add_listener(listener)
+
+        with timer.timer('find_one', 'course'):
+            pass
+
+        self.assertEqual(listener.call_count, 1)
+        operation, duration = listener.call_args[0]
+        self.assertEqual(operation, 'find_one')
+        self.assertGreaterEqual(duration, 0)
@@ -25,6 +25,7 @@ from capa.responsetypes import (StudentInputError, LoncapaProblemError,
                                 ResponseError)
 from capa.xqueue_interface import XQueueInterface
 from xmodule.capa_module import CapaModule, CapaDescriptor, ComplexEncoder
+from capa.capa_problem import LoncapaProblem
 from opaque_keys.edx.locations import Location
 from xblock.field_data import DictFieldData
 from xblock.fields import ScopeIds
@@ -35,6 +36,20 @@ from capa.correctmap import CorrectMap
 from ..capa_base_constants import RANDOMIZATION
 
 
+class DictCache(object):
+    """
+    A cache implementation over a simple dict, for testing.
+    """
+    def __init__(self):
+        self.cache = {}
+
+    def get(self, key):
+        return self.cache.get(key)
+
+    def set(self, key, value, timeout=None):  # pylint: disable=unused-argument
+        self.cache[key] = value
+
+
 class CapaFactory(object):
     """
     A helper class to create problem modules with various parameters for testing.
@@ -1403,6 +1418,47 @@ class CapaModuleTest(unittest.TestCase):
         context = render_args[1]
         self.assertIn(error_msg, context['problem']['html'])
 
+    def _get_problem_html_with_cache(self, module, cache):
+        """
+        Renders the problem html of `module` using `cache`, returning the
+        number of times the capa problem was rendered.
+        """
+        module.system.cache = cache
+        with patch('capa.capa_problem.LoncapaProblem.get_html', autospec=True,
+                   side_effect=LoncapaProblem.get_html) as mock_html:
+            module.get_problem_html()
+        return mock_html.call_count
+
+    def test_get_problem_html_is_cached(self):
+        cache = DictCache()
+        module = CapaFactory.create()
+        answer_key = CapaFactory.answer_key()
+        self.assertEqual(self._get_problem_html_with_cache(module, cache), 1)
+        self.assertEqual(self._get_problem_html_with_cache(module, cache), 0)
+
+        # The cached html is shared by learners whose answers are in the same state.
+        other_module = CapaFactory.create()
+        other_module.lcp = module.new_lcp(module.get_state_for_lcp())
+        self.assertEqual(self._get_problem_html_with_cache(other_module, cache), 0)
+
+        # But not once they answered the problem.
+        module.lcp.student_answers = {answer_key: '3.14'}
+        self.assertEqual(self._get_problem_html_with_cache(module, cache), 1)
+
+    def test_get_problem_html_with_anonymous_student_id_is_not_cached(self):
+        xml = textwrap.dedent("""
+            <problem>
+            <script type="loncapa/python">
+            student = anonymous_student_id
+            </script>
+            <p>Hello $student</p>
+            </problem>
+        """)
+        cache = DictCache()
+        module = CapaFactory.create(xml=xml)
+        self.assertEqual(self._get_problem_html_with_cache(module, cache), 1)
+        self.assertEqual(self._get_problem_html_with_cache(module, cache), 1)
+
     @ddt.data(
         'false',
         'true',
@@ -1,6 +1,8 @@
 """Grading tests"""
 import unittest
 
+import numpy
+
 from xmodule import graders
 from xmodule.graders import Score, aggregate_scores
 
@@ -240,3 +242,77 @@ class GraderTest(unittest.TestCase):
 
         # TODO: How do we test failure cases? The parser only logs an error when
         # it can't parse something. Maybe it should throw exceptions?
+
+
+class BatchGraderTest(unittest.TestCase):
+    '''Tests that grading students in batches gives the same results as grading them one at a time'''
+
+    sections = {
+        'Homework': ['hw1', 'hw2', 'hw3', 'hw4'],
+        'Lab': ['lab1', 'lab2'],
+        'Midterm': ['Midterm Exam'],
+    }
+
+    # Each student's earned scores, out of 4 in every section. The ties test that the same
+    # sections are dropped, and the last student has not started any section.
+    earned = [
+        {'Homework': [1, 4, 2, 3], 'Lab': [3, 1], 'Midterm': [3.5]},
+        {'Homework': [2, 2, 2, 0], 'Lab': [4, 4], 'Midterm': [1]},
+        {'Homework': [4, 1, 1, 4], 'Lab': [0, 2], 'Midterm': [4]},
+        {'Homework': [0, 0, 0, 0], 'Lab': [0, 0], 'Midterm': [0]},
+    ]
+
+    def grade_sheets(self):
+        '''Returns the per-student grade sheets and the batch grade sheet of the test scores'''
+        grade_sheets = [
+            {
+                section_format: [
+                    Score(earned=earned, possible=4.0, graded=True, section=section, module_id=None)
+                    for earned, section in zip(student_earned[section_format], sections)
+                ]
+                for section_format, sections in self.sections.iteritems()
+            }
+            for student_earned in self.earned
+        ]
+        batch_grade_sheet = {
+            section_format: graders.BatchScores(
+                earned=numpy.array([student_earned[section_format] for student_earned in self.earned]),
+                possible=4.0 * numpy.ones((len(self.earned), len(sections))),
+                sections=sections,
+            )
+            for section_format, sections in self.sections.iteritems()
+        }
+        return grade_sheets, batch_grade_sheet
+
+    def assert_batch_grading_matches(self, grader):
+        '''Asserts that the grader gives the same results in batches as one student at a time'''
+        grade_sheets, batch_grade_sheet = self.grade_sheets()
+        expected = [grader.grade(grade_sheet) for grade_sheet in grade_sheets]
+
+        self.assertEqual(grader.grade_batch(batch_grade_sheet, len(grade_sheets)), expected)
+        self.assertEqual(
+            list(grader.percent_batch(batch_grade_sheet, len(grade_sheets))),
+            [result['percent'] for result in expected],
+        )
+
+    def test_assignment_format_grader(self):
+        self.assert_batch_grading_matches(graders.AssignmentFormatGrader("Homework", 6, 3))
+        self.assert_batch_grading_matches(graders.AssignmentFormatGrader("Lab", 1, 1, show_only_average=True))
+        self.assert_batch_grading_matches(graders.AssignmentFormatGrader("Midterm", 1, 0))
+        self.assert_batch_grading_matches(graders.AssignmentFormatGrader("Quiz", 3, 1, hide_average=True))
+
+    def test_single_section_grader(self):
+        self.assert_batch_grading_matches(graders.SingleSectionGrader("Midterm", "Midterm Exam"))
+        self.assert_batch_grading_matches(graders.SingleSectionGrader("Final", "Final Exam"))
+
+    def test_grader_from_conf(self):
+        self.assert_batch_grading_matches(graders.grader_from_conf([
+            {'type': "Homework", 'min_count': 5, 'drop_count': 2, 'short_label': "HW", 'weight': 0.3},
+            {'type': "Lab", 'min_count': 2, 'drop_count': 0, 'category': "Labs", 'weight': 0.2},
+            {'type': "Midterm", 'name': "Midterm Exam", 'short_label': "Midterm", 'weight': 0.5},
+        ]))
+        self.assert_batch_grading_matches(graders.grader_from_conf([]))
+
+    def test_no_scores(self):
+        grader = graders.AssignmentFormatGrader("Homework", 2, 1)
+        self.assertEqual(grader.grade_batch({}, 2), [grader.grade({})] * 2)
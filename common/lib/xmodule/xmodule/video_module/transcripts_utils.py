@@ -4,9 +4,12 @@ Utility functions for transcripts.
 """
 import os
 import copy
+import hashlib
 import json
 import requests
 import logging
+import threading
+from collections import OrderedDict
 from pysrt import SubRipTime, SubRipItem, SubRipFile
 from lxml import etree
 from HTMLParser import HTMLParser
@@ -467,6 +470,70 @@ def get_or_create_sjson(item, transcripts):
     return sjson_transcript
 
 
+class TranscriptConversionCache(object):
+    """
+    Process-wide LRU cache of converted transcripts, bounded by the total
+    size of the cached values.
+
+    Entries are content-addressed: they are keyed by the digest of the source
+    asset, so a re-uploaded transcript never serves stale data and identical
+    transcripts shared between videos are converted only once.
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(digest, input_format, output_format, speed):
+        """
+        Returns the cache key for `digest` converted from `input_format` to `output_format`.
+        """
+        return (digest, input_format, output_format, float(speed))
+
+    def get(self, key):
+        """
+        Returns the cached value for `key`, or None, marking the entry as most recently used.
+        """
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self._entries[key] = value
+            return value
+
+    def set(self, key, value):
+        """
+        Caches `value` under `key`, evicting least recently used entries to stay within max_size.
+        """
+        size = len(value)
+        if size > self.max_size:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            while self._entries and self._size + size > self.max_size:
+                __, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+            self._entries[key] = value
+            self._size += size
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+# Total size of converted transcripts kept in memory by each process.
+TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE = 16 * 1024 * 1024
+
+transcript_conversion_cache = TranscriptConversionCache(TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE)
+
+
 class Transcript(object):
     """
     Container for transcript methods.
@@ -509,6 +576,55 @@ class Transcript(object):
             elif output_format == 'srt':
                 return generate_srt_from_sjson(json.loads(content), speed=1.0)
 
+    @staticmethod
+    def convert_asset(location, filename, input_format, output_format, speed=1.0):
+        """
+        Return the transcript stored as asset `filename` converted from
+        `input_format` to `output_format`, serving repeated requests from
+        `transcript_conversion_cache`.
+
+        The asset is opened as a stream so that, when the contentstore
+        knows its digest, a cache hit never reads the asset's chunks.
+        `speed` is the speed of an sjson source.
+
+        Raises:
+            NotFoundError if the asset does not exist.
+        """
+        content = contentstore().find(Transcript.asset_location(location, filename), as_stream=True)
+        try:
+            digest = getattr(content, 'content_digest', None)
+            if digest:
+                key = TranscriptConversionCache.make_key(digest, input_format, output_format, speed)
+                converted = transcript_conversion_cache.get(key)
+                if converted is not None:
+                    return converted
+
+            if hasattr(content, 'stream_data'):
+                chunks = []
+                hasher = hashlib.md5()
+                for chunk in content.stream_data():
+                    hasher.update(chunk)
+                    chunks.append(chunk)
+                data = ''.join(chunks)
+                digest = digest or hasher.hexdigest()
+            else:
+                data = content.data
+                digest = digest or hashlib.md5(data).hexdigest()
+        finally:
+            if hasattr(content, 'close'):
+                content.close()
+
+        if input_format == 'sjson' and output_format == 'srt':
+            converted = generate_srt_from_sjson(json.loads(data), speed)
+        else:
+            converted = Transcript.convert(data, input_format, output_format)
+
+        if converted:
+            transcript_conversion_cache.set(
+                TranscriptConversionCache.make_key(digest, input_format, output_format, speed), converted
+            )
+        return converted
+
     @staticmethod
     def asset(location, subs_id, lang='en', filename=None):
         """
@@ -632,13 +748,13 @@ class VideoTranscriptsMixin(object):
                 log.debug("No subtitles for 'en' language")
                 raise ValueError
 
-            data = Transcript.asset(self.location, transcript_name, lang).data
+            content = Transcript.convert_asset(
+                self.location, subs_filename(transcript_name, lang), 'sjson', transcript_format
+            )
             filename = u'{}.{}'.format(transcript_name, transcript_format)
-            content = Transcript.convert(data, 'sjson', transcript_format)
         else:
-            data = Transcript.asset(self.location, None, None, other_lang[lang]).data
+            content = Transcript.convert_asset(self.location, other_lang[lang], 'srt', transcript_format)
             filename = u'{}.{}'.format(os.path.splitext(other_lang[lang])[0], transcript_format)
-            content = Transcript.convert(data, 'srt', transcript_format)
 
         if not content:
             log.debug('no subtitles produced in get_transcript')
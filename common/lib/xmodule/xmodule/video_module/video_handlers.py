@@ -117,7 +117,7 @@ class VideoStudentViewHandlers(object):
         if youtube_id:
             # Youtube case:
             if self.transcript_language == 'en':
-                return Transcript.asset(self.location, youtube_id).data
+                return Transcript.convert_asset(self.location, subs_filename(youtube_id), 'sjson', 'sjson')
 
             youtube_ids = youtube_speed_dict(self)
             if youtube_id not in youtube_ids:
@@ -141,7 +141,7 @@ class VideoStudentViewHandlers(object):
             # HTML5 case
             if self.transcript_language == 'en':
                 if '.srt' not in sub:  # not bumper case
-                    return Transcript.asset(self.location, sub).data
+                    return Transcript.convert_asset(self.location, subs_filename(sub), 'sjson', 'sjson')
                 try:
                     return get_or_create_sjson(self, {'en': sub})
                 except TranscriptException:
@@ -164,6 +164,57 @@ def generate_user_certificates(student, course_key, course=None, insecure=False,
     if cert is None:
         return
 
+    _emit_certificate_created_event(student, course_key, course, cert, generation_mode)
+    return cert.status
+
+
+def generate_certificates_for_students(students, course_key, course=None, insecure=False, generation_mode='batch'):
+    """
+    It will add the add-cert requests of several students into the xqueue.
+
+    This is equivalent to calling generate_user_certificates for each
+    student, but much cheaper for large numbers of students; see
+    XQueueCertInterface.add_certs.
+
+    Args:
+        students (list of User)
+        course_key (CourseKey)
+
+    Keyword Arguments:
+        course (Course): Optionally provide the course object; if not provided
+            it will be loaded.
+        insecure - (Boolean)
+        generation_mode - who has requested certificate generation.
+
+    Returns:
+        A dict mapping the id of each student to the status of their
+        certificate, or None if no certificate could be requested for them.
+    """
+    if course is None:
+        course = modulestore().get_course(course_key, depth=0)
+
+    xqueue = XQueueCertInterface()
+    if insecure:
+        xqueue.use_https = False
+    generate_pdf = not has_html_certificates_enabled(course_key, course)
+    certs = xqueue.add_certs(students, course_key, course=course, generate_pdf=generate_pdf)
+
+    statuses = {}
+    for student in students:
+        cert = certs.get(student.id)
+        if cert is None:
+            statuses[student.id] = None
+            continue
+
+        _emit_certificate_created_event(student, course_key, course, cert, generation_mode)
+        statuses[student.id] = cert.status
+    return statuses
+
+
+def _emit_certificate_created_event(student, course_key, course, cert, generation_mode):
+    """
+    Emits the `edx.certificate.created` event if the student's certificate is passing.
+    """
     if CertificateStatuses.is_passing_status(cert.status):
         emit_certificate_event('created', student, course_key, course, {
             'user_id': student.id,
@@ -172,7 +223,6 @@ def generate_user_certificates(student, course_key, course=None, insecure=False,
             'enrollment_mode': cert.mode,
             'generation_mode': generation_mode
         })
-    return cert.status
 
 
 def regenerate_user_certificates(student, course_key, course=None,
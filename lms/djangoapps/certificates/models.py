@@ -52,9 +52,11 @@ import uuid
 import os
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.db.models import Count
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 from django_extensions.db.fields import CreationDateTimeField
@@ -72,6 +74,12 @@ from xmodule_django.models import CourseKeyField, NoneToEmptyManager
 
 LOGGER = logging.getLogger(__name__)
 
+# How long the certificates of a student are cached for certificate_statuses_for_student.
+# The cache is cleared whenever one of them is saved, but that happens before the
+# transaction commits, so a concurrent request may cache the old certificates again
+# until they expire.
+STUDENT_CERTIFICATES_CACHE_TIMEOUT = 5 * 60
+
 
 class CertificateStatuses(object):
     """
@@ -314,6 +322,30 @@ class GeneratedCertificate(models.Model):
         signal iff we are saving a record of a learner passing the course.
         """
         super(GeneratedCertificate, self).save(*args, **kwargs)
+        self._send_cert_awarded_signal()
+
+    @classmethod
+    def bulk_create_certificates(cls, certificates):
+        """
+        Insert the given new certificates with a single query, firing the
+        COURSE_CERT_AWARDED signal for the passing ones, as save() does.
+
+        Note that, depending on the database, the primary keys of the
+        certificates may not be set afterwards.
+
+        Raises IntegrityError, without inserting any of them, if one of the
+        students already has a certificate for the course.
+        """
+        with transaction.atomic():
+            cls.objects.bulk_create(certificates)
+        clear_student_certificates_cache(set(certificate.user_id for certificate in certificates))
+        for certificate in certificates:
+            certificate._send_cert_awarded_signal()  # pylint: disable=protected-access
+
+    def _send_cert_awarded_signal(self):
+        """
+        Fire the COURSE_CERT_AWARDED signal iff this is a record of a learner passing the course.
+        """
         if CertificateStatuses.is_passing_status(self.status):
             COURSE_CERT_AWARDED.send_robust(
                 sender=self.__class__,
@@ -498,39 +530,143 @@ def certificate_status_for_student(student, course_id):
     If the student has been graded, the dictionary also contains their
     grade for the course with the key "grade".
     '''
-    # Import here instead of top of file since this module gets imported before
-    # the course_modes app is loaded, resulting in a Django deprecation warning.
-    from course_modes.models import CourseMode
-
     try:
         generated_certificate = GeneratedCertificate.objects.get(  # pylint: disable=no-member
             user=student, course_id=course_id)
-        cert_status = {
-            'status': generated_certificate.status,
-            'mode': generated_certificate.mode,
-            'uuid': generated_certificate.verify_uuid,
+    except GeneratedCertificate.DoesNotExist:
+        return _unavailable_certificate_status()
+    return _certificate_status(_certificate_fields(generated_certificate), course_id)
+
+
+def certificate_statuses_for_student(student, course_ids, course_modes=None):
+    """
+    Returns the status of the student's certificate in each of the given
+    courses, as certificate_status_for_student would, loading all of the
+    student's certificates at once.
+
+    Arguments:
+        student (User): The student.
+        course_ids (list of CourseKey): The courses to return statuses for.
+        course_modes (dict): If provided, the unexpired modes of each course,
+            as returned by CourseMode.all_and_unexpired_modes_for_courses.
+            Useful for avoiding unnecessary database queries.
+
+    Returns:
+        dict: Keys are the course keys, values the certificate status dicts.
+    """
+    certificates = _student_certificates(student)
+    statuses = {}
+    for course_id in course_ids:
+        certificate = certificates.get(unicode(course_id))
+        if certificate is None:
+            statuses[course_id] = _unavailable_certificate_status()
+        else:
+            modes = course_modes.get(course_id) if course_modes is not None else None
+            statuses[course_id] = _certificate_status(certificate, course_id, modes)
+    return statuses
+
+
+def clear_student_certificates_cache(student_ids):
+    """
+    Removes the cached certificates of the given students, so that the next
+    certificate_statuses_for_student call loads them from the database.
+
+    Must be called whenever certificates are changed without saving or
+    deleting the model instances, e.g. with QuerySet.update().
+    """
+    cache.delete_many([_student_certificates_cache_key(student_id) for student_id in student_ids])
+
+
+def _student_certificates_cache_key(student_id):
+    """
+    Returns the key the certificates of the given student are cached under.
+    """
+    return u'certificates.student_certificates.{}'.format(student_id)
+
+
+def _student_certificates(student):
+    """
+    Returns the fields of all of the student's certificates, keyed by the
+    unicode course key, from the cache if possible.
+    """
+    cache_key = _student_certificates_cache_key(student.id)
+    certificates = cache.get(cache_key)
+    if certificates is None:
+        certificates = {
+            unicode(generated_certificate.course_id): _certificate_fields(generated_certificate)
+            for generated_certificate in GeneratedCertificate.objects.filter(user=student)
         }
-        if generated_certificate.grade:
-            cert_status['grade'] = generated_certificate.grade
+        cache.set(cache_key, certificates, STUDENT_CERTIFICATES_CACHE_TIMEOUT)
+    return certificates
 
-        if generated_certificate.mode == 'audit':
-            course_mode_slugs = [mode.slug for mode in CourseMode.modes_for_course(course_id)]
-            # Short term fix to make sure old audit users with certs still see their certs
-            # only do this if there if no honor mode
-            if 'honor' not in course_mode_slugs:
-                cert_status['status'] = CertificateStatuses.auditing
-                return cert_status
 
-        if generated_certificate.status == CertificateStatuses.downloadable:
-            cert_status['download_url'] = generated_certificate.download_url
+def _certificate_fields(generated_certificate):
+    """
+    Returns the fields of a certificate its status is computed from.
+    """
+    return {
+        'status': generated_certificate.status,
+        'mode': generated_certificate.mode,
+        'uuid': generated_certificate.verify_uuid,
+        'grade': generated_certificate.grade,
+        'download_url': generated_certificate.download_url,
+    }
 
-        return cert_status
 
-    except GeneratedCertificate.DoesNotExist:
-        pass
+def _unavailable_certificate_status():
+    """
+    Returns the status of a student who has no certificate.
+    """
     return {'status': CertificateStatuses.unavailable, 'mode': GeneratedCertificate.MODES.honor, 'uuid': None}
 
 
+def _certificate_status(certificate, course_id, course_modes=None):
+    """
+    Returns the status dict of certificate_status_for_student for the
+    certificate with the given fields.
+
+    Arguments:
+        certificate (dict): The certificate fields, as returned by _certificate_fields.
+        course_id (CourseKey): The course of the certificate.
+        course_modes (list of Mode): If provided, the unexpired modes of the course.
+    """
+    # Import here instead of top of file since this module gets imported before
+    # the course_modes app is loaded, resulting in a Django deprecation warning.
+    from course_modes.models import CourseMode
+
+    cert_status = {
+        'status': certificate['status'],
+        'mode': certificate['mode'],
+        'uuid': certificate['uuid'],
+    }
+    if certificate['grade']:
+        cert_status['grade'] = certificate['grade']
+
+    if certificate['mode'] == 'audit':
+        if course_modes is None:
+            course_modes = CourseMode.modes_for_course(course_id)
+        course_mode_slugs = [mode.slug for mode in course_modes]
+        # Short term fix to make sure old audit users with certs still see their certs
+        # only do this if there if no honor mode
+        if 'honor' not in course_mode_slugs:
+            cert_status['status'] = CertificateStatuses.auditing
+            return cert_status
+
+    if certificate['status'] == CertificateStatuses.downloadable:
+        cert_status['download_url'] = certificate['download_url']
+
+    return cert_status
+
+
+@receiver(post_save, sender=GeneratedCertificate)
+@receiver(post_delete, sender=GeneratedCertificate)
+def clear_student_certificates_cache_on_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Clear the cached certificates of the owner of a saved or deleted certificate.
+    """
+    clear_student_certificates_cache([instance.user_id])
+
+
 def certificate_info_for_user(user, course_id, grade, user_is_whitelisted=None):
     """
     Returns the certificate info for a user for grade report.
@@ -4,11 +4,14 @@ import random
 import logging
 import lxml.html
 from lxml.etree import XMLSyntaxError, ParserError
+from multiprocessing.pool import ThreadPool
 from uuid import uuid4
 
 from django.test.client import RequestFactory
 from django.conf import settings
 from django.core.urlresolvers import reverse
+from django.db import IntegrityError
+from django.utils import timezone
 from requests.auth import HTTPBasicAuth
 
 from lms.djangoapps.grades import course_grades
@@ -23,6 +26,7 @@ from certificates.models import (
     CertificateStatuses,
     GeneratedCertificate,
     certificate_status_for_student,
+    clear_student_certificates_cache,
     CertificateStatuses as status,
     CertificateWhitelist,
     ExampleCertificate
@@ -31,6 +35,9 @@ from certificates.models import (
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum number of certificate generation tasks sent to the XQueue at the same time.
+XQUEUE_SUBMISSION_CONCURRENCY = 8
+
 
 class XQueueAddToQueueError(Exception):
     """An error occurred when adding a certificate task to the queue. """
@@ -183,7 +190,6 @@ class XQueueCertInterface(object):
 
         raise NotImplementedError
 
-    # pylint: disable=too-many-statements
     def add_cert(self, student, course_id, course=None, forced_grade=None, template_file=None, generate_pdf=True):
         """
         Request a new certificate for a student.
@@ -213,7 +219,188 @@ class XQueueCertInterface(object):
 
         Returns the newly created certificate instance
         """
+        cert_status = certificate_status_for_student(student, course_id)['status']
+        if not self._can_add_cert(student, course_id, cert_status):
+            return None
+
+        # The caller can optionally pass a course in to avoid
+        # re-fetching it from Mongo. If they have not provided one,
+        # get it from the modulestore.
+        if course is None:
+            course = modulestore().get_course(course_id, depth=0)
+
+        profile = UserProfile.objects.get(user=student)
+        profile_name = profile.name
+
+        # Needed for access control in grading.
+        self.request.user = student
+        self.request.session = {}
+
+        is_whitelisted = self.whitelist.filter(user=student, course_id=course_id, whitelist=True).exists()
+        grade = course_grades.summary(student, course)
+        enrollment_mode, __ = CourseEnrollment.enrollment_mode_for_user(student, course_id)
+        user_is_verified = SoftwareSecurePhotoVerification.user_is_verified(student)
+
+        cert, __ = GeneratedCertificate.objects.get_or_create(user=student, course_id=course_id)  # pylint: disable=no-member
+
+        generation = self._update_cert(
+            cert, student, grade, profile_name, enrollment_mode, is_whitelisted, user_is_verified,
+            is_restricted=lambda: self.restricted.filter(user=student).exists(),
+            forced_grade=forced_grade,
+            template_file=template_file,
+        )
+        if generation is None:
+            cert.save()
+            return cert
+
+        # Finally, generate the certificate and send it off.
+        grade_contents, template_pdf = generation
+        return self._generate_cert(cert, course, student, grade_contents, template_pdf, generate_pdf)
+
+    def add_certs(self, students, course_id, course=None, forced_grade=None, generate_pdf=True):
+        """
+        Request new certificates for several students of a course.
 
+        This is equivalent to calling add_cert for each student, except that
+        the data needed to decide on the certificates is loaded for the whole
+        batch with a few queries, all the students are graded against the same
+        course structure, the new certificates are inserted with a single query
+        and the generation tasks are sent to the XQueue concurrently.
+
+        Arguments:
+          students - list of User objects
+          course_id - courseenrollment.course_id (CourseKey)
+          forced_grade - see add_cert
+          generate_pdf - see add_cert
+
+        Returns a dict mapping the id of each student a certificate was
+        requested for to their certificate. Students whose certificate is not
+        in a state that allows a new request, or who could not be graded, are
+        left out.
+        """
+        if course is None:
+            course = modulestore().get_course(course_id, depth=0)
+
+        student_ids = [student.id for student in students]
+        existing_certs = {
+            cert.user_id: cert
+            for cert in GeneratedCertificate.objects.filter(user_id__in=student_ids, course_id=course_id)
+        }
+        cert_statuses = self._cert_statuses(course_id, existing_certs)
+        students = [
+            student for student in students
+            if self._can_add_cert(student, course_id, cert_statuses.get(student.id, status.unavailable))
+        ]
+        student_ids = [student.id for student in students]
+
+        profile_names = dict(UserProfile.objects.filter(user_id__in=student_ids).values_list('user_id', 'name'))
+        whitelisted_ids = set(self.whitelist.filter(
+            user_id__in=student_ids, course_id=course_id, whitelist=True
+        ).values_list('user_id', flat=True))
+        enrollment_modes = dict(CourseEnrollment.objects.filter(
+            user_id__in=student_ids, course_id=course_id
+        ).values_list('user_id', 'mode'))
+        verified_ids = SoftwareSecurePhotoVerification.verified_user_ids(student_ids)
+        restricted_ids = set(self.restricted.filter(user_id__in=student_ids).values_list('user_id', flat=True))
+
+        certs = {}
+        new_certs = []
+        generations = []
+        for student, grade, err_msg in course_grades.iterate_grades_for(course, students):
+            if err_msg:
+                # iterate_grades_for already logged the error.
+                continue
+
+            cert = existing_certs.get(student.id)
+            if cert is None:
+                # created_date is only set when inserting the certificate, but
+                # deciding on the certificate needs it.
+                cert = GeneratedCertificate(user=student, course_id=course_id, created_date=timezone.now())
+                new_certs.append(cert)
+            certs[student.id] = cert
+
+            generation = self._update_cert(
+                cert, student, grade,
+                profile_names.get(student.id, u''),
+                enrollment_modes.get(student.id),
+                student.id in whitelisted_ids,
+                student.id in verified_ids,
+                is_restricted=lambda: student.id in restricted_ids,  # pylint: disable=cell-var-from-loop
+                forced_grade=forced_grade,
+            )
+            if generation is not None:
+                grade_contents, template_pdf = generation
+                contents = self._prepare_cert_generation(
+                    cert, course, student, grade_contents, template_pdf, generate_pdf
+                )
+                generations.append((cert, contents))
+
+        try:
+            GeneratedCertificate.bulk_create_certificates(new_certs)
+        except IntegrityError:
+            # A certificate was created concurrently, e.g. requested by its
+            # learner, so request the new certificates one by one.
+            LOGGER.warning(u"Certificates of course %s were created concurrently, adding them one by one.", course_id)
+            new_cert_user_ids = set(cert.user_id for cert in new_certs)
+            generations = [
+                generation for generation in generations if generation[0].user_id not in new_cert_user_ids
+            ]
+            for student in students:
+                if student.id in new_cert_user_ids:
+                    cert = self.add_cert(
+                        student, course_id, course=course, forced_grade=forced_grade, generate_pdf=generate_pdf
+                    )
+                    if cert is None:
+                        certs.pop(student.id, None)
+                    else:
+                        certs[student.id] = cert
+
+        for user_id, cert in certs.iteritems():
+            if user_id in existing_certs:
+                cert.save()
+
+        if generate_pdf and generations:
+            errors = self._send_certs_to_xqueue(
+                [(generation_contents, generation_cert.key) for generation_cert, generation_contents in generations]
+            )
+            for (cert, __), error in zip(generations, errors):
+                if error is not None:
+                    # New certificates may not have a primary key, so update them with a query.
+                    self._mark_cert_as_error(cert, error)
+                    GeneratedCertificate.objects.filter(user_id=cert.user_id, course_id=course_id).update(
+                        status=cert.status,
+                        error_reason=cert.error_reason,
+                    )
+                    clear_student_certificates_cache([cert.user_id])
+                else:
+                    self._log_cert_sent_to_xqueue(cert)
+
+        return certs
+
+    @staticmethod
+    def _cert_statuses(course_id, certs):
+        """
+        Returns the status certificate_status_for_student would return for the
+        owner of each of the certificates of the course in `certs`, which is
+        keyed by user id.
+        """
+        statuses = {user_id: cert.status for user_id, cert in certs.iteritems()}
+        audit_user_ids = [user_id for user_id, cert in certs.iteritems() if cert.mode == 'audit']
+        if audit_user_ids:
+            course_mode_slugs = [mode.slug for mode in CourseMode.modes_for_course(course_id)]
+            # Short term fix to make sure old audit users with certs still see their certs
+            # only do this if there if no honor mode
+            if 'honor' not in course_mode_slugs:
+                for user_id in audit_user_ids:
+                    statuses[user_id] = status.auditing
+        return statuses
+
+    @staticmethod
+    def _can_add_cert(student, course_id, cert_status):
+        """
+        Returns whether a certificate with the status `cert_status` can be
+        requested for the student, logging a warning if not.
+        """
         valid_statuses = [
             status.generating,
             status.unavailable,
@@ -226,9 +413,6 @@ class XQueueCertInterface(object):
             status.audit_notpassing,
         ]
 
-        cert_status = certificate_status_for_student(student, course_id)['status']
-        cert = None
-
         if cert_status not in valid_statuses:
             LOGGER.warning(
                 (
@@ -241,26 +425,27 @@ class XQueueCertInterface(object):
                 cert_status,
                 unicode(valid_statuses)
             )
-            return None
-
-        # The caller can optionally pass a course in to avoid
-        # re-fetching it from Mongo. If they have not provided one,
-        # get it from the modulestore.
-        if course is None:
-            course = modulestore().get_course(course_id, depth=0)
+            return False
+        return True
 
-        profile = UserProfile.objects.get(user=student)
-        profile_name = profile.name
+    @staticmethod
+    def _update_cert(cert, student, grade, profile_name, enrollment_mode, is_whitelisted, user_is_verified,
+                     is_restricted, forced_grade=None, template_file=None):
+        """
+        Update the student's certificate according to their grade and
+        eligibility, without saving it.
 
-        # Needed for access control in grading.
-        self.request.user = student
-        self.request.session = {}
+        Arguments:
+          is_restricted - a callable returning whether the student is on the
+                          embargoed country restricted list. It is only called
+                          for passing students.
 
-        is_whitelisted = self.whitelist.filter(user=student, course_id=course_id, whitelist=True).exists()
-        grade = course_grades.summary(student, course)
-        enrollment_mode, __ = CourseEnrollment.enrollment_mode_for_user(student, course_id)
+        Returns a (grade_contents, template_pdf) tuple if a certificate should
+        be generated for the student, otherwise None, in which case the status
+        of the certificate has been set to the reason why.
+        """
+        course_id = cert.course_id
         mode_is_verified = enrollment_mode in GeneratedCertificate.VERIFIED_CERTS_MODES
-        user_is_verified = SoftwareSecurePhotoVerification.user_is_verified(student)
         cert_mode = enrollment_mode
         is_eligible_for_certificate = is_whitelisted or CourseMode.is_eligible_for_certificate(enrollment_mode)
         unverified = False
@@ -299,8 +484,6 @@ class XQueueCertInterface(object):
             mode_is_verified
         )
 
-        cert, created = GeneratedCertificate.objects.get_or_create(user=student, course_id=course_id)  # pylint: disable=no-member
-
         cert.mode = cert_mode
         cert.user = student
         cert.grade = grade['percent']
@@ -347,17 +530,15 @@ class XQueueCertInterface(object):
         cutoff = settings.AUDIT_CERT_CUTOFF_DATE
         if (cutoff and cert.created_date >= cutoff) and not is_eligible_for_certificate:
             cert.status = CertificateStatuses.audit_passing if passing else CertificateStatuses.audit_notpassing
-            cert.save()
             LOGGER.info(
                 u"Student %s with enrollment mode %s is not eligible for a certificate.",
                 student.id,
                 enrollment_mode
             )
-            return cert
+            return None
         # If they are not passing, short-circuit and don't generate cert
         elif not passing:
             cert.status = status.notpassing
-            cert.save()
 
             LOGGER.info(
                 (
@@ -369,14 +550,13 @@ class XQueueCertInterface(object):
                 unicode(course_id),
                 cert.status
             )
-            return cert
+            return None
 
         # Check to see whether the student is on the the embargoed
         # country restricted list. If so, they should not receive a
         # certificate -- set their status to restricted and log it.
-        if self.restricted.filter(user=student).exists():
+        if is_restricted():
             cert.status = status.restricted
-            cert.save()
 
             LOGGER.info(
                 (
@@ -389,11 +569,10 @@ class XQueueCertInterface(object):
                 cert.status,
                 unicode(course_id)
             )
-            return cert
+            return None
 
         if unverified:
             cert.status = status.unverified
-            cert.save()
             LOGGER.info(
                 (
                     u"User %s has a verified enrollment in course %s "
@@ -403,16 +582,34 @@ class XQueueCertInterface(object):
                 student.id,
                 unicode(course_id),
             )
-            return cert
+            return None
 
-        # Finally, generate the certificate and send it off.
-        return self._generate_cert(cert, course, student, grade_contents, template_pdf, generate_pdf)
+        return grade_contents, template_pdf
 
     def _generate_cert(self, cert, course, student, grade_contents, template_pdf, generate_pdf):
         """
         Generate a certificate for the student. If `generate_pdf` is True,
         sends a request to XQueue.
         """
+        contents = self._prepare_cert_generation(cert, course, student, grade_contents, template_pdf, generate_pdf)
+        cert.save()
+
+        if generate_pdf:
+            try:
+                self._send_to_xqueue(contents, cert.key)
+            except XQueueAddToQueueError as exc:
+                self._mark_cert_as_error(cert, exc)
+                cert.save()
+            else:
+                self._log_cert_sent_to_xqueue(cert)
+        return cert
+
+    @staticmethod
+    def _prepare_cert_generation(cert, course, student, grade_contents, template_pdf, generate_pdf):
+        """
+        Update the certificate to be generated, without saving it, and return
+        the contents of its XQueue task.
+        """
         course_id = unicode(course.id)
 
         key = make_hashkey(random.random())
@@ -431,35 +628,38 @@ class XQueueCertInterface(object):
         else:
             cert.status = status.downloadable
             cert.verify_uuid = uuid4().hex
+        return contents
 
-        cert.save()
+    @staticmethod
+    def _mark_cert_as_error(cert, exc):
+        """
+        Update the certificate, without saving it, after its task could not be added to the XQueue.
+        """
+        cert.status = ExampleCertificate.STATUS_ERROR
+        cert.error_reason = unicode(exc)
+        LOGGER.critical(
+            (
+                u"Could not add certificate task to XQueue.  "
+                u"The course was '%s' and the student was '%s'."
+                u"The certificate task status has been marked as 'error' "
+                u"and can be re-submitted with a management command."
+            ), unicode(cert.course_id), cert.user_id
+        )
 
-        if generate_pdf:
-            try:
-                self._send_to_xqueue(contents, key)
-            except XQueueAddToQueueError as exc:
-                cert.status = ExampleCertificate.STATUS_ERROR
-                cert.error_reason = unicode(exc)
-                cert.save()
-                LOGGER.critical(
-                    (
-                        u"Could not add certificate task to XQueue.  "
-                        u"The course was '%s' and the student was '%s'."
-                        u"The certificate task status has been marked as 'error' "
-                        u"and can be re-submitted with a management command."
-                    ), course_id, student.id
-                )
-            else:
-                LOGGER.info(
-                    (
-                        u"The certificate status has been set to '%s'.  "
-                        u"Sent a certificate grading task to the XQueue "
-                        u"with the key '%s'. "
-                    ),
-                    cert.status,
-                    key
-                )
-        return cert
+    @staticmethod
+    def _log_cert_sent_to_xqueue(cert):
+        """
+        Log that the task of the certificate has been added to the XQueue.
+        """
+        LOGGER.info(
+            (
+                u"The certificate status has been set to '%s'.  "
+                u"Sent a certificate grading task to the XQueue "
+                u"with the key '%s'. "
+            ),
+            cert.status,
+            cert.key
+        )
 
     def add_example_cert(self, example_cert):
         """Add a task to create an example certificate.
@@ -572,3 +772,29 @@ class XQueueCertInterface(object):
             exc = XQueueAddToQueueError(error, msg)
             LOGGER.critical(unicode(exc))
             raise exc
+
+    def _send_certs_to_xqueue(self, tasks):
+        """
+        Add several certificate generation tasks to the XQueue, concurrently.
+
+        Arguments:
+            tasks (list): (contents, key) tuples, as accepted by _send_to_xqueue.
+
+        Returns a list with, for each task, the XQueueAddToQueueError raised
+        while adding it, or None if it was added.
+        """
+        def send(task):
+            """
+            Add a single task, returning the error raised instead of raising it.
+            """
+            try:
+                self._send_to_xqueue(*task)
+            except XQueueAddToQueueError as exc:
+                return exc
+
+        pool = ThreadPool(min(XQUEUE_SUBMISSION_CONCURRENCY, len(tasks)))
+        try:
+            return pool.map(send, tasks)
+        finally:
+            pool.close()
+            pool.join()
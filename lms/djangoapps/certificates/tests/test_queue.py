@@ -282,6 +282,85 @@ class XQueueCertInterfaceAddCertificateTest(ModuleStoreTestCase):
             expected_status
         )
 
+    def add_certs_to_queue(self, students, send_result=(0, None)):
+        """
+        Adds the certificate requests of `students` to the queue in batch.
+        Returns the certificates and the mock of `XQueueInterface.send_to_queue`.
+        """
+        with mock_passing_grade():
+            with patch.object(XQueueInterface, 'send_to_queue') as mock_send:
+                mock_send.return_value = send_result
+                certs = self.xqueue.add_certs(students, self.course.id)
+        return certs, mock_send
+
+    def test_add_certs(self):
+        # A restricted student
+        restricted_user = UserFactory.create()
+        restricted_user.profile.allow_certificate = False
+        restricted_user.profile.save()
+        CourseEnrollmentFactory(user=restricted_user, course_id=self.course.id, mode='honor')
+        # A student whose certificate is in a state that doesn't allow new requests
+        GeneratedCertificateFactory(
+            user=self.user_2, course_id=self.course.id, status=CertificateStatuses.deleting, mode='honor'
+        )
+
+        certs, mock_send = self.add_certs_to_queue([self.user, restricted_user, self.user_2])
+
+        self.assertEqual(set(certs), {self.user.id, restricted_user.id})
+        self.assertEqual(mock_send.call_count, 1)
+        body = json.loads(mock_send.call_args[1]['body'])
+        self.assertEqual(body['username'], self.user.username)
+
+        self.assertEqual(
+            GeneratedCertificate.objects.get(user=self.user, course_id=self.course.id).status,  # pylint: disable=no-member
+            CertificateStatuses.generating
+        )
+        self.assertEqual(
+            GeneratedCertificate.objects.get(user=restricted_user, course_id=self.course.id).status,  # pylint: disable=no-member
+            CertificateStatuses.restricted
+        )
+        self.assertEqual(
+            GeneratedCertificate.objects.get(user=self.user_2, course_id=self.course.id).status,  # pylint: disable=no-member
+            CertificateStatuses.deleting
+        )
+
+    def test_add_certs_updates_existing_certificates(self):
+        GeneratedCertificateFactory(
+            user=self.user, course_id=self.course.id, status=CertificateStatuses.notpassing, mode='honor'
+        )
+
+        certs, mock_send = self.add_certs_to_queue([self.user])
+
+        self.assertTrue(mock_send.called)
+        self.assertEqual(certs[self.user.id].status, CertificateStatuses.generating)
+        certificate = GeneratedCertificate.objects.get(user=self.user, course_id=self.course.id)  # pylint: disable=no-member
+        self.assertEqual(certificate.status, CertificateStatuses.generating)
+        self.assertEqual(certificate.key, certs[self.user.id].key)
+
+    def test_add_certs_created_concurrently(self):
+        def create_certificate_concurrently(course_id, certs):  # pylint: disable=unused-argument
+            """Create the certificate of the student once add_certs has looked for it."""
+            GeneratedCertificateFactory(
+                user=self.user, course_id=self.course.id, status=CertificateStatuses.unavailable, mode='honor'
+            )
+            return {}
+
+        with patch.object(XQueueCertInterface, '_cert_statuses', side_effect=create_certificate_concurrently):
+            certs, mock_send = self.add_certs_to_queue([self.user])
+
+        self.assertEqual(mock_send.call_count, 1)
+        self.assertEqual(certs[self.user.id].status, CertificateStatuses.generating)
+        certificate = GeneratedCertificate.objects.get(user=self.user, course_id=self.course.id)  # pylint: disable=no-member
+        self.assertEqual(certificate.status, CertificateStatuses.generating)
+
+    def test_add_certs_xqueue_error(self):
+        certs, __ = self.add_certs_to_queue([self.user], send_result=(1, 'error'))
+
+        self.assertEqual(certs[self.user.id].status, CertificateStatuses.error)
+        certificate = GeneratedCertificate.objects.get(user=self.user, course_id=self.course.id)  # pylint: disable=no-member
+        self.assertEqual(certificate.status, CertificateStatuses.error)
+        self.assertIn('error', certificate.error_reason)
+
 
 @attr(shard=1)
 @override_settings(CERT_QUEUE='certificates')
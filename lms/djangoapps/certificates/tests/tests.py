@@ -10,11 +10,14 @@ from badges.tests.factories import CourseCompleteImageConfigurationFactory
 from xmodule.modulestore.tests.factories import CourseFactory
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
 
+from opaque_keys.edx.locator import CourseLocator
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 from student.tests.factories import UserFactory, CourseEnrollmentFactory
 from certificates.models import (
     CertificateStatuses,
     GeneratedCertificate,
     certificate_status_for_student,
+    certificate_statuses_for_student,
     certificate_info_for_user
 )
 from certificates.tests.factories import GeneratedCertificateFactory
@@ -129,3 +132,72 @@ class CertificatesModelTest(ModuleStoreTestCase, MilestonesTestCaseMixin):
         cert.status = CertificateStatuses.downloadable
         cert.save()
         self.assertTrue(handler.return_value.award.called)
+
+
+@attr(shard=1)
+class CertificateStatusesForStudentTest(CacheIsolationTestCase):
+    """
+    Tests for certificate_statuses_for_student.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(CertificateStatusesForStudentTest, self).setUp()
+        self.student = UserFactory()
+        self.course_keys = [CourseLocator('edx', 'course_{}'.format(index), 'run') for index in range(3)]
+        self.certificate = GeneratedCertificateFactory.create(
+            user=self.student,
+            course_id=self.course_keys[0],
+            status=CertificateStatuses.downloadable,
+            download_url='http://www.example.com/certificate.pdf',
+            grade='0.9',
+            mode='verified',
+        )
+        GeneratedCertificateFactory.create(
+            user=self.student,
+            course_id=self.course_keys[1],
+            status=CertificateStatuses.notpassing,
+            mode='honor',
+        )
+
+    def test_matches_certificate_status_for_student(self):
+        with self.assertNumQueries(1):
+            statuses = certificate_statuses_for_student(self.student, self.course_keys)
+
+        self.assertEqual(
+            statuses,
+            {
+                course_key: certificate_status_for_student(self.student, course_key)
+                for course_key in self.course_keys
+            }
+        )
+
+    def test_statuses_are_cached(self):
+        certificate_statuses_for_student(self.student, self.course_keys)
+
+        with self.assertNumQueries(0):
+            statuses = certificate_statuses_for_student(self.student, self.course_keys)
+        self.assertEqual(statuses[self.course_keys[0]]['status'], CertificateStatuses.downloadable)
+
+    def test_cache_is_cleared_on_save(self):
+        certificate_statuses_for_student(self.student, self.course_keys)
+
+        self.certificate.invalidate()
+
+        statuses = certificate_statuses_for_student(self.student, self.course_keys)
+        self.assertEqual(statuses[self.course_keys[0]]['status'], CertificateStatuses.unavailable)
+
+    def test_cache_is_cleared_on_bulk_create(self):
+        certificate_statuses_for_student(self.student, self.course_keys)
+
+        GeneratedCertificate.bulk_create_certificates([
+            GeneratedCertificate(
+                user=self.student,
+                course_id=self.course_keys[2],
+                status=CertificateStatuses.generating,
+                mode='honor',
+            )
+        ])
+
+        statuses = certificate_statuses_for_student(self.student, self.course_keys)
+        self.assertEqual(statuses[self.course_keys[2]]['status'], CertificateStatuses.generating)
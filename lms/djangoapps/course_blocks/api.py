@@ -3,7 +3,9 @@ API entry point to the course_blocks app with top-level
 get_course_blocks function.
 """
 from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
+from openedx.core.lib.block_structure.transformer import FilteringTransformerMixin
 from openedx.core.lib.block_structure.transformers import BlockStructureTransformers
+from request_cache.middleware import RequestCache
 
 from .transformers import (
     library_content,
@@ -23,6 +25,11 @@ COURSE_BLOCK_ACCESS_TRANSFORMERS = [
     visibility.VisibilityTransformer(),
 ]
 
+# Maximum number of transformed block structures memoized per request.
+TRANSFORMED_BLOCK_STRUCTURES_PER_REQUEST = 8
+
+_MEMO_CACHE_KEY = u'course_blocks.api.get_course_blocks'
+
 
 def get_course_blocks(
         user,
@@ -64,8 +71,97 @@ def get_course_blocks(
         transformers = BlockStructureTransformers(COURSE_BLOCK_ACCESS_TRANSFORMERS)
     transformers.usage_info = CourseUsageInfo(starting_block_usage_key.course_key, user)
 
-    return get_block_structure_manager(starting_block_usage_key.course_key).get_transformed(
+    # Memoize only within a web request; offline tasks iterate over many
+    # users and would just accumulate structures in the request cache.
+    memo = None
+    if collected_block_structure is None and RequestCache.get_current_request() is not None:
+        memo = _TransformedBlocksMemo(user, starting_block_usage_key)
+        block_structure = memo.get(transformers)
+        if block_structure is not None:
+            return block_structure
+
+    block_structure = get_block_structure_manager(starting_block_usage_key.course_key).get_transformed(
         transformers,
         starting_block_usage_key,
         collected_block_structure,
     )
+    if memo is not None:
+        memo.add(transformers, block_structure)
+    return block_structure
+
+
+class _TransformedBlocksMemo(object):
+    """
+    Request-scoped memo of the block structures returned by get_course_blocks
+    for a user and starting block.
+
+    A later call with the same transformers is served a copy of the memoized
+    structure.  A later call whose transformers extend a memoized list resumes
+    from that structure and only applies the additional transformers, as long
+    as doing so is equivalent to transforming from scratch: either all the
+    additional transformers are non-filtering ones (which run after all the
+    filtering ones anyway), or all the memoized ones are filtering ones.
+    """
+    def __init__(self, user, starting_block_usage_key):
+        self.user = user
+        self.starting_block_usage_key = starting_block_usage_key
+        self.entries = RequestCache.get_request_cache().data.setdefault(_MEMO_CACHE_KEY, {}).setdefault(
+            (getattr(user, 'id', None), starting_block_usage_key), []
+        )
+
+    @staticmethod
+    def _transformer_key(transformer):
+        """
+        Returns a key identifying the transformer and its parameters.
+        """
+        return (transformer.name(), repr(sorted(vars(transformer).items())))
+
+    def get(self, transformers):
+        """
+        Returns a block structure equivalent to transforming the collected
+        structure with the given transformers, or None if it cannot be
+        derived from a memoized one.
+        """
+        transformers = list(transformers)
+        keys = [self._transformer_key(transformer) for transformer in transformers]
+        best_entry = None
+        for entry in self.entries:
+            entry_keys = entry['transformer_keys']
+            if keys[:len(entry_keys)] != entry_keys:
+                continue
+            additional = transformers[len(entry_keys):]
+            resumable = entry['only_filters'] or not any(
+                isinstance(transformer, FilteringTransformerMixin) for transformer in additional
+            )
+            if resumable and (best_entry is None or len(entry_keys) > len(best_entry['transformer_keys'])):
+                best_entry = entry
+
+        if best_entry is None:
+            return None
+
+        block_structure = best_entry['block_structure'].copy()
+        additional = transformers[len(best_entry['transformer_keys']):]
+        if additional:
+            usage_info = CourseUsageInfo(self.starting_block_usage_key.course_key, self.user)
+            BlockStructureTransformers(additional, usage_info).transform(block_structure)
+            self._add(keys, transformers, block_structure)
+        return block_structure
+
+    def add(self, transformers, block_structure):
+        """
+        Memoizes the result of transforming with the given transformers.
+        """
+        transformers = list(transformers)
+        self._add([self._transformer_key(transformer) for transformer in transformers], transformers, block_structure)
+
+    def _add(self, keys, transformers, block_structure):
+        """
+        Stores a copy of block_structure, since callers are free to mutate the one they receive.
+        """
+        if len(self.entries) >= TRANSFORMED_BLOCK_STRUCTURES_PER_REQUEST:
+            self.entries.pop(0)
+        self.entries.append({
+            'transformer_keys': keys,
+            'only_filters': all(isinstance(transformer, FilteringTransformerMixin) for transformer in transformers),
+            'block_structure': block_structure.copy(),
+        })
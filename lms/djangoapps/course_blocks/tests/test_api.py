@@ -0,0 +1,75 @@
+"""
+Tests for the course_blocks API.
+"""
+from mock import Mock, patch
+
+from lms.djangoapps.course_api.blocks.transformers.blocks_api import BlocksAPITransformer
+from lms.djangoapps.course_blocks.api import COURSE_BLOCK_ACCESS_TRANSFORMERS, get_course_blocks
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
+from openedx.core.lib.block_structure.transformers import BlockStructureTransformers
+from request_cache.middleware import RequestCache
+from student.tests.factories import UserFactory
+from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
+from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
+
+
+@patch('lms.djangoapps.course_blocks.api.RequestCache.get_current_request', Mock(return_value=Mock()))
+class GetCourseBlocksMemoTestCase(SharedModuleStoreTestCase):
+    """
+    Tests for the request-scoped memoization of get_course_blocks.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super(GetCourseBlocksMemoTestCase, cls).setUpClass()
+        cls.course = CourseFactory.create()
+        chapter = ItemFactory.create(parent=cls.course, category='chapter')
+        ItemFactory.create(parent=chapter, category='sequential')
+
+    def setUp(self):
+        super(GetCourseBlocksMemoTestCase, self).setUp()
+        self.user = UserFactory.create()
+        RequestCache.clear_request_cache()
+        self.addCleanup(RequestCache.clear_request_cache)
+
+    def _get_course_blocks(self, transformers=None):
+        """
+        Calls get_course_blocks while counting the calls to the block structure manager.
+        """
+        with patch(
+            'lms.djangoapps.course_blocks.api.get_block_structure_manager',
+            wraps=get_block_structure_manager,
+        ) as mock_manager:
+            block_structure = get_course_blocks(self.user, self.course.location, transformers)
+        return block_structure, mock_manager.call_count
+
+    def test_same_transformers_are_memoized(self):
+        first, call_count = self._get_course_blocks()
+        self.assertEqual(call_count, 1)
+
+        second, call_count = self._get_course_blocks()
+        self.assertEqual(call_count, 0)
+        self.assertEqual(set(first.get_block_keys()), set(second.get_block_keys()))
+        self.assertIsNot(first, second)
+
+    def test_mutations_do_not_leak(self):
+        first, __ = self._get_course_blocks()
+        first.remove_block(self.course.location, keep_descendants=False)
+
+        second, __ = self._get_course_blocks()
+        self.assertIn(self.course.location, second)
+
+    def test_superset_resumes_from_memoized_structure(self):
+        self._get_course_blocks()
+
+        transformers = BlockStructureTransformers(
+            COURSE_BLOCK_ACCESS_TRANSFORMERS + [BlocksAPITransformer(None, None, None, None)]
+        )
+        block_structure, call_count = self._get_course_blocks(transformers)
+        self.assertEqual(call_count, 0)
+        self.assertIn(self.course.location, block_structure)
+
+    def test_not_memoized_outside_of_requests(self):
+        with patch('lms.djangoapps.course_blocks.api.RequestCache.get_current_request', return_value=None):
+            self._get_course_blocks()
+            __, call_count = self._get_course_blocks()
+        self.assertEqual(call_count, 1)
@@ -34,6 +34,7 @@ from xmodule.split_test_module import get_split_user_partitions
 from xmodule.partitions.partitions import NoSuchUserPartitionError, NoSuchUserPartitionGroupError
 
 from external_auth.models import ExternalAuthMap
+from courseware.access_cache import get_course_access_decision
 from courseware.masquerade import get_masquerade_role, is_masquerading_as_student
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from student import auth
@@ -271,7 +272,7 @@ def _can_view_courseware_with_prerequisites(user, course):  # pylint: disable=in
         _is_prerequisites_disabled()
         or _has_staff_access_to_descriptor(user, course, course.id)
         or user.is_anonymous()
-        or _has_fulfilled_prerequisites(user, [course.id])
+        or _has_fulfilled_prerequisites(user, course.id)
     )
 
 
@@ -752,17 +753,21 @@ def _has_access_to_course(user, access_level, course_key):
         debug("Deny: unknown access level")
         return ACCESS_DENIED
 
-    staff_access = (
-        CourseStaffRole(course_key).has_user(user) or
-        OrgStaffRole(course_key.org).has_user(user)
+    staff_access = get_course_access_decision(
+        user,
+        course_key,
+        'staff_role',
+        lambda: CourseStaffRole(course_key).has_user(user) or OrgStaffRole(course_key.org).has_user(user),
     )
     if staff_access and access_level == 'staff':
         debug("Allow: user has course staff access")
         return ACCESS_GRANTED
 
-    instructor_access = (
-        CourseInstructorRole(course_key).has_user(user) or
-        OrgInstructorRole(course_key.org).has_user(user)
+    instructor_access = get_course_access_decision(
+        user,
+        course_key,
+        'instructor_role',
+        lambda: CourseInstructorRole(course_key).has_user(user) or OrgInstructorRole(course_key.org).has_user(user),
     )
 
     if instructor_access and access_level in ('staff', 'instructor'):
@@ -836,7 +841,13 @@ def _has_fulfilled_all_milestones(user, course_id):
         course_id: ID of the course to check
         user_id: ID of the user to check
     """
-    return MilestoneError() if any_unfulfilled_milestones(course_id, user.id) else ACCESS_GRANTED
+    fulfilled = get_course_access_decision(
+        user,
+        course_id,
+        'milestones_fulfilled',
+        lambda: not any_unfulfilled_milestones(course_id, user.id),
+    )
+    return ACCESS_GRANTED if fulfilled else MilestoneError()
 
 
 def _has_fulfilled_prerequisites(user, course_id):
@@ -848,7 +859,13 @@ def _has_fulfilled_prerequisites(user, course_id):
         user: user to check
         course_id: ID of the course to check
     """
-    return MilestoneError() if get_pre_requisite_courses_not_completed(user, course_id) else ACCESS_GRANTED
+    fulfilled = get_course_access_decision(
+        user,
+        course_id,
+        'prerequisites_fulfilled',
+        lambda: not get_pre_requisite_courses_not_completed(user, [course_id]),
+    )
+    return ACCESS_GRANTED if fulfilled else MilestoneError()
 
 
 def _has_catalog_visibility(course, visibility_type):
@@ -0,0 +1,65 @@
+"""
+A short-lived cache of the decisions about the access of users to courses.
+
+Checking the access of a user to a course looks up their enrollment, their
+course and org roles, and whether they fulfilled the prerequisites and
+milestones of the course, on every request to the course, including each AJAX
+call of its XBlocks. These decisions are cached per user and course for
+COURSE_ACCESS_CACHE_TIMEOUT seconds.
+
+The decisions of a user are invalidated when their enrollments, roles or
+milestones change (see student.models.invalidate_course_access_decisions).
+Changes to the prerequisites of a course itself are picked up once its
+decisions expire.
+"""
+from time import time
+
+from django.core.cache import cache
+
+from student.models import COURSE_ACCESS_DECISIONS_CACHE_KEY
+
+# How long the decisions about the access of a user to a course are cached, in seconds.
+COURSE_ACCESS_CACHE_TIMEOUT = 60
+
+# The number of courses whose decisions are cached for a user.
+MAX_CACHED_COURSES = 20
+
+
+def get_course_access_decision(user, course_key, decision, compute):
+    """
+    Returns the decision about the access of the user to the course, as a
+    boolean, calling `compute` to make it unless it is cached.
+
+    Arguments:
+        user (User): the user whose access is decided. The decisions about
+            anonymous users aren't cached.
+        course_key (CourseKey): the course the user accesses.
+        decision (str): the name of the decision, e.g. 'enrolled'.
+        compute (callable): returns the decision, or an AccessResponse.
+    """
+    if not user.id:
+        return bool(compute())
+
+    cache_key = COURSE_ACCESS_DECISIONS_CACHE_KEY.format(user_id=user.id)
+    course_id = unicode(course_key)
+    now = time()
+
+    decisions = cache.get(cache_key) or {}
+    expires, course_decisions = decisions.get(course_id, (0, {}))
+    if expires <= now:
+        expires, course_decisions = now + COURSE_ACCESS_CACHE_TIMEOUT, {}
+    elif decision in course_decisions:
+        return course_decisions[decision]
+
+    course_decisions[decision] = bool(compute())
+
+    decisions = {
+        other_id: (other_expires, other_decisions)
+        for other_id, (other_expires, other_decisions) in decisions.iteritems()
+        if other_expires > now
+    }
+    if course_id not in decisions and len(decisions) >= MAX_CACHED_COURSES:
+        decisions = {}
+    decisions[course_id] = (expires, course_decisions)
+    cache.set(cache_key, decisions, COURSE_ACCESS_CACHE_TIMEOUT)
+    return course_decisions[decision]
@@ -20,6 +20,7 @@ from xmodule.modulestore import ModuleStoreEnum
 from xmodule.x_module import STUDENT_VIEW
 
 from courseware.access import has_access
+from courseware.access_cache import get_course_access_decision
 from courseware.date_summary import (
     CourseEndDate,
     CourseStartDate,
@@ -135,7 +136,10 @@ def check_course_access(course, user, action, check_if_enrolled=False):
         # Verify that the user is either enrolled in the course or a staff
         # member.  If user is not enrolled, raise UserNotEnrolled exception
         # that will be caught by middleware.
-        if not ((user.id and CourseEnrollment.is_enrolled(user, course.id)) or has_access(user, 'staff', course)):
+        is_enrolled = user.id and get_course_access_decision(
+            user, course.id, 'enrolled', lambda: CourseEnrollment.is_enrolled(user, course.id)
+        )
+        if not (is_enrolled or has_access(user, 'staff', course)):
             raise UserNotEnrolled(course.id)
 
 
@@ -10,7 +10,6 @@ from functools import partial
 
 import dogstats_wrapper as dog_stats_api
 import newrelic.agent
-from capa.xqueue_interface import XQueueInterface
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.cache import cache
@@ -19,13 +18,13 @@ from django.core.exceptions import PermissionDenied
 from django.core.urlresolvers import reverse
 from django.http import Http404, HttpResponse
 from django.test.client import RequestFactory
+from django.utils.functional import cached_property
 from django.views.decorators.csrf import csrf_exempt
 from edx_proctoring.services import ProctoringService
 from eventtracking import tracker
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import UsageKey, CourseKey
 from opaque_keys.edx.locations import SlashSeparatedCourseKey
-from requests.auth import HTTPBasicAuth
 from xblock.core import XBlock
 from xblock.django.request import django_to_webob_request, webob_to_django_response
 from xblock.exceptions import NoSuchHandlerError, NoSuchViewError
@@ -45,6 +44,8 @@ from courseware.masquerade import (
     setup_masquerade,
 )
 from courseware.model_data import DjangoKeyValueStore, FieldDataCache, set_score
+from courseware.models import StudentModule
+from courseware.xqueue import create_xqueue_interface
 from lms.djangoapps.grades.signals.signals import SCORE_CHANGED
 from edxmako.shortcuts import render_to_string
 from lms.djangoapps.lms_xblock.field_data import LmsFieldData
@@ -83,15 +84,8 @@ from .field_overrides import OverrideFieldData
 log = logging.getLogger(__name__)
 
 
-if settings.XQUEUE_INTERFACE.get('basic_auth') is not None:
-    REQUESTS_AUTH = HTTPBasicAuth(*settings.XQUEUE_INTERFACE['basic_auth'])
-else:
-    REQUESTS_AUTH = None
-
-XQUEUE_INTERFACE = XQueueInterface(
-    settings.XQUEUE_INTERFACE['url'],
-    settings.XQUEUE_INTERFACE['django_auth'],
-    REQUESTS_AUTH,
+XQUEUE_INTERFACE = create_xqueue_interface(
+    deferred=settings.FEATURES.get('ENABLE_DEFERRED_XQUEUE_SUBMISSION', False)
 )
 
 # TODO: course_id and course_key are used interchangeably in this file, which is wrong.
@@ -388,6 +382,117 @@ def get_module_for_descriptor(user, request, descriptor, field_data_cache, cours
     )
 
 
+class _ModuleSystemBindings(object):
+    """
+    The parts of a module system that depend only on the user, the course and
+    the request, shared by the module systems of all the blocks bound to the
+    user during the request.
+
+    The access checks are made against the block the bindings were created
+    for, but staff and instructor access only depend on the block's course.
+    """
+    def __init__(self, user, descriptor, course_id):
+        self.user = user
+        self.descriptor = descriptor
+        self.course_id = course_id
+
+    @cached_property
+    def is_masquerading_as_specific_student(self):
+        """
+        Whether the user is masquerading as a specific student of the course.
+        """
+        return is_masquerading_as_specific_student(self.user, self.course_id)
+
+    @cached_property
+    def user_is_staff(self):
+        """
+        Whether the user has staff access to the course.
+        """
+        return bool(has_access(self.user, u'staff', self.descriptor.location, self.course_id))
+
+    @cached_property
+    def user_is_admin(self):
+        """
+        Whether the user is global staff.
+        """
+        return bool(has_access(self.user, u'staff', 'global'))
+
+    @cached_property
+    def user_is_beta_tester(self):
+        """
+        Whether the user is a beta tester of the course.
+        """
+        return CourseBetaTesterRole(self.course_id).has_user(self.user)
+
+    @cached_property
+    def jump_to_id_base_url(self):
+        """
+        The url that /jump_to_id/<id> links of the course are rewritten to.
+        """
+        # NOTE: module_id is empty string here. The 'module_id' will get assigned in the replacement
+        # function, we just need to specify something to get the reverse() to work.
+        return reverse('jump_to_id', kwargs={'course_id': self.course_id.to_deprecated_string(), 'module_id': ''})
+
+    @cached_property
+    def staff_debug_info_access(self):
+        """
+        (staff_access, instructor_access) of the user, used to decide whether
+        to show the staff debug info.
+        """
+        user = self.user
+        if self.is_masquerading_as_specific_student:
+            # When masquerading as a specific student, we want to show the debug button
+            # unconditionally to enable resetting the state of the student we are masquerading as.
+            # We already know the user has staff access when masquerading is active.
+            staff_access = True
+            # To figure out whether the user has instructor access, we temporarily remove the
+            # masquerade_settings from the real_user.  With the masquerading settings in place,
+            # the result would always be "False".
+            masquerade_settings = user.real_user.masquerade_settings
+            del user.real_user.masquerade_settings
+            instructor_access = bool(has_access(user.real_user, 'instructor', self.descriptor, self.course_id))
+            user.real_user.masquerade_settings = masquerade_settings
+        else:
+            staff_access = has_access(user, 'staff', self.descriptor, self.course_id)
+            instructor_access = bool(has_access(user, 'instructor', self.descriptor, self.course_id))
+        return staff_access, instructor_access
+
+    @cached_property
+    def services(self):
+        """
+        The services that don't depend on the block they are provided to.
+        """
+        return {
+            'fs': FSService(),
+            'user': DjangoXBlockUserService(self.user, user_is_staff=self.user_is_staff),
+            "reverification": ReverificationService(),
+            'proctoring': ProctoringService(),
+            'milestones': milestones_helpers.get_service(),
+            'credit': CreditService(),
+            'bookmarks': BookmarksService(user=self.user),
+        }
+
+
+def _get_module_system_bindings(user, descriptor, course_id, request_token):
+    """
+    Return the _ModuleSystemBindings of the user for the course during the
+    request identified by `request_token`.
+
+    The bindings are kept on the user, which is loaded for each request. They
+    are not shared when there is no request_token, e.g. in celery tasks.
+    """
+    if request_token is None:
+        return _ModuleSystemBindings(user, descriptor, course_id)
+
+    # pylint: disable=protected-access
+    if not hasattr(user, '_module_system_bindings'):
+        user._module_system_bindings = {}
+    key = (course_id, request_token)
+    if key not in user._module_system_bindings:
+        user._module_system_bindings[key] = _ModuleSystemBindings(user, descriptor, course_id)
+    return user._module_system_bindings[key]
+
+
 def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=too-many-statements
                                # Arguments preceding this comment have user binding, those following don't
                                descriptor, course_id, track_function, xqueue_callback_url_prefix,
@@ -546,7 +651,7 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
 
     def publish(block, event_type, event):
         """A function that allows XModules to publish events."""
-        if event_type == 'grade' and not is_masquerading_as_specific_student(user, course_id):
+        if event_type == 'grade' and not bindings.is_masquerading_as_specific_student:
             handle_grade_event(block, event_type, event)
         else:
             aside_context = {}
@@ -618,11 +723,13 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
         module.runtime = inner_system
         inner_system.xmodule_instance = module
 
+    bindings = _get_module_system_bindings(user, descriptor, course_id, request_token)
+
     # Build a list of wrapping functions that will be applied in order
     # to the Fragment content coming out of the xblocks that are about to be rendered.
     block_wrappers = []
 
-    if is_masquerading_as_specific_student(user, course_id):
+    if bindings.is_masquerading_as_specific_student:
         block_wrappers.append(filter_displayed_blocks)
 
     if settings.FEATURES.get("LICENSING", False):
@@ -658,30 +765,14 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
     # this will rewrite intra-courseware links (/jump_to_id/<id>). This format
     # is an improvement over the /course/... format for studio authored courses,
     # because it is agnostic to course-hierarchy.
-    # NOTE: module_id is empty string here. The 'module_id' will get assigned in the replacement
-    # function, we just need to specify something to get the reverse() to work.
     block_wrappers.append(partial(
         replace_jump_to_id_urls,
         course_id,
-        reverse('jump_to_id', kwargs={'course_id': course_id.to_deprecated_string(), 'module_id': ''}),
+        bindings.jump_to_id_base_url,
     ))
 
     if settings.FEATURES.get('DISPLAY_DEBUG_INFO_TO_STAFF'):
-        if is_masquerading_as_specific_student(user, course_id):
-            # When masquerading as a specific student, we want to show the debug button
-            # unconditionally to enable resetting the state of the student we are masquerading as.
-            # We already know the user has staff access when masquerading is active.
-            staff_access = True
-            # To figure out whether the user has instructor access, we temporarily remove the
-            # masquerade_settings from the real_user.  With the masquerading settings in place,
-            # the result would always be "False".
-            masquerade_settings = user.real_user.masquerade_settings
-            del user.real_user.masquerade_settings
-            instructor_access = bool(has_access(user.real_user, 'instructor', descriptor, course_id))
-            user.real_user.masquerade_settings = masquerade_settings
-        else:
-            staff_access = has_access(user, 'staff', descriptor, course_id)
-            instructor_access = bool(has_access(user, 'instructor', descriptor, course_id))
+        staff_access, instructor_access = bindings.staff_debug_info_access
         if staff_access:
             block_wrappers.append(partial(add_staff_markup, user, instructor_access, disable_staff_debug_info))
 
@@ -701,7 +792,10 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
 
     field_data = LmsFieldData(descriptor._field_data, student_data)  # pylint: disable=protected-access
 
-    user_is_staff = bool(has_access(user, u'staff', descriptor.location, course_id))
+    # LmsModuleSystem adds its own services to the dictionary it is given,
+    # so each module system gets a copy of the shared ones.
+    services = dict(bindings.services)
+    services['field-data'] = field_data
 
     system = LmsModuleSystem(
         track_function=track_function,
@@ -730,7 +824,7 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
         replace_jump_to_id_urls=partial(
             static_replace.replace_jump_to_id_urls,
             course_id=course_id,
-            jump_to_id_base_url=reverse('jump_to_id', kwargs={'course_id': course_id.to_deprecated_string(), 'module_id': ''})
+            jump_to_id_base_url=bindings.jump_to_id_base_url,
         ),
         node_path=settings.NODE_PATH,
         publish=publish,
@@ -743,16 +837,7 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
         mixins=descriptor.runtime.mixologist._mixins,  # pylint: disable=protected-access
         wrappers=block_wrappers,
         get_real_user=user_by_anonymous_id,
-        services={
-            'fs': FSService(),
-            'field-data': field_data,
-            'user': DjangoXBlockUserService(user, user_is_staff=user_is_staff),
-            "reverification": ReverificationService(),
-            'proctoring': ProctoringService(),
-            'milestones': milestones_helpers.get_service(),
-            'credit': CreditService(),
-            'bookmarks': BookmarksService(user=user),
-        },
+        services=services,
         get_user_role=lambda: get_user_role(user, course_id),
         descriptor_runtime=descriptor._runtime,  # pylint: disable=protected-access
         rebind_noauth_module_to_user=rebind_noauth_module_to_user,
@@ -770,13 +855,13 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
 
     system.set('position', position)
 
-    system.set(u'user_is_staff', user_is_staff)
-    system.set(u'user_is_admin', bool(has_access(user, u'staff', 'global')))
-    system.set(u'user_is_beta_tester', CourseBetaTesterRole(course_id).has_user(user))
+    system.set(u'user_is_staff', bindings.user_is_staff)
+    system.set(u'user_is_admin', bindings.user_is_admin)
+    system.set(u'user_is_beta_tester', bindings.user_is_beta_tester)
     system.set(u'days_early_for_beta', descriptor.days_early_for_beta)
 
     # make an ErrorDescriptor -- assuming that the descriptor's system is ok
-    if has_access(user, u'staff', descriptor.location, course_id):
+    if bindings.user_is_staff:
         system.error_descriptor_class = ErrorDescriptor
     else:
         system.error_descriptor_class = NonStaffErrorDescriptor
@@ -861,6 +946,33 @@ def load_single_xblock(request, user_id, course_id, usage_key_string, course=Non
     return instance
 
 
+def _is_stale_xqueue_reply(user_id, course_key, usage_key_string, queuekey):
+    """
+    Returns whether the user's state of a problem shows that it is no longer
+    waiting for the xqueue reply with the given queuekey, using a single query.
+    """
+    try:
+        usage_key = UsageKey.from_string(usage_key_string).map_into_course(course_key)
+    except InvalidKeyError:
+        return False
+
+    state = StudentModule.objects.filter(
+        student_id=user_id, course_id=course_key, module_state_key=usage_key
+    ).values_list('state', flat=True).first()
+    try:
+        correct_map = json.loads(state)['correct_map']
+    except (TypeError, ValueError, KeyError):
+        correct_map = None
+    if not isinstance(correct_map, dict):
+        # Without a correct map to go by, let the problem decide.
+        return False
+
+    return not any(
+        (answer.get('queuestate') or {}).get('key') == queuekey
+        for answer in correct_map.itervalues()
+    )
+
+
 @csrf_exempt
 def xqueue_callback(request, course_id, userid, mod_id, dispatch):
     '''
@@ -881,6 +993,12 @@ def xqueue_callback(request, course_id, userid, mod_id, dispatch):
 
     course_key = CourseKey.from_string(course_id)
 
+    # Scores for submissions that are no longer pending don't change the
+    # problem, so they are dropped without loading it.
+    if dispatch == 'score_update' and _is_stale_xqueue_reply(userid, course_key, mod_id, header['lms_key']):
+        log.info(u"Ignoring xqueue reply %s to a submission that is no longer pending", header['lms_key'])
+        return HttpResponse("")
+
     with modulestore().bulk_operations(course_key):
         course = modulestore().get_course(course_key, depth=0)
 
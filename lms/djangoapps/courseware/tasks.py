@@ -0,0 +1,41 @@
+"""
+Celery tasks used by the courseware.
+"""
+from celery.task import task
+from celery.utils.log import get_task_logger
+from django.conf import settings
+
+from .xqueue import create_xqueue_interface
+
+LOGGER = get_task_logger(__name__)
+
+# Shared by the tasks run by a worker, so that its session with xqueue
+# is reused rather than logging in again for every submission.
+XQUEUE_INTERFACE = create_xqueue_interface()
+
+
+@task(
+    bind=True,
+    default_retry_delay=settings.XQUEUE_SUBMISSION_DEFAULT_RETRY_DELAY,
+    max_retries=settings.XQUEUE_SUBMISSION_MAX_RETRIES,
+)
+def send_to_xqueue(self, header, body):
+    """
+    Posts a submission deferred by DeferredXQueueInterface to xqueue, and
+    retries it with exponentially longer delays if xqueue does not accept it.
+
+    If the submission can't be delivered, the learner's answer stays queued
+    until XQUEUE_WAITTIME_BETWEEN_REQUESTS has passed, after which it can
+    be submitted again.
+    """
+    error, msg = XQUEUE_INTERFACE.send_to_queue(header, body)
+    if not error:
+        return
+
+    if self.request.retries < self.max_retries:
+        LOGGER.warning(
+            u"Failed to submit to xqueue (attempt %d), retrying: %s", self.request.retries + 1, msg
+        )
+        raise self.retry(countdown=self.default_retry_delay * 2 ** self.request.retries)
+
+    LOGGER.error(u"Failed to submit to xqueue after %d attempts, giving up: %s", self.request.retries + 1, msg)
@@ -0,0 +1,88 @@
+"""
+Tests of the cache of the decisions about the access of users to courses.
+"""
+from django.contrib.auth.models import AnonymousUser
+from mock import Mock, patch
+from nose.plugins.attrib import attr
+from opaque_keys.edx.locations import SlashSeparatedCourseKey
+
+from courseware.access import has_access
+from courseware.access_cache import COURSE_ACCESS_CACHE_TIMEOUT, MAX_CACHED_COURSES, get_course_access_decision
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+from student.models import CourseEnrollment
+from student.roles import CourseStaffRole
+from student.tests.factories import CourseEnrollmentFactory, UserFactory
+
+
+@attr(shard=1)
+class CourseAccessDecisionTest(CacheIsolationTestCase):
+    """
+    Tests of get_course_access_decision.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(CourseAccessDecisionTest, self).setUp()
+        self.user = UserFactory()
+        self.course_key = SlashSeparatedCourseKey('edX', 'toy', '2012_Fall')
+
+    def test_decision_is_cached(self):
+        compute = Mock(return_value=True)
+        for __ in range(2):
+            self.assertTrue(get_course_access_decision(self.user, self.course_key, 'enrolled', compute))
+        self.assertEqual(compute.call_count, 1)
+
+        other_course_key = SlashSeparatedCourseKey('edX', 'other', '2012_Fall')
+        self.assertTrue(get_course_access_decision(self.user, other_course_key, 'enrolled', compute))
+        self.assertTrue(get_course_access_decision(self.user, self.course_key, 'staff_role', compute))
+        self.assertEqual(compute.call_count, 3)
+
+    def test_anonymous_decision_is_not_cached(self):
+        compute = Mock(return_value=False)
+        for __ in range(2):
+            self.assertFalse(get_course_access_decision(AnonymousUser(), self.course_key, 'enrolled', compute))
+        self.assertEqual(compute.call_count, 2)
+
+    def test_decision_expires(self):
+        compute = Mock(return_value=True)
+        with patch('courseware.access_cache.time', return_value=1000):
+            get_course_access_decision(self.user, self.course_key, 'enrolled', compute)
+        with patch('courseware.access_cache.time', return_value=1000 + COURSE_ACCESS_CACHE_TIMEOUT):
+            get_course_access_decision(self.user, self.course_key, 'enrolled', compute)
+        self.assertEqual(compute.call_count, 2)
+
+    def test_cached_courses_are_bounded(self):
+        compute = Mock(return_value=True)
+        for course in range(MAX_CACHED_COURSES + 1):
+            course_key = SlashSeparatedCourseKey('edX', 'course{}'.format(course), '2012_Fall')
+            get_course_access_decision(self.user, course_key, 'enrolled', compute)
+        get_course_access_decision(self.user, self.course_key, 'enrolled', compute)
+        self.assertEqual(compute.call_count, MAX_CACHED_COURSES + 2)
+
+    def test_enrollment_change_invalidates(self):
+        self.assertFalse(self._is_enrolled())
+        enrollment = CourseEnrollmentFactory(user=self.user, course_id=self.course_key)
+        self.assertTrue(self._is_enrolled())
+        enrollment.delete()
+        self.assertFalse(self._is_enrolled())
+
+    @patch('student.tasks.send_bulk_enrollment_signals')
+    def test_bulk_enrollment_invalidates(self, _mock_send_signals):
+        self.assertFalse(self._is_enrolled())
+        CourseEnrollment.bulk_enroll([self.user], self.course_key, 'audit')
+        self.assertTrue(self._is_enrolled())
+
+    def test_role_change_invalidates(self):
+        self.assertFalse(has_access(self.user, 'staff', self.course_key))
+        CourseStaffRole(self.course_key).add_users(self.user)
+        self.assertTrue(has_access(self.user, 'staff', self.course_key))
+        CourseStaffRole(self.course_key).remove_users(self.user)
+        self.assertFalse(has_access(self.user, 'staff', self.course_key))
+
+    def _is_enrolled(self):
+        """
+        Returns the cached decision about the enrollment of the user in the course.
+        """
+        return get_course_access_decision(
+            self.user, self.course_key, 'enrolled', lambda: CourseEnrollment.is_enrolled(self.user, self.course_key)
+        )
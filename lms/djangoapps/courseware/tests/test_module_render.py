@@ -222,6 +222,41 @@ class ModuleRenderTestCase(SharedModuleStoreTestCase, LoginEnrollmentTestCase):
         request.POST['queuekey'] = fake_key
         self.mock_module.handle_ajax.assert_called_once_with(self.dispatch, request.POST)
 
+    @ddt.data(('fake key', True), ('previous key', False))
+    @ddt.unpack
+    def test_xqueue_callback_pending_submission(self, pending_key, is_delivered):
+        """
+        Test that replies to submissions which are no longer pending are
+        dropped without loading the problem.
+        """
+        user = UserFactory()
+        usage_key = self.course_key.make_usage_key('problem', 'code_problem')
+        StudentModuleFactory.create(
+            student=user,
+            course_id=self.course_key,
+            module_state_key=usage_key,
+            state=json.dumps({
+                'correct_map': {
+                    'answer_1': {'queuestate': {'key': pending_key, 'time': '20161018000000'}},
+                    'answer_2': {'queuestate': None},
+                },
+            }),
+        )
+        data = {
+            'xqueue_header': json.dumps({'lms_key': 'fake key'}),
+            'xqueue_body': 'hello world',
+        }
+
+        with patch('courseware.module_render.load_single_xblock', return_value=self.mock_module) as mock_load:
+            request = self.request_factory.post(self.callback_url, data)
+            response = render.xqueue_callback(
+                request, unicode(self.course_key), user.id, unicode(usage_key), self.dispatch
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_load.called, is_delivered)
+        self.assertEqual(self.mock_module.handle_ajax.called, is_delivered)
+
     def test_xqueue_callback_missing_header_info(self):
         data = {
             'xqueue_header': '{}',
@@ -2030,6 +2065,39 @@ class LMSXBlockServiceBindingTest(SharedModuleStoreTestCase):
         self.assertFalse(runtime.user_is_beta_tester)
         self.assertEqual(runtime.days_early_for_beta, 5)
 
+    @XBlock.register_temp_plugin(PureXBlock, identifier='pure')
+    @ddt.data((Mock(), True), (None, False))
+    @ddt.unpack
+    @patch.dict('django.conf.settings.FEATURES', {'DISPLAY_DEBUG_INFO_TO_STAFF': False})
+    def test_bindings_shared_during_request(self, request_token, shared):
+        """
+        Tests that the blocks bound to a user during a request share the services and
+        access checks that don't depend on the block.
+        """
+        descriptors = [ItemFactory(category="pure", parent=self.course) for __ in range(2)]
+        with patch('courseware.module_render.has_access', wraps=render.has_access) as mock_has_access:
+            runtimes = [
+                render.get_module_system_for_user(
+                    self.user,
+                    self.student_data,
+                    descriptor,
+                    self.course.id,
+                    self.track_function,
+                    self.xqueue_callback_url_prefix,
+                    request_token,
+                    course=self.course
+                )[0]
+                for descriptor in descriptors
+            ]
+
+        user_services = [runtime.service(descriptor, 'user') for runtime, descriptor in zip(runtimes, descriptors)]
+        self.assertEqual(user_services[0] is user_services[1], shared)
+        self.assertEqual(mock_has_access.call_count, 2 if shared else 4)
+        self.assertIsNot(
+            runtimes[0].service(descriptors[0], 'field-data'),
+            runtimes[1].service(descriptors[1], 'field-data'),
+        )
+
 
 class PureXBlockWithChildren(PureXBlock):
     """
@@ -0,0 +1,57 @@
+"""
+Tests for the courseware xqueue interfaces and the task submitting to xqueue.
+"""
+import json
+
+from django.test import TestCase
+from django.test.utils import override_settings
+from mock import Mock, patch
+
+from capa.xqueue_interface import XQueueInterface
+from courseware.xqueue import create_xqueue_interface, DeferredXQueueInterface, DEFERRED_SUBMISSION_MSG
+
+
+class DeferredXQueueInterfaceTest(TestCase):
+    """
+    Tests for DeferredXQueueInterface and the send_to_xqueue task.
+    """
+    def setUp(self):
+        super(DeferredXQueueInterfaceTest, self).setUp()
+        self.interface = create_xqueue_interface(deferred=True)
+        self.header = json.dumps({'lms_callback_url': 'callback', 'lms_key': 'key', 'queue_name': 'queue'})
+        self.body = json.dumps({'student_response': 'print "hello"'})
+
+    def test_create_xqueue_interface(self):
+        self.assertIsInstance(self.interface, DeferredXQueueInterface)
+        self.assertNotIsInstance(create_xqueue_interface(), DeferredXQueueInterface)
+
+    @override_settings(XQUEUE_INTERFACE={'url': 'http://xqueue', 'django_auth': {}, 'basic_auth': ('user', 'pass')})
+    def test_basic_auth(self):
+        self.assertEqual(create_xqueue_interface().session.auth.username, 'user')
+
+    @patch('courseware.tasks.XQUEUE_INTERFACE.send_to_queue', return_value=(0, '1'))
+    def test_submission_is_deferred(self, mock_send_to_queue):
+        self.assertEqual(self.interface.send_to_queue(self.header, self.body), (0, DEFERRED_SUBMISSION_MSG))
+        mock_send_to_queue.assert_called_once_with(self.header, self.body)
+
+    @patch('courseware.tasks.XQUEUE_INTERFACE.send_to_queue')
+    def test_submission_with_files_is_not_deferred(self, mock_deferred_send_to_queue):
+        files = [Mock(name='prog1.py')]
+        with patch.object(XQueueInterface, 'send_to_queue', return_value=(0, '1')) as mock_send_to_queue:
+            self.assertEqual(self.interface.send_to_queue(self.header, self.body, files), (0, '1'))
+        mock_send_to_queue.assert_called_once_with(self.header, self.body, files)
+        self.assertFalse(mock_deferred_send_to_queue.called)
+
+    @patch('courseware.tasks.send_to_xqueue.retry')
+    @patch('courseware.tasks.XQUEUE_INTERFACE.send_to_queue', return_value=(1, 'cannot connect to server'))
+    def test_failed_submission_is_retried(self, mock_send_to_queue, mock_retry):
+        self.interface.send_to_queue(self.header, self.body)
+        self.assertTrue(mock_send_to_queue.called)
+        self.assertTrue(mock_retry.called)
+
+    @patch('courseware.tasks.send_to_xqueue.retry')
+    @patch('courseware.tasks.XQUEUE_INTERFACE.send_to_queue', return_value=(0, '1'))
+    def test_successful_submission_is_not_retried(self, mock_send_to_queue, mock_retry):
+        self.interface.send_to_queue(self.header, self.body)
+        self.assertTrue(mock_send_to_queue.called)
+        self.assertFalse(mock_retry.called)
@@ -0,0 +1,52 @@
+"""
+Interfaces the LMS uses to submit answers to the external grading queue (xqueue).
+"""
+from django.conf import settings
+from requests.auth import HTTPBasicAuth
+
+from capa.xqueue_interface import XQueueInterface
+
+# Reply returned for submissions that are handed over to a celery task. Like
+# the queue length xqueue replies with, it is only used to flag the answer as
+# queued.
+DEFERRED_SUBMISSION_MSG = u'queued'
+
+
+def create_xqueue_interface(deferred=False):
+    """
+    Returns an interface to the xqueue configured in the XQUEUE_INTERFACE
+    setting, which defers submissions to a celery task if `deferred` is True.
+    """
+    if settings.XQUEUE_INTERFACE.get('basic_auth') is not None:
+        requests_auth = HTTPBasicAuth(*settings.XQUEUE_INTERFACE['basic_auth'])
+    else:
+        requests_auth = None
+
+    interface_class = DeferredXQueueInterface if deferred else XQueueInterface
+    return interface_class(
+        settings.XQUEUE_INTERFACE['url'],
+        settings.XQUEUE_INTERFACE['django_auth'],
+        requests_auth,
+    )
+
+
+class DeferredXQueueInterface(XQueueInterface):
+    """
+    XQueueInterface that hands submissions over to the send_to_xqueue celery
+    task, which posts them to xqueue (logging in again if needed) and retries
+    the ones xqueue does not accept.
+
+    Once the task is enqueued, the submission is durably stored by the celery
+    broker, so the learner's request doesn't wait on xqueue. Submissions with
+    files are still posted right away, since the uploaded files only exist for
+    the duration of the request.
+    """
+    def send_to_queue(self, header, body, files_to_upload=None):
+        if files_to_upload is not None:
+            return super(DeferredXQueueInterface, self).send_to_queue(header, body, files_to_upload)
+
+        # Import here to avoid a circular import between this module and the tasks.
+        from courseware.tasks import send_to_xqueue
+
+        send_to_xqueue.apply_async(args=(header, body), routing_key=settings.XQUEUE_SUBMISSION_ROUTING_KEY)
+        return (0, DEFERRED_SUBMISSION_MSG)
@@ -2,12 +2,15 @@
 Functionality for course-level grades.
 """
 from collections import namedtuple
+from itertools import islice
 from logging import getLogger
 
 import dogstats_wrapper as dog_stats_api
 
 from opaque_keys.edx.keys import CourseKey
 from courseware.courses import get_course_by_id
+from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
+from student.models import ANONYMOUS_ID_BATCH_SIZE, anonymous_ids_for_users
 from .new.course_grade import CourseGradeFactory
 
 
@@ -42,28 +45,45 @@ def iterate_grades_for(course_or_id, students):
     else:
         course = course_or_id
 
-    for student in students:
-        with dog_stats_api.timer('lms.grades.iterate_grades_for', tags=[u'action:{}'.format(course.id)]):
-            try:
-                gradeset = summary(student, course)
-                yield GradeResult(student, gradeset, "")
-            except Exception as exc:  # pylint: disable=broad-except
-                # Keep marching on even if this student couldn't be graded for
-                # some reason, but log it for future reference.
-                log.exception(
-                    'Cannot grade student %s (%s) in course %s because of exception: %s',
-                    student.username,
-                    student.id,
-                    course.id,
-                    exc.message
-                )
-                yield GradeResult(student, {}, exc.message)
-
-
-def summary(student, course):
+    # All students are graded against the same collected course structure,
+    # rather than fetching it from the cache for each one of them.
+    collected_block_structure = get_course_in_cache(course.id)
+
+    students = iter(students)
+    while True:
+        students_batch = list(islice(students, ANONYMOUS_ID_BATCH_SIZE))
+        if not students_batch:
+            break
+
+        # Compute and save the anonymous ids of the batch of students up
+        # front, rather than once per student while fetching their scores.
+        anonymous_ids_for_users(students_batch, course.id)
+
+        for student in students_batch:
+            with dog_stats_api.timer('lms.grades.iterate_grades_for', tags=[u'action:{}'.format(course.id)]):
+                try:
+                    gradeset = summary(student, course, collected_block_structure=collected_block_structure)
+                    yield GradeResult(student, gradeset, "")
+                except Exception as exc:  # pylint: disable=broad-except
+                    # Keep marching on even if this student couldn't be graded for
+                    # some reason, but log it for future reference.
+                    log.exception(
+                        'Cannot grade student %s (%s) in course %s because of exception: %s',
+                        student.username,
+                        student.id,
+                        course.id,
+                        exc.message
+                    )
+                    yield GradeResult(student, {}, exc.message)
+
+
+def summary(student, course, collected_block_structure=None):
     """
     Returns the grade summary of the student for the given course.
 
     Also sends a signal to update the minimum grade requirement status.
+
+    The collected block structure of the course can optionally be provided
+    if already available, for optimization.
     """
-    return CourseGradeFactory(student).create(course).summary
+    return CourseGradeFactory(student).create(course, collected_block_structure).summary
@@ -208,11 +208,18 @@ class CourseGradeFactory(object):
     def __init__(self, student):
         self.student = student
 
-    def create(self, course):
+    def create(self, course, collected_block_structure=None):
         """
         Returns the CourseGrade object for the given student and course.
+
+        The collected block structure of the course can optionally be
+        provided if already available, for optimization.
         """
-        course_structure = get_course_blocks(self.student, course.location)
+        course_structure = get_course_blocks(
+            self.student,
+            course.location,
+            collected_block_structure=collected_block_structure,
+        )
         return (
             self._get_saved_grade(course, course_structure) or
             self._compute_and_update_grade(course, course_structure)
@@ -31,7 +31,7 @@ from ..new.course_grade import CourseGrade, CourseGradeFactory
 from ..new.subsection_grade import SubsectionGradeFactory
 
 
-def _grade_with_errors(student, course):
+def _grade_with_errors(student, course, **kwargs):
     """This fake grade method will throw exceptions for student3 and
     student4, but allow any other students to go through normal grading.
 
@@ -42,7 +42,7 @@ def _grade_with_errors(student, course):
     if student.username in ['student3', 'student4']:
         raise Exception("I don't like {}".format(student.username))
 
-    return grades_summary(student, course)
+    return grades_summary(student, course, **kwargs)
 
 
 @attr(shard=1)
@@ -42,9 +42,10 @@ from certificates.models import (
     CertificateWhitelist,
     certificate_info_for_user,
     CertificateStatuses,
-    GeneratedCertificate
+    GeneratedCertificate,
+    clear_student_certificates_cache,
 )
-from certificates.api import generate_user_certificates
+from certificates.api import generate_certificates_for_students
 from courseware.courses import get_course_by_id, get_problems_in_section
 from lms.djangoapps.grades.course_grades import iterate_grades_for
 from courseware.models import StudentModule
@@ -60,11 +61,17 @@ from instructor_analytics.csvs import format_dictlist
 from openassessment.data import OraAggregateData
 from instructor_task.models import ReportStore, InstructorTask, PROGRESS
 from lms.djangoapps.lms_xblock.runtime import LmsPartitionService
-from openedx.core.djangoapps.course_groups.cohorts import get_cohort
+from openedx.core.djangoapps.course_groups.cohorts import get_cohort_membership_map
 from openedx.core.djangoapps.course_groups.models import CourseUserGroup
 from openedx.core.djangoapps.content.course_structures.models import CourseStructure
 from opaque_keys.edx.keys import UsageKey
-from openedx.core.djangoapps.course_groups.cohorts import add_user_to_cohort, is_course_cohorted
+from openedx.core.djangoapps.course_groups.cohorts import (
+    BULK_COHORT_ADDED,
+    BULK_COHORT_BATCH_SIZE,
+    BULK_COHORT_NOT_FOUND,
+    bulk_add_users_to_cohorts,
+    is_course_cohorted,
+)
 from student.models import CourseEnrollment, CourseAccessRole
 from lms.djangoapps.teams.models import CourseTeamMembership
 from lms.djangoapps.verify_student.models import SoftwareSecurePhotoVerification
@@ -83,6 +90,9 @@ UPDATE_STATUS_SKIPPED = 'skipped'
 # The setting name used for events when "settings" (account settings, preferences, profile information) change.
 REPORT_REQUESTED_EVENT_NAME = u'edx.instructor.report.requested'
 
+# Number of students whose certificates are generated together.
+CERTIFICATE_GENERATION_BATCH_SIZE = 100
+
 
 class BaseInstructorTask(Task):
     """
@@ -710,6 +720,9 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
 
         total_enrolled_students
     )
+    # Fetch every learner's cohort with a single query instead of one per row.
+    cohort_membership_map = get_cohort_membership_map(course_id) if course_is_cohorted else {}
+
     for student, gradeset, err_msg in iterate_grades_for(course_id, enrolled_students):
         # Periodically update task status (this is a cache write)
         if task_progress.attempted % status_interval == 0:
@@ -747,7 +760,7 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
 
             cohorts_group_name = []
             if course_is_cohorted:
-                group = get_cohort(student, course_id, assign=False)
+                group = cohort_membership_map.get(student.id)
                 cohorts_group_name.append(group.name if group else '')
 
             group_configs_group_names = []
@@ -1455,19 +1468,18 @@ def generate_students_certificates(
     task_progress.update_task_state(extra_meta=current_step)
 
     course = modulestore().get_course(course_id, depth=0)
-    # Generate certificate for each student
-    for student in students_require_certs:
-        task_progress.attempted += 1
-        status = generate_user_certificates(
-            student,
-            course_id,
-            course=course
-        )
+    # Generate certificates for batches of students
+    students_require_certs = list(students_require_certs)
+    for batch_start in xrange(0, len(students_require_certs), CERTIFICATE_GENERATION_BATCH_SIZE):
+        students = students_require_certs[batch_start:batch_start + CERTIFICATE_GENERATION_BATCH_SIZE]
+        statuses = generate_certificates_for_students(students, course_id, course=course)
 
-        if CertificateStatuses.is_passing_status(status):
-            task_progress.succeeded += 1
-        else:
-            task_progress.failed += 1
+        for student in students:
+            task_progress.attempted += 1
+            if CertificateStatuses.is_passing_status(statuses[student.id]):
+                task_progress.succeeded += 1
+            else:
+                task_progress.failed += 1
 
     return task_progress.update_task_state(extra_meta=current_step)
 
@@ -1497,6 +1509,27 @@ def cohort_students_and_upload(_xmodule_instance_args, _entry_id, course_id, tas
     # redundant cohort queries.
     cohorts_status = {}
 
+    def _apply_pending_assignments(pending):
+        """
+        Cohorts a batch of (username_or_email, cohort_name) rows and records the outcome.
+        """
+        results = bulk_add_users_to_cohorts(
+            course_id,
+            [(username_or_email, cohorts_status[cohort_name]['cohort']) for username_or_email, cohort_name in pending],
+        )
+        for (username_or_email, cohort_name), result in zip(pending, results):
+            if result == BULK_COHORT_ADDED:
+                cohorts_status[cohort_name]['Students Added'] += 1
+                task_progress.succeeded += 1
+            elif result == BULK_COHORT_NOT_FOUND:
+                cohorts_status[cohort_name]['Students Not Found'].add(username_or_email)
+                task_progress.failed += 1
+            else:
+                # The user is already in the given cohort
+                task_progress.skipped += 1
+        task_progress.update_task_state(extra_meta=current_step)
+
+    pending_assignments = []
     with DefaultStorage().open(task_input['file_name']) as f:
         for row in unicodecsv.DictReader(UniversalNewlineIterator(f), encoding='utf-8'):
             # Try to use the 'email' field to identify the user.  If it's not present, use 'username'.
@@ -1524,18 +1557,13 @@ def cohort_students_and_upload(_xmodule_instance_args, _entry_id, course_id, tas
                 task_progress.failed += 1
                 continue
 
-            try:
-                add_user_to_cohort(cohorts_status[cohort_name]['cohort'], username_or_email)
-                cohorts_status[cohort_name]['Students Added'] += 1
-                task_progress.succeeded += 1
-            except User.DoesNotExist:
-                cohorts_status[cohort_name]['Students Not Found'].add(username_or_email)
-                task_progress.failed += 1
-            except ValueError:
-                # Raised when the user is already in the given cohort
-                task_progress.skipped += 1
+            pending_assignments.append((username_or_email, cohort_name))
+            if len(pending_assignments) >= BULK_COHORT_BATCH_SIZE:
+                _apply_pending_assignments(pending_assignments)
+                pending_assignments = []
 
-            task_progress.update_task_state(extra_meta=current_step)
+    if pending_assignments:
+        _apply_pending_assignments(pending_assignments)
 
     current_step['step'] = 'Uploading CSV'
     task_progress.update_task_state(extra_meta=current_step)
@@ -1606,6 +1634,8 @@ def invalidate_generated_certificates(course_id, enrolled_students, certificate_
         status__in=certificate_statuses,
     )
 
+    student_ids = list(certificates.values_list('user_id', flat=True))
+
     # Mark generated certificates as 'unavailable' and update download_url, download_uui, verify_uuid and
     # grade with empty string for each row
     certificates.update(
@@ -1615,6 +1645,7 @@ def invalidate_generated_certificates(course_id, enrolled_students, certificate_
         download_url='',
         grade='',
     )
+    clear_student_certificates_cache(student_ids)
 
 
 def upload_ora2_data(
@@ -1671,7 +1671,7 @@ class TestCertificateGeneration(InstructorTaskModuleTestCase):
             'skipped': 2
         }
 
-        with self.assertNumQueries(151):
+        with self.assertNumQueries(73):
             self.assertCertificatesGenerated(task_input, expected_results)
 
     @ddt.data(
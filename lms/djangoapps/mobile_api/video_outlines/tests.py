@@ -8,6 +8,7 @@ from uuid import uuid4
 from collections import namedtuple
 
 import ddt
+from mock import patch
 from nose.plugins.attrib import attr
 from edxval import api
 from xmodule.modulestore.tests.factories import ItemFactory
@@ -457,6 +458,19 @@ class TestVideoSummaryList(TestVideoAPITestCase, MobileAuthTestMixin, MobileCour
         self.assertEqual(course_outline[0]["summary"]["category"], "video")
         self.assertTrue(course_outline[0]["summary"]["only_on_web"])
 
+    def test_served_from_collected_block_structure(self):
+        self.login_and_enroll()
+        self._create_video_with_subs()
+        course_outline = self.api_response().data
+        self.assertEqual(len(course_outline), 1)
+
+        # Once collected, serving the outline no longer inspects the video descriptors.
+        with patch(
+            'xmodule.video_module.VideoDescriptor.get_transcripts_info',
+            side_effect=AssertionError('video descriptor accessed'),
+        ):
+            self.assertEqual(self.api_response().data, course_outline)
+
     def test_mobile_api_config(self):
         """
         Tests VideoSummaryList with different MobileApiConfig video_profiles
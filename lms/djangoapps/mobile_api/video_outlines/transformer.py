@@ -0,0 +1,110 @@
+"""
+Video Outline Transformer
+"""
+from openedx.core.lib.block_structure.transformer import BlockStructureTransformer
+
+
+class VideoOutlineTransformer(BlockStructureTransformer):
+    """
+    The VideoOutlineTransformer collects, for every video in a course, the
+    data the mobile video outline needs so that serving the outline only
+    requires the per-user access transformations.
+
+    No runtime transformations are performed.
+
+    The following values are stored as xblock_fields on their respective blocks in the
+    block structure:
+
+        display_name: (string)
+        hide_from_toc: (boolean)
+        only_on_web: (boolean) videos only
+        edx_video_id: (string) videos only
+        html5_sources: (list) videos only
+        source: (string) videos only
+
+    Additionally, the following values are calculated and stored as
+    transformer_block_fields for each video:
+
+        outline_location: (dict) the video's path in the course and the
+            chapter, section and position used to build its courseware urls
+        transcript_languages: (list) languages the video has transcripts in
+        transcript_language: (string) the video's default transcript language
+    """
+    VERSION = 1
+    FIELDS_TO_COLLECT = [
+        u'display_name', u'hide_from_toc', u'only_on_web', u'edx_video_id', u'html5_sources', u'source',
+    ]
+    VIDEO_BLOCK_TYPES = ['video']
+
+    @classmethod
+    def name(cls):
+        """
+        Unique identifier for the transformer's class;
+        same identifier used in setup.py.
+        """
+        return u'video_outline'
+
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collects any information that's necessary to execute this
+        transformer's transform method.
+        """
+        block_structure.request_xblock_fields(*cls.FIELDS_TO_COLLECT)
+
+        # Ancestors of each block, from the root down to its parent,
+        # following the first parent of blocks that have several.
+        ancestors = {}
+        for block_key in block_structure.topological_traversal():
+            parents = block_structure.get_parents(block_key)
+            ancestors[block_key] = ancestors[parents[0]] + [parents[0]] if parents else []
+
+            if block_key.block_type in cls.VIDEO_BLOCK_TYPES:
+                video = block_structure.get_xblock(block_key)
+                transcripts_info = video.get_transcripts_info()
+                block_structure.set_transformer_block_field(
+                    block_key, cls, 'outline_location', cls._outline_location(block_structure, ancestors[block_key]),
+                )
+                block_structure.set_transformer_block_field(
+                    block_key, cls, 'transcript_languages',
+                    video.available_translations(transcripts_info, verify_assets=False),
+                )
+                block_structure.set_transformer_block_field(
+                    block_key, cls, 'transcript_language', video.get_default_transcript_language(transcripts_info),
+                )
+
+    @staticmethod
+    def _outline_location(block_structure, ancestors):
+        """
+        Returns the path of a video with the given ancestors, along with the
+        chapter, section and position of the unit it lives in.
+        """
+        ancestor_blocks = [block_structure.get_xblock(ancestor_key) for ancestor_key in ancestors]
+        position = None
+        if len(ancestor_blocks) > 3:
+            position = 1
+            for child in ancestor_blocks[2].children:
+                if child.name == ancestor_blocks[3].url_name:
+                    break
+                position += 1
+
+        return {
+            'path': [
+                {
+                    # to be consistent with other edx-platform clients, return the defaulted display name
+                    'name': block.display_name_with_default_escaped,
+                    'category': block.category,
+                    'id': unicode(block.location),
+                }
+                for block in ancestor_blocks[1:]
+            ],
+            'chapter': ancestor_blocks[1].location.block_id if len(ancestor_blocks) > 1 else None,
+            'section': ancestor_blocks[2].url_name if len(ancestor_blocks) > 2 else None,
+            'position': position,
+        }
+
+    def transform(self, usage_info, block_structure):
+        """
+        Perform no transformations.
+        """
+        pass
@@ -15,6 +15,7 @@ from rest_framework import generics
 from rest_framework.response import Response
 from opaque_keys.edx.locator import BlockUsageLocator
 
+from lms.djangoapps.course_blocks.api import get_course_blocks
 from xmodule.exceptions import NotFoundError
 from xmodule.modulestore.django import modulestore
 
@@ -74,13 +75,13 @@ class VideoSummaryList(generics.ListAPIView):
               Management System.
     """
 
-    @mobile_course_access(depth=None)
+    @mobile_course_access()
     def list(self, request, course, *args, **kwargs):
         video_profiles = MobileApiConfig.get_video_profiles()
         video_outline = list(
             BlockOutline(
                 course.id,
-                course,
+                get_course_blocks(request.user, course.location),
                 {"video": partial(video_summary, video_profiles)},
                 request,
                 video_profiles,
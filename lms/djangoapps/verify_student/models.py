@@ -221,6 +221,21 @@ class PhotoVerification(StatusModel):
                              or cls._earliest_allowed_date())
         ).exists()
 
+    @classmethod
+    def verified_user_ids(cls, user_ids, earliest_allowed_date=None):
+        """
+        Return the set of the ids, among `user_ids`, of the users that have
+        satisfactorily proved their identity.
+
+        This is the bulk version of `user_is_verified`.
+        """
+        return set(cls.objects.filter(
+            user_id__in=user_ids,
+            status="approved",
+            created_at__gte=(earliest_allowed_date
+                             or cls._earliest_allowed_date())
+        ).values_list('user_id', flat=True))
+
     @classmethod
     def verification_valid_or_pending(cls, user, earliest_allowed_date=None, queryset=None):
         """
@@ -151,6 +151,17 @@ DEFAULT_COURSE_ABOUT_IMAGE_URL = ENV_TOKENS.get('DEFAULT_COURSE_ABOUT_IMAGE_URL'
 MEDIA_ROOT = ENV_TOKENS.get('MEDIA_ROOT', MEDIA_ROOT)
 MEDIA_URL = ENV_TOKENS.get('MEDIA_URL', MEDIA_URL)
 
+MAKO_PRECOMPILE_TEMPLATES = ENV_TOKENS.get('MAKO_PRECOMPILE_TEMPLATES', MAKO_PRECOMPILE_TEMPLATES)
+LAZY_STARTUP = ENV_TOKENS.get('LAZY_STARTUP', LAZY_STARTUP)
+
+REQUEST_PROFILING_SAMPLE_RATE = ENV_TOKENS.get('REQUEST_PROFILING_SAMPLE_RATE', REQUEST_PROFILING_SAMPLE_RATE)
+REQUEST_PROFILING_SAMPLER_INTERVAL = ENV_TOKENS.get(
+    'REQUEST_PROFILING_SAMPLER_INTERVAL', REQUEST_PROFILING_SAMPLER_INTERVAL
+)
+
+QUERY_BUDGETS = ENV_TOKENS.get('QUERY_BUDGETS', QUERY_BUDGETS)
+DEFAULT_QUERY_BUDGET = ENV_TOKENS.get('DEFAULT_QUERY_BUDGET', DEFAULT_QUERY_BUDGET)
+
 PLATFORM_NAME = ENV_TOKENS.get('PLATFORM_NAME', PLATFORM_NAME)
 # For displaying on the receipt. At Stanford PLATFORM_NAME != MERCHANT_NAME, but PLATFORM_NAME is a fine default
 PLATFORM_TWITTER_ACCOUNT = ENV_TOKENS.get('PLATFORM_TWITTER_ACCOUNT', PLATFORM_TWITTER_ACCOUNT)
@@ -680,6 +691,8 @@ if FEATURES.get('ENABLE_OAUTH2_PROVIDER'):
     )
     OAUTH_ID_TOKEN_EXPIRATION = ENV_TOKENS.get('OAUTH_ID_TOKEN_EXPIRATION', OAUTH_ID_TOKEN_EXPIRATION)
 
+EDX_API_DATA_STALE_TTL = ENV_TOKENS.get('EDX_API_DATA_STALE_TTL', EDX_API_DATA_STALE_TTL)
+
 
 ##### ADVANCED_SECURITY_CONFIG #####
 ADVANCED_SECURITY_CONFIG = ENV_TOKENS.get('ADVANCED_SECURITY_CONFIG', {})
@@ -356,6 +356,18 @@ FEATURES = {
     # lives in the Extended table, saving the frontend from
     # making multiple queries.
     'ENABLE_READING_FROM_MULTIPLE_HISTORY_TABLES': True,
+
+    # Hand answers submitted to externally graded problems over to a celery
+    # task rather than posting them to xqueue while the learner waits.
+    'ENABLE_DEFERRED_XQUEUE_SUBMISSION': False,
+
+    # Time each middleware and view of the requests, and sample the stacks of
+    # some of them. See performance.profiling.
+    'ENABLE_REQUEST_PROFILING': False,
+
+    # Record the queries made by each request and log the requests exceeding
+    # the QUERY_BUDGETS of their endpoint. See performance.middleware.
+    'ENABLE_QUERY_BUDGETS': False,
 }
 
 # Ignore static asset files on import which match this pattern
@@ -399,6 +411,8 @@ NODE_PATH = ':'.join(node_paths)
 # For geolocation ip database
 GEOIP_PATH = REPO_ROOT / "common/static/data/geoip/GeoIP.dat"
 GEOIPV6_PATH = REPO_ROOT / "common/static/data/geoip/GeoIPv6.dat"
+# Number of IP address lookups remembered by each process
+GEOIP_CACHE_SIZE = 10000
 
 # Where to look for a status message
 STATUS_MESSAGE_PATH = ENV_ROOT / "status_message.json"
@@ -454,6 +468,9 @@ OAUTH2_PROVIDER = {
 # TODO: Move the Mako templating into a different engine in TEMPLATES below.
 import tempfile
 MAKO_MODULE_DIR = os.path.join(tempfile.gettempdir(), 'mako_lms')
+# Whether to compile all the mako templates when the wsgi application is loaded,
+# rather than when they are first rendered.
+MAKO_PRECOMPILE_TEMPLATES = False
 MAKO_TEMPLATES = {}
 MAKO_TEMPLATES['main'] = [PROJECT_ROOT / 'templates',
                           COMMON_ROOT / 'templates',
@@ -738,6 +755,11 @@ MODULESTORE = {
     }
 }
 
+# Whether the wsgi application leaves the modulestores to be initialized when
+# they are first used, rather than before accepting requests. Lazy startup gets
+# workers up faster, at the cost of slower first requests.
+LAZY_STARTUP = False
+
 #################### Python sandbox ############################################
 
 CODE_JAIL = {
@@ -1082,6 +1104,9 @@ MIDDLEWARE_CLASSES = (
 
     'request_cache.middleware.RequestCache',
 
+    # Records the queries made by each request, when ENABLE_QUERY_BUDGETS is enabled
+    'performance.middleware.QueryBudgetMiddleware',
+
     'mobile_api.middleware.AppVersionUpgrade',
     'header_control.middleware.HeaderControlMiddleware',
     'microsite_configuration.middleware.MicrositeMiddleware',
@@ -1782,6 +1807,44 @@ BLOCK_STRUCTURES_SETTINGS = dict(
     BLOCK_STRUCTURES_TASK_MAX_RETRIES=5,
 )
 
+############################# XQueue Submissions ##############################
+
+# Deferred xqueue submissions (see ENABLE_DEFERRED_XQUEUE_SUBMISSION) run on the
+# high-priority queue, since learners are waiting for them to be graded.
+XQUEUE_SUBMISSION_ROUTING_KEY = HIGH_PRIORITY_QUEUE
+
+# Initial delay, in seconds, before retrying a submission that xqueue did not
+# accept.  Additional retries use longer delays.
+XQUEUE_SUBMISSION_DEFAULT_RETRY_DELAY = 5
+
+# Maximum number of retries per submission.
+XQUEUE_SUBMISSION_MAX_RETRIES = 5
+
+############################# Request Profiling ###############################
+
+# Fraction of the requests whose stacks are sampled when
+# ENABLE_REQUEST_PROFILING is enabled.
+REQUEST_PROFILING_SAMPLE_RATE = 0.01
+
+# Seconds of CPU time between two samples of the stack of a sampled request.
+REQUEST_PROFILING_SAMPLER_INTERVAL = 0.005
+
+############################### Query Budgets #################################
+
+# Limits on the queries made by a request (see performance.queries.METRICS)
+# when ENABLE_QUERY_BUDGETS is enabled, keyed by the view name of the
+# endpoints they apply to, e.g.
+# {'dashboard': {'sql_queries': 50, 'duplicate_queries': 0}}
+QUERY_BUDGETS = {}
+
+# Limits on the queries made by the requests to any endpoint, overridden by
+# the endpoint's limits in QUERY_BUDGETS.
+DEFAULT_QUERY_BUDGET = {
+    'sql_queries': 200,
+    'duplicate_queries': 50,
+    'mongo_calls': 100,
+}
+
 ################################ Bulk Email ###################################
 
 # Suffix used to construct 'from' email address for bulk emails.
@@ -2673,6 +2736,10 @@ ENROLLMENT_COURSE_DETAILS_CACHE_TIMEOUT = 60
 
 OAUTH_ID_TOKEN_EXPIRATION = 60 * 60
 
+# Seconds for which data from the edX REST APIs is still served once its cache_ttl has elapsed,
+# while it is refreshed in the background.
+EDX_API_DATA_STALE_TTL = 60 * 60
+
 # These tabs are currently disabled
 NOTES_DISABLED_TABS = ['course_structure', 'tags']
 
@@ -73,6 +73,10 @@ FEATURES['ALLOW_COURSE_STAFF_GRADE_DOWNLOADS'] = True
 # Toggles embargo on for testing
 FEATURES['EMBARGO'] = True
 
+# Tests mock the GeoIP lookups to return different countries for the
+# same IP addresses, so the lookups must not be cached across tests.
+GEOIP_CACHE_SIZE = 0
+
 FEATURES['ENABLE_COMBINED_LOGIN_REGISTRATION'] = True
 
 # Enable the milestones app in tests to be consistent with it being enabled in production
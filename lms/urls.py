@@ -894,6 +894,11 @@ if settings.FEATURES.get('ENABLE_SERVICE_STATUS'):
         url(r'^status/', include('service_status.urls')),
     )
 
+if settings.FEATURES.get('ENABLE_REQUEST_PROFILING'):
+    urlpatterns += (
+        url(r'^performance/profile$', 'performance.views.profiling_report', name='performance_profile'),
+    )
+
 if settings.FEATURES.get('ENABLE_INSTRUCTOR_BACKGROUND_TASKS'):
     urlpatterns += (
         url(
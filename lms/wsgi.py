@@ -8,6 +8,11 @@ It exposes a module-level variable named ``application``. Django's
 ``WSGI_APPLICATION`` setting.
 """
 
+# Time the imports of the modules loaded while starting, when requested by the
+# EDX_IMPORT_TIME_REPORT environment variable.
+from openedx.core.lib import import_timing
+import_timing.start_from_environment()
+
 # Patch the xml libs
 from safe_lxml import defuse_xml_libs
 defuse_xml_libs()
@@ -25,14 +30,32 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "lms.envs.aws")
 import lms.startup as startup
 startup.run()
 
-from xmodule.modulestore.django import modulestore
+from django.conf import settings
+from edxmako.paths import precompile_templates
+
+# Compile the mako templates before HTTP requests are accepted, rather than
+# while serving the first requests.
+if settings.MAKO_PRECOMPILE_TEMPLATES:
+    precompile_templates()
 
 # Trigger a forced initialization of our modulestores since this can take a
-# while to complete and we want this done before HTTP requests are accepted.
-modulestore()
+# while to complete and we want this done before HTTP requests are accepted,
+# unless the modulestores are left to be initialized when first used.
+if not settings.LAZY_STARTUP:
+    from xmodule.modulestore.django import modulestore
+    from xmodule.modulestore.mongo.base import block_types_with_children
+    modulestore()
+    # Also load every XBlock class, which is otherwise done when first needed.
+    block_types_with_children()
 
 
 # This application object is used by the development server
 # as well as any WSGI server configured to use this file.
-from django.core.wsgi import get_wsgi_application
-application = get_wsgi_application()  # pylint: disable=invalid-name
+if settings.FEATURES.get('ENABLE_REQUEST_PROFILING'):
+    from performance.profiling import ProfilingWSGIHandler
+    application = ProfilingWSGIHandler()  # pylint: disable=invalid-name
+else:
+    from django.core.wsgi import get_wsgi_application
+    application = get_wsgi_application()  # pylint: disable=invalid-name
+
+import_timing.report()
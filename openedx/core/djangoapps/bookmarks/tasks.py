@@ -2,10 +2,12 @@
 Tasks for bookmarks.
 """
 import logging
-from django.db import transaction
+from django.db import IntegrityError, transaction
 
 from celery.task import task  # pylint: disable=import-error,no-name-in-module
 from opaque_keys.edx.keys import CourseKey
+from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
+from xmodule.block_metadata_utils import display_name_with_default
 from xmodule.modulestore.django import modulestore
 
 from . import PathItem
@@ -17,47 +19,31 @@ def _calculate_course_xblocks_data(course_key):
     """
     Fetch data for all the blocks in the course.
 
-    This data consists of the display_name and path of the block.
+    This data consists of the display_name and path of the block. It is
+    computed in a single pass over the course's collected block structure,
+    so no blocks are loaded from the modulestore unless the collected
+    structure itself needs to be (re)built.
     """
-    with modulestore().bulk_operations(course_key):
-
-        course = modulestore().get_course(course_key, depth=None)
-        blocks_info_dict = {}
-
-        # Collect display_name and children usage keys.
-        blocks_stack = [course]
-        while blocks_stack:
-            current_block = blocks_stack.pop()
-            children = current_block.get_children() if current_block.has_children else []
-            usage_id = unicode(current_block.scope_ids.usage_id)
-            block_info = {
-                'usage_key': current_block.scope_ids.usage_id,
-                'display_name': current_block.display_name_with_default,
-                'children_ids': [unicode(child.scope_ids.usage_id) for child in children]
-            }
-            blocks_info_dict[usage_id] = block_info
-
-            # Add this blocks children to the stack so that we can traverse them as well.
-            blocks_stack.extend(children)
-
-    # Set children
-    for block in blocks_info_dict.values():
-        block.setdefault('children', [])
-        for child_id in block['children_ids']:
-            block['children'].append(blocks_info_dict[child_id])
-        block.pop('children_ids', None)
-
-    # Calculate paths
-    def add_path_info(block_info, current_path):
-        """Do a DFS and add paths info to each block_info."""
-
-        block_info.setdefault('paths', [])
-        block_info['paths'].append(current_path)
-
-        for child_block_info in block_info['children']:
-            add_path_info(child_block_info, current_path + [block_info])
-
-    add_path_info(blocks_info_dict[unicode(course.scope_ids.usage_id)], [])
+    block_structure = get_course_in_cache(course_key)
+    blocks_info_dict = {}
+
+    # Topological order guarantees every parent's paths are known before
+    # its children are visited.
+    for block_key in block_structure.topological_traversal():
+        block_info = {
+            'usage_key': block_key,
+            'display_name': display_name_with_default(block_structure[block_key]),
+        }
+        parents = block_structure.get_parents(block_key)
+        if parents:
+            block_info['paths'] = [
+                parent_path + [blocks_info_dict[unicode(parent_key)]]
+                for parent_key in parents
+                for parent_path in blocks_info_dict[unicode(parent_key)]['paths']
+            ]
+        else:
+            block_info['paths'] = [[]]
+        blocks_info_dict[unicode(block_key)] = block_info
 
     return blocks_info_dict
 
@@ -106,6 +92,9 @@ def paths_equal(paths_1, paths_2):
 def _update_xblocks_cache(course_key):
     """
     Calculate the XBlock cache data for a course and update the XBlockCache table.
+
+    Existing rows are read with a single query and only the ones whose data
+    changed are saved; all missing rows are inserted with one bulk insert.
     """
     from .models import XBlockCache
     blocks_data = _calculate_course_xblocks_data(course_key)
@@ -126,18 +115,35 @@ def _update_xblocks_cache(course_key):
             if block_data:
                 update_block_cache_if_needed(block_cache, block_data)
 
+    if not blocks_data:
+        return
+
+    new_block_caches = []
     for block_data in blocks_data.values():
+        log.info(u'Creating XBlockCache with usage_key: %s', unicode(block_data['usage_key']))
+        block_cache = XBlockCache(
+            course_key=course_key,
+            usage_key=block_data['usage_key'],
+            display_name=block_data['display_name'],
+        )
+        block_cache.paths = _paths_from_data(block_data['paths'])
+        new_block_caches.append(block_cache)
+
+    try:
         with transaction.atomic():
-            paths = _paths_from_data(block_data['paths'])
-            log.info(u'Creating XBlockCache with usage_key: %s', unicode(block_data['usage_key']))
-            block_cache, created = XBlockCache.objects.get_or_create(usage_key=block_data['usage_key'], defaults={
-                'course_key': course_key,
-                'display_name': block_data['display_name'],
-                'paths': paths,
-            })
-
-            if not created:
-                update_block_cache_if_needed(block_cache, block_data)
+            XBlockCache.objects.bulk_create(new_block_caches)
+    except IntegrityError:
+        # Some rows were created concurrently (e.g. by a new bookmark); fall back to row-by-row upserts.
+        for block_data in blocks_data.values():
+            with transaction.atomic():
+                block_cache, created = XBlockCache.objects.get_or_create(usage_key=block_data['usage_key'], defaults={
+                    'course_key': course_key,
+                    'display_name': block_data['display_name'],
+                    'paths': _paths_from_data(block_data['paths']),
+                })
+
+                if not created:
+                    update_block_cache_if_needed(block_cache, block_data)
 
 
 @task(name=u'openedx.core.djangoapps.bookmarks.tasks.update_xblock_cache')
@@ -12,9 +12,11 @@ from django.core.exceptions import ObjectDoesNotExist
 from opaque_keys.edx.keys import UsageKey
 
 from xmodule.modulestore.exceptions import ItemNotFoundError
+from xmodule.modulestore.tests.factories import check_mongo_calls
 
 from .. import api
 from ..models import Bookmark
+from ..tasks import _update_xblocks_cache
 from openedx.core.djangoapps.bookmarks.api import BookmarksLimitReachedError
 from .test_models import BookmarksTestsBase
 
@@ -116,6 +118,23 @@ class BookmarksAPITests(BookmarkApiEventTestMixin, BookmarksTestsBase):
             self.assertEqual(len(bookmarks), count)
         self.assertIs(bookmarks.model, Bookmark)  # pylint: disable=no-member
 
+    def test_get_bookmarks_uses_precomputed_paths(self):
+        """
+        Verifies that paths precomputed on course publish are served without
+        touching the modulestore or writing to the database.
+        """
+        _update_xblocks_cache(self.course.id)
+
+        with check_mongo_calls(0):
+            with self.assertNumQueries(1):
+                bookmarks_data = api.get_bookmarks(
+                    user=self.user, course_key=self.course.id, fields=self.ALL_FIELDS
+                )
+        self.assertEqual(
+            bookmarks_data[-1]['path'],
+            [{'usage_key': unicode(self.chapter_1.location), 'display_name': self.chapter_1.display_name}]
+        )
+
     @patch('openedx.core.djangoapps.bookmarks.api.tracker.emit')
     def test_create_bookmark(self, mock_tracker):
         """
@@ -4,8 +4,7 @@ Tests for tasks.
 import ddt
 from nose.plugins.attrib import attr
 
-from django.conf import settings
-
+from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.tests.factories import check_mongo_calls, ItemFactory
 
@@ -103,23 +102,23 @@ class XBlockCacheTaskTests(BookmarksTestsBase):
         }
 
     @ddt.data(
-        (ModuleStoreEnum.Type.mongo, 2, 2, 3),
-        (ModuleStoreEnum.Type.mongo, 4, 2, 3),
-        (ModuleStoreEnum.Type.mongo, 2, 3, 4),
-        (ModuleStoreEnum.Type.mongo, 4, 3, 4),
-        (ModuleStoreEnum.Type.mongo, 2, 4, 5),
-        # (ModuleStoreEnum.Type.mongo, 4, 4, 6), Too slow.
-        (ModuleStoreEnum.Type.split, 2, 2, 3),
-        (ModuleStoreEnum.Type.split, 4, 2, 3),
-        (ModuleStoreEnum.Type.split, 2, 3, 3),
-        (ModuleStoreEnum.Type.split, 2, 4, 3),
+        (ModuleStoreEnum.Type.mongo, 2, 2),
+        (ModuleStoreEnum.Type.mongo, 4, 2),
+        (ModuleStoreEnum.Type.mongo, 2, 3),
+        (ModuleStoreEnum.Type.split, 2, 2),
+        (ModuleStoreEnum.Type.split, 4, 2),
+        (ModuleStoreEnum.Type.split, 2, 4),
     )
     @ddt.unpack
-    def test_calculate_course_xblocks_data_queries(self, store_type, children_per_block, depth, expected_mongo_calls):
-
+    def test_calculate_course_xblocks_data_queries(self, store_type, children_per_block, depth):
+        """
+        Test that the xblocks data is calculated from the collected block
+        structure without loading any blocks from the modulestore.
+        """
         course = self.create_course_with_blocks(children_per_block, depth, store_type)
+        get_course_in_cache(course.id)
 
-        with check_mongo_calls(expected_mongo_calls):
+        with check_mongo_calls(0):
             blocks_data = _calculate_course_xblocks_data(course.id)
             self.assertGreater(len(blocks_data), children_per_block ** depth)
 
@@ -144,21 +143,19 @@ class XBlockCacheTaskTests(BookmarksTestsBase):
                     )
 
     @ddt.data(
-        ('course', 47),
-        ('other_course', 34)
+        ('course', 8),
+        ('other_course', 7)
     )
     @ddt.unpack
     def test_update_xblocks_cache(self, course_attr, expected_sql_queries):
         """
         Test that the xblocks data is persisted correctly.
+
+        Rows that changed are saved one by one and all new rows are inserted
+        with a single bulk insert, each step wrapped in a savepoint.
         """
         course = getattr(self, course_attr)
-
-        if settings.ROOT_URLCONF == 'lms.urls':
-            # When the tests run under LMS, there is a certificates course_published
-            # signal handler that runs and causes the number of queries to be one more
-            # (due to the check for disabled_xblocks in django.py).
-            expected_sql_queries += 1
+        get_course_in_cache(course.id)
 
         with self.assertNumQueries(expected_sql_queries):
             _update_xblocks_cache(course.id)
@@ -0,0 +1,39 @@
+"""
+Bookmarks Transformer
+"""
+from openedx.core.lib.block_structure.transformer import BlockStructureTransformer
+
+
+class BookmarksTransformer(BlockStructureTransformer):
+    """
+    The BookmarksTransformer makes sure the data needed to compute the
+    XBlockCache display names and paths of a course is available on its
+    collected block structure, so that the bookmarks app never has to
+    load blocks from the modulestore to fill its cache.
+
+    No runtime transformations are performed.
+    """
+    VERSION = 1
+    FIELDS_TO_COLLECT = [u'display_name']
+
+    @classmethod
+    def name(cls):
+        """
+        Unique identifier for the transformer's class;
+        same identifier used in setup.py.
+        """
+        return u'bookmarks'
+
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collects any information that's necessary to execute this
+        transformer's transform method.
+        """
+        block_structure.request_xblock_fields(*cls.FIELDS_TO_COLLECT)
+
+    def transform(self, usage_info, block_structure):
+        """
+        Perform no transformations.
+        """
+        pass
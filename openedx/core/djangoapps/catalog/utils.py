@@ -1,22 +1,15 @@
 """Helper functions for working with the catalog service."""
 from urlparse import urlparse
 
-from django.conf import settings
-from edx_rest_api_client.client import EdxRestApiClient
 from opaque_keys.edx.keys import CourseKey
 
 from openedx.core.djangoapps.catalog.models import CatalogIntegration
-from openedx.core.lib.edx_api_utils import get_edx_api_data
-from openedx.core.lib.token_utils import JwtBuilder
+from openedx.core.lib.edx_api_utils import create_api_client, get_edx_api_data, get_jwt
 
 
 def create_catalog_api_client(user, catalog_integration):
     """Returns an API client which can be used to make catalog API requests."""
-    scopes = ['email', 'profile']
-    expires_in = settings.OAUTH_ID_TOKEN_EXPIRATION
-    jwt = JwtBuilder(user).build_token(scopes, expires_in)
-
-    return EdxRestApiClient(catalog_integration.internal_api_url, jwt=jwt)
+    return create_api_client(catalog_integration.internal_api_url, get_jwt(user))
 
 
 def get_programs(user, uuid=None, type=None):  # pylint: disable=redefined-builtin
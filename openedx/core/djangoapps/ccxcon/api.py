@@ -18,7 +18,7 @@ from rest_framework.status import (
 from lms.djangoapps.courseware.courses import get_course_by_id
 from lms.djangoapps.instructor.access import list_with_level
 from openedx.core.djangoapps.models.course_details import CourseDetails
-from student.models import anonymous_id_for_user
+from student.models import anonymous_ids_for_users
 from .models import CCXCon
 
 log = logging.getLogger(__name__)
@@ -124,7 +124,8 @@ def course_info_to_ccxcon(course_key):
     # get the entire list of instructors
     course_instructors = list_with_level(course, 'instructor')
     # get anonymous ids for each of them
-    course_instructors_ids = [anonymous_id_for_user(user, course_key) for user in course_instructors]
+    anonymous_ids = anonymous_ids_for_users(course_instructors, course_key)
+    course_instructors_ids = [anonymous_ids[user.id] for user in course_instructors]
     # extract the course details
     course_details = CourseDetails.fetch(course_key)
 
@@ -5,6 +5,7 @@ import json
 import logging
 from urlparse import urlparse, urlunparse
 
+from django.core.cache import cache
 from django.db import models, transaction
 from django.db.models.fields import BooleanField, DateTimeField, DecimalField, TextField, FloatField, IntegerField
 from django.db.utils import IntegrityError
@@ -29,6 +30,9 @@ from xmodule_django.models import CourseKeyField, UsageKeyField
 
 log = logging.getLogger(__name__)
 
+# How long to wait before enqueuing the generation of the same course overview again.
+GENERATION_TASK_TIMEOUT = 5 * 60
+
 
 class CourseOverview(TimeStampedModel):
     """
@@ -277,6 +281,71 @@ class CourseOverview(TimeStampedModel):
 
         return course_overview or cls.load_from_module_store(course_id)
 
+    @classmethod
+    def get_from_ids(cls, course_ids):
+        """
+        Load the CourseOverview objects of the given courses, along with their
+        images and tabs, in two queries.
+
+        Unlike get_from_id, this never loads courses from the modulestore.
+        Overviews that are missing or out of date are generated by a
+        background task instead. Until then, out of date overviews are
+        returned as they are, and missing ones are left out.
+
+        Arguments:
+            course_ids (iterable of CourseKey): the IDs of the course overviews to be loaded.
+
+        Returns:
+            dict: Keys are the course IDs, values their CourseOverviews.
+        """
+        course_overviews, outdated_course_ids = cls._get_existing_from_ids(course_ids)
+
+        # Only enqueue a course once per timeout, since courses that no longer
+        # exist in the modulestore stay missing.
+        outdated_course_ids = [
+            course_id for course_id in outdated_course_ids
+            if cache.add(u'course_overviews.generating.{}'.format(course_id), True, GENERATION_TASK_TIMEOUT)
+        ]
+        if outdated_course_ids:
+            # Import here to avoid a circular import, since the tasks module imports this one.
+            from openedx.core.djangoapps.content.course_overviews.tasks import generate_course_overviews
+            generate_course_overviews.delay([unicode(course_id) for course_id in outdated_course_ids])
+
+        return course_overviews
+
+    @classmethod
+    def _get_existing_from_ids(cls, course_ids):
+        """
+        Load the existing CourseOverview objects of the given courses.
+
+        Returns:
+            tuple: A dict of the CourseOverviews keyed by course ID, and the
+                list of the IDs of the courses whose overview is missing, out
+                of date or without thumbnail images.
+        """
+        course_ids = set(course_ids)
+        course_overviews = {
+            course_overview.id: course_overview
+            for course_overview in cls.objects.filter(id__in=course_ids).select_related(
+                'image_set'
+            ).prefetch_related('tabs')
+        }
+        outdated_course_ids = [
+            course_id for course_id in course_ids
+            if course_id not in course_overviews or course_overviews[course_id].version < cls.VERSION
+        ]
+
+        # Overviews are also regenerated when their thumbnail images are missing,
+        # as in get_from_id, which only has an effect if thumbnails are enabled.
+        without_image_set = [
+            course_id for course_id, course_overview in course_overviews.iteritems()
+            if course_overview.version >= cls.VERSION and not hasattr(course_overview, 'image_set')
+        ]
+        if without_image_set and CourseOverviewImageConfig.current().enabled:
+            outdated_course_ids.extend(without_image_set)
+
+        return course_overviews, outdated_course_ids
+
     def clean_id(self, padding_char='='):
         """
         Returns a unique deterministic base32-encoded ID for the course.
@@ -461,7 +530,13 @@ class CourseOverview(TimeStampedModel):
         log.info('Generating course overview for %d courses.', len(course_keys))
         log.debug('Generating course overview(s) for the following courses: %s', course_keys)
 
+        existing_course_overviews, outdated_course_keys = cls._get_existing_from_ids(course_keys)
+        outdated_course_keys = set(outdated_course_keys)
+
         for course_key in course_keys:
+            if course_key not in outdated_course_keys:
+                course_overviews.append(existing_course_overviews[course_key])
+                continue
             try:
                 course_overviews.append(CourseOverview.get_from_id(course_key))
             except Exception as ex:  # pylint: disable=broad-except
@@ -0,0 +1,23 @@
+"""
+Asynchronous tasks related to the Course Overviews sub-application.
+"""
+import logging
+
+from celery.task import task
+from opaque_keys.edx.keys import CourseKey
+
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+
+log = logging.getLogger('edx.celery.task')
+
+
+@task()
+def generate_course_overviews(course_ids):
+    """
+    (Re)generates the CourseOverviews of the given courses if they are
+    missing or out of date.
+
+    Arguments:
+        course_ids (list of unicode): The ids of the courses.
+    """
+    CourseOverview.get_select_courses([CourseKey.from_string(course_id) for course_id in course_ids])
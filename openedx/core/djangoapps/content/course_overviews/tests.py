@@ -459,6 +459,33 @@ class CourseOverviewTestCase(ModuleStoreTestCase):
             set(select_course_ids),
         )
 
+    def test_get_from_ids(self):
+        course_ids = [CourseFactory.create(emit_signals=True).id for __ in range(3)]
+        # One query for the overviews, one for their tabs and one for the
+        # thumbnail configuration, since none of them has thumbnails.
+        with self.assertNumQueries(3):
+            course_overviews = CourseOverview.get_from_ids(course_ids)
+            for course_overview in course_overviews.itervalues():
+                list(course_overview.tabs.all())
+        self.assertEqual(set(course_overviews), set(course_ids))
+
+    @mock.patch('openedx.core.djangoapps.content.course_overviews.tasks.generate_course_overviews.delay')
+    def test_get_from_ids_missing(self, mock_generate):
+        course_ids = [CourseFactory.create(emit_signals=True).id, CourseFactory.create().id]
+        with check_mongo_calls(0):
+            course_overviews = CourseOverview.get_from_ids(course_ids)
+        self.assertEqual(course_overviews.keys(), course_ids[:1])
+        mock_generate.assert_called_once_with([unicode(course_ids[1])])
+
+    @mock.patch('openedx.core.djangoapps.content.course_overviews.tasks.generate_course_overviews.delay')
+    def test_get_from_ids_outdated(self, mock_generate):
+        course_id = CourseFactory.create(emit_signals=True).id
+        CourseOverview.objects.filter(id=course_id).update(version=CourseOverview.VERSION - 1)
+
+        course_overviews = CourseOverview.get_from_ids([course_id])
+        self.assertEqual(course_overviews[course_id].version, CourseOverview.VERSION - 1)
+        mock_generate.assert_called_once_with([unicode(course_id)])
+
     def test_get_all_courses(self):
         course_ids = [CourseFactory.create(emit_signals=True).id for __ in range(3)]
         self.assertEqual(
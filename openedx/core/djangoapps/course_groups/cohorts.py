@@ -6,6 +6,9 @@ forums, and to the cohort admin views.
 import logging
 import random
 
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.db.models.signals import post_save, m2m_changed
 from django.dispatch import receiver
 from django.http import Http404
@@ -89,6 +92,15 @@ def _cohort_membership_changed(sender, **kwargs):
 DEFAULT_COHORT_NAME = _("Default Group")
 
 
+# Number of rows resolved and written per query by the bulk cohort assignment helpers.
+BULK_COHORT_BATCH_SIZE = 500
+
+# Per-row outcomes reported by bulk_add_users_to_cohorts.
+BULK_COHORT_ADDED = 'added'
+BULK_COHORT_NOT_FOUND = 'not_found'
+BULK_COHORT_ALREADY_PRESENT = 'already_present'
+
+
 # tl;dr: global state is bad.  capa reseeds random every time a problem is loaded.  Even
 # if and when that's fixed, it's a good idea to have a local generator to avoid any other
 # code that messes with the global random module.
@@ -179,6 +191,11 @@ def get_cohort(user, course_key, assign=True, use_cached=False):
     if not course_cohort_settings.is_cohorted:
         return request_cache.data.setdefault(cache_key, None)
 
+    # Serve from a prefetched course-wide membership map if one is available.
+    membership_map = request_cache.data.get(_cohort_membership_map_cache_key(course_key))
+    if use_cached and membership_map is not None and user.id in membership_map:
+        return request_cache.data.setdefault(cache_key, membership_map[user.id])
+
     # If course is cohorted, check if the user already has a cohort.
     try:
         membership = CohortMembership.objects.get(
@@ -201,6 +218,41 @@ def get_cohort(user, course_key, assign=True, use_cached=False):
     return request_cache.data.setdefault(cache_key, membership.course_user_group)
 
 
+def _cohort_membership_map_cache_key(course_key):
+    """
+    Returns the request cache key under which the membership map for course_key is stored.
+    """
+    return u"cohorts.get_cohort_membership_map.{}".format(course_key)
+
+
+def get_cohort_membership_map(course_key, use_cached=False):
+    """
+    Returns a dict mapping user ids to the CourseUserGroup each user is
+    cohorted in for the given course, fetched with a single query.
+
+    The map is cached for the duration of a request, and get_cohort(...,
+    use_cached=True) consults it before hitting the database, so callers that
+    iterate over many learners (e.g. report generation) can prefetch it once.
+    Users without a cohort are absent from the map.
+
+    Arguments:
+        course_key: CourseKey
+        use_cached (bool): Whether to use the cached value or fetch from database.
+    """
+    request_cache = RequestCache.get_request_cache()
+    cache_key = _cohort_membership_map_cache_key(course_key)
+
+    if use_cached and cache_key in request_cache.data:
+        return request_cache.data[cache_key]
+
+    memberships = CohortMembership.objects.filter(
+        course_id=course_key,
+    ).select_related('course_user_group')
+    membership_map = {membership.user_id: membership.course_user_group for membership in memberships}
+    request_cache.data[cache_key] = membership_map
+    return membership_map
+
+
 def get_random_cohort(course_key):
     """
     Helper method to get a cohort for random assignment.
@@ -395,6 +447,185 @@ def add_user_to_cohort(cohort, username_or_email):
     return (user, membership.previous_cohort_name)
 
 
+def get_users_by_username_or_email(usernames_or_emails, batch_size=BULK_COHORT_BATCH_SIZE):
+    """
+    Look up many users at once, by email for values containing an '@' and by
+    username otherwise.
+
+    Arguments:
+        usernames_or_emails: iterable of strings
+        batch_size (int): maximum number of values resolved per query
+
+    Returns:
+        A dict mapping each lowercased value that matched a user to that User
+        object, since MySQL matches the values regardless of their case.
+        Values that did not match any user are absent.
+    """
+    values = list(set(usernames_or_emails))
+    users = {}
+    for start in xrange(0, len(values), batch_size):
+        batch = values[start:start + batch_size]
+        emails = [value for value in batch if '@' in value]
+        usernames = [value for value in batch if '@' not in value]
+        lowercased_emails = set(email.lower() for email in emails)
+        lowercased_usernames = set(username.lower() for username in usernames)
+        for user in User.objects.filter(Q(email__in=emails) | Q(username__in=usernames)):
+            if user.email.lower() in lowercased_emails:
+                users[user.email.lower()] = user
+            if user.username.lower() in lowercased_usernames:
+                users[user.username.lower()] = user
+    return users
+
+
+def bulk_add_users_to_cohorts(course_key, assignments, batch_size=BULK_COHORT_BATCH_SIZE):
+    """
+    Add many users to cohorts of a single course, processing rows in batches.
+
+    This is the bulk counterpart of add_user_to_cohort.  Each batch resolves its
+    users and their existing memberships with a constant number of queries,
+    creates new CohortMembership rows with bulk inserts, moves existing ones
+    with one update per target cohort, and emits the cohort membership tracking
+    events once per batch.  Rows are applied in order, so a user listed
+    several times ends up in the cohort of their last row.
+
+    Arguments:
+        course_key: CourseKey of the course all the cohorts belong to
+        assignments: iterable of (username_or_email, CourseUserGroup) tuples
+        batch_size (int): number of rows handled per batch
+
+    Returns:
+        A list with one entry per row, in input order: BULK_COHORT_ADDED,
+        BULK_COHORT_NOT_FOUND or BULK_COHORT_ALREADY_PRESENT.
+    """
+    assignments = list(assignments)
+    for cohort in set(cohort for __, cohort in assignments):
+        if cohort.group_type != CourseUserGroup.COHORT or cohort.course_id != course_key:
+            raise ValueError("Cohort {} does not belong to course {}".format(cohort, course_key))
+
+    results = []
+    for start in xrange(0, len(assignments), batch_size):
+        results.extend(_bulk_add_users_to_cohorts_batch(course_key, assignments[start:start + batch_size]))
+    return results
+
+
+def _bulk_add_users_to_cohorts_batch(course_key, assignments):
+    """
+    Applies a single batch of bulk_add_users_to_cohorts.
+    """
+    users = get_users_by_username_or_email(username_or_email for username_or_email, __ in assignments)
+    existing = {
+        membership.user_id: membership
+        for membership in CohortMembership.objects.filter(
+            course_id=course_key,
+            user__in=[user.id for user in users.values()],
+        ).select_related('course_user_group')
+    }
+
+    results = []
+    requested_events = []
+    # user id -> CourseUserGroup the user will be in once the batch is applied
+    final_cohorts = {user_id: membership.course_user_group for user_id, membership in existing.iteritems()}
+    for username_or_email, cohort in assignments:
+        user = users.get(username_or_email.lower())
+        if user is None:
+            results.append(BULK_COHORT_NOT_FOUND)
+            continue
+        previous_cohort = final_cohorts.get(user.id)
+        if previous_cohort is not None and previous_cohort.id == cohort.id:
+            results.append(BULK_COHORT_ALREADY_PRESENT)
+            continue
+        final_cohorts[user.id] = cohort
+        results.append(BULK_COHORT_ADDED)
+        requested_events.append({
+            "user_id": user.id,
+            "cohort_id": cohort.id,
+            "cohort_name": cohort.name,
+            "previous_cohort_id": previous_cohort.id if previous_cohort else None,
+            "previous_cohort_name": previous_cohort.name if previous_cohort else None,
+        })
+
+    # Net changes per cohort, keyed by cohort id.
+    cohorts_by_id = {}
+    added = {}
+    removed = {}
+    to_create = []
+    for user_id, cohort in final_cohorts.iteritems():
+        membership = existing.get(user_id)
+        if membership is not None and membership.course_user_group_id == cohort.id:
+            continue
+        cohorts_by_id[cohort.id] = cohort
+        added.setdefault(cohort.id, set()).add(user_id)
+        if membership is None:
+            to_create.append(CohortMembership(course_user_group=cohort, user_id=user_id, course_id=course_key))
+        else:
+            cohorts_by_id[membership.course_user_group_id] = membership.course_user_group
+            removed.setdefault(membership.course_user_group_id, set()).add(user_id)
+
+    through = CourseUserGroup.users.through
+    try:
+        with transaction.atomic():
+            for cohort_id, user_ids in removed.iteritems():
+                through.objects.filter(courseusergroup_id=cohort_id, user_id__in=user_ids).delete()
+            for cohort_id, user_ids in added.iteritems():
+                moved_user_ids = [user_id for user_id in user_ids if user_id in existing]
+                if moved_user_ids:
+                    CohortMembership.objects.filter(
+                        course_id=course_key, user_id__in=moved_user_ids
+                    ).update(course_user_group=cohorts_by_id[cohort_id])
+                through.objects.bulk_create([
+                    through(courseusergroup_id=cohort_id, user_id=user_id) for user_id in user_ids
+                ])
+            CohortMembership.objects.bulk_create(to_create)
+    except IntegrityError:
+        # A user was added to a cohort concurrently, or has a legacy cohort
+        # without a CohortMembership: add the users of the batch one by one.
+        log.warning(u"Bulk cohort assignment conflicted in course %s, adding users one by one.", course_key)
+        return _add_users_to_cohorts_one_by_one(course_key, assignments)
+
+    # bulk writes bypass the m2m_changed signal, so send it once per cohort.
+    for action, changes in (("post_remove", removed), ("post_add", added)):
+        for cohort_id, user_ids in changes.iteritems():
+            m2m_changed.send(
+                sender=through,
+                instance=cohorts_by_id[cohort_id],
+                action=action,
+                reverse=False,
+                model=User,
+                pk_set=user_ids,
+                using=CourseUserGroup.objects.db,
+            )
+    for event in requested_events:
+        tracker.emit("edx.cohort.user_add_requested", event)
+
+    request_cache = RequestCache.get_request_cache()
+    request_cache.data.pop(_cohort_membership_map_cache_key(course_key), None)
+    for user_id in final_cohorts:
+        request_cache.data.pop(u"cohorts.get_cohort.{}.{}".format(user_id, course_key), None)
+
+    return results
+
+
+def _add_users_to_cohorts_one_by_one(course_key, assignments):
+    """
+    Applies a batch of bulk_add_users_to_cohorts with add_user_to_cohort.
+    """
+    request_cache = RequestCache.get_request_cache()
+    results = []
+    for username_or_email, cohort in assignments:
+        try:
+            user, __ = add_user_to_cohort(cohort, username_or_email)
+        except User.DoesNotExist:
+            results.append(BULK_COHORT_NOT_FOUND)
+        except ValueError:
+            results.append(BULK_COHORT_ALREADY_PRESENT)
+        else:
+            results.append(BULK_COHORT_ADDED)
+            request_cache.data.pop(u"cohorts.get_cohort.{}.{}".format(user.id, course_key), None)
+
+    request_cache.data.pop(_cohort_membership_map_cache_key(course_key), None)
+    return results
+
+
 def get_group_info_for_cohort(cohort, use_cached=False):
     """
     Get the ids of the group and partition to which this cohort has been linked
@@ -19,7 +19,7 @@ from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.tests.django_utils import TEST_DATA_MIXED_MODULESTORE, ModuleStoreTestCase
 from xmodule.modulestore.tests.factories import ToyCourseFactory
 
-from ..models import CourseUserGroup, CourseCohort, CourseUserGroupPartitionGroup
+from ..models import CohortMembership, CourseUserGroup, CourseCohort, CourseUserGroupPartitionGroup
 from .. import cohorts
 from ..tests.helpers import (
     topic_name_to_id, config_course_cohorts, config_course_cohorts_legacy,
@@ -633,6 +633,123 @@ class TestCohorts(ModuleStoreTestCase):
             lambda: cohorts.add_user_to_cohort(first_cohort, "non_existent_username")
         )
 
+    @patch("openedx.core.djangoapps.course_groups.cohorts.tracker")
+    def test_bulk_add_users_to_cohorts(self, mock_tracker):
+        """
+        Make sure cohorts.bulk_add_users_to_cohorts() adds, moves and reports
+        users the same way repeated add_user_to_cohort() calls would.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        first_cohort = CohortFactory(course_id=course.id, name="FirstCohort")
+        second_cohort = CohortFactory(course_id=course.id, name="SecondCohort")
+        moved_user = UserFactory(username="moved", email="moved@example.com")
+        new_user = UserFactory(username="new", email="new@example.com")
+        cohorts.add_user_to_cohort(first_cohort, "moved")
+        mock_tracker.reset_mock()
+
+        results = cohorts.bulk_add_users_to_cohorts(
+            course.id,
+            [
+                ("moved@example.com", second_cohort),
+                ("new", first_cohort),
+                ("new", first_cohort),
+                ("non_existent_username", first_cohort),
+            ],
+            batch_size=3,
+        )
+        self.assertEqual(
+            results,
+            [
+                cohorts.BULK_COHORT_ADDED,
+                cohorts.BULK_COHORT_ADDED,
+                cohorts.BULK_COHORT_ALREADY_PRESENT,
+                cohorts.BULK_COHORT_NOT_FOUND,
+            ]
+        )
+        self.assertEqual(cohorts.get_cohort(moved_user, course.id, assign=False), second_cohort)
+        self.assertEqual(cohorts.get_cohort(new_user, course.id, assign=False), first_cohort)
+        self.assertEqual(list(first_cohort.users.all()), [new_user])
+        self.assertEqual(list(second_cohort.users.all()), [moved_user])
+        mock_tracker.emit.assert_any_call(
+            "edx.cohort.user_add_requested",
+            {
+                "user_id": moved_user.id,
+                "cohort_id": second_cohort.id,
+                "cohort_name": second_cohort.name,
+                "previous_cohort_id": first_cohort.id,
+                "previous_cohort_name": first_cohort.name,
+            }
+        )
+        mock_tracker.emit.assert_any_call(
+            "edx.cohort.user_added",
+            {"cohort_id": first_cohort.id, "cohort_name": first_cohort.name, "user_id": new_user.id}
+        )
+        mock_tracker.emit.assert_any_call(
+            "edx.cohort.user_removed",
+            {"cohort_id": first_cohort.id, "cohort_name": first_cohort.name, "user_id": moved_user.id}
+        )
+
+    def test_get_users_by_username_or_email_ignores_case(self):
+        """
+        Make sure the users matched by the database regardless of the case of
+        the values are found, as they are by MySQL.
+        """
+        user = UserFactory(username="MixedCase", email="Mixed@Example.com")
+        self.assertEqual(cohorts.get_users_by_username_or_email(["MixedCase"]), {"mixedcase": user})
+
+        with patch.object(User.objects, 'filter', return_value=[user]):
+            self.assertEqual(
+                cohorts.get_users_by_username_or_email(["mixedcase", "MIXED@example.com"]),
+                {"mixedcase": user, "mixed@example.com": user},
+            )
+
+    def test_bulk_add_users_to_cohorts_conflict(self):
+        """
+        Make sure a batch conflicting with concurrent cohort assignments is
+        applied one row at a time.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        cohort = CohortFactory(course_id=course.id, name="TestCohort")
+        user = UserFactory(username="user", email="user@example.com")
+
+        with patch.object(CohortMembership.objects, 'bulk_create', side_effect=IntegrityError):
+            results = cohorts.bulk_add_users_to_cohorts(
+                course.id,
+                [("user", cohort), ("user@example.com", cohort), ("non_existent_username", cohort)],
+            )
+
+        self.assertEqual(
+            results,
+            [cohorts.BULK_COHORT_ADDED, cohorts.BULK_COHORT_ALREADY_PRESENT, cohorts.BULK_COHORT_NOT_FOUND]
+        )
+        self.assertEqual(cohorts.get_cohort(user, course.id, assign=False), cohort)
+        self.assertEqual(list(cohort.users.all()), [user])
+
+    def test_get_cohort_membership_map(self):
+        """
+        Make sure get_cohort_membership_map() returns every cohorted user and
+        that get_cohort() can be served from it.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        config_course_cohorts(course, is_cohorted=True)
+        cohorted_user = UserFactory()
+        second_user = UserFactory()
+        other_user = UserFactory()
+        cohort = CohortFactory(course_id=course.id, name="TestCohort", users=[cohorted_user, second_user])
+        membership_map = {cohorted_user.id: cohort, second_user.id: cohort}
+
+        self.assertEqual(cohorts.get_cohort_membership_map(course.id), membership_map)
+        with self.assertNumQueries(0):
+            self.assertEqual(cohorts.get_cohort_membership_map(course.id, use_cached=True), membership_map)
+        # Only the cohort settings of the course are read.
+        with self.assertNumQueries(1):
+            self.assertEqual(cohorts.get_cohort(cohorted_user, course.id, use_cached=True), cohort)
+        self.assertIsNone(cohorts.get_cohort(other_user, course.id, assign=False))
+
+        # The map isn't used once the course isn't cohorted anymore.
+        config_course_cohorts(course, is_cohorted=False)
+        self.assertIsNone(cohorts.get_cohort(second_user, course.id, use_cached=True))
+
     @patch("openedx.core.djangoapps.course_groups.cohorts.tracker")
     def add_user_to_cohorts_race_condition(self, mock_tracker):
         """
@@ -56,6 +56,7 @@ the entire cookie and use it to impersonate the victim.
 
 """
 
+from collections import OrderedDict
 from contextlib import contextmanager
 from django.conf import settings
 from django.contrib.auth import SESSION_KEY
@@ -63,14 +64,25 @@ from django.contrib.auth.views import redirect_to_login
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.core import signing
 from django.http import HttpResponse
+from django.utils import baseconv
 from django.utils.crypto import get_random_string
+from django.utils.http import cookie_date
 from hashlib import sha256
 from logging import getLogger, ERROR
+import threading
+import time
 
 from openedx.core.lib.mobile_utils import is_request_from_mobile_app
 
 log = getLogger(__name__)
 
+# The number of verified safe cookies remembered by each process.
+VERIFIED_COOKIES_CACHE_SIZE = 10000
+
+# The fraction of SESSION_COOKIE_AGE during which the safe cookie of a request
+# is sent back unchanged in its response, rather than signed again.
+SAFE_COOKIE_REUSE_AGE_FRACTION = 0.5
+
 
 class SafeCookieError(Exception):
     """
@@ -190,6 +202,16 @@ class SafeCookieData(object):
             )
         return False
 
+    def signed_at(self):
+        """
+        Returns the time at which this safe cookie data was signed, in
+        seconds since the epoch, or None if the signature is malformed.
+        """
+        try:
+            return baseconv.base62.decode(self.signature.rsplit(':', 2)[1])
+        except (AttributeError, IndexError, ValueError):
+            return None
+
     def _compute_digest(self, user_id):
         """
         Returns hash(version | session_id | user_id |)
@@ -230,6 +252,50 @@ class SafeCookieData(object):
             )
 
 
+class VerifiedCookies(object):
+    """
+    A bounded set of the safe cookies verified for a user, the least
+    recently used being forgotten first. Each cookie is remembered until
+    its signature expires.
+    """
+    def __init__(self, size):
+        self.size = size
+        self._expirations = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, cookie_data_string, user_id, expiration):
+        """
+        Remembers that the cookie was verified for the user, until the expiration time.
+        """
+        key = (cookie_data_string, user_id)
+        with self._lock:
+            self._expirations.pop(key, None)
+            self._expirations[key] = expiration
+            if len(self._expirations) > self.size:
+                self._expirations.popitem(last=False)
+
+    def __contains__(self, key):
+        """
+        Returns whether the (cookie_data_string, user_id) was verified and hasn't expired since.
+        """
+        with self._lock:
+            expiration = self._expirations.pop(key, None)
+            if expiration is None or expiration <= time.time():
+                return False
+            self._expirations[key] = expiration
+            return True
+
+    def clear(self):
+        """
+        Forgets all the verified cookies.
+        """
+        with self._lock:
+            self._expirations.clear()
+
+
+VERIFIED_COOKIES = VerifiedCookies(VERIFIED_COOKIES_CACHE_SIZE)
+
+
 class SafeSessionMiddleware(SessionMiddleware):
     """
     A safer middleware implementation that uses SafeCookieData instead
@@ -252,12 +318,14 @@ class SafeSessionMiddleware(SessionMiddleware):
 
         Step 4. Once the session is retrieved, verify that the user
         bound in the safe_cookie_data matches the user attached to the
-        server's session information.
+        server's session information. The cookies successfully verified
+        for a user are remembered by the process (see VERIFIED_COOKIES),
+        so that their signature isn't verified again for each request.
 
         Step 5. If all is successful, the now verified user_id is stored
         separately in the request object so it is available for another
         final verification before sending the response (in
-        process_response).
+        process_response), along with the verified safe_cookie_data.
         """
 
         cookie_data_string = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
@@ -283,8 +351,9 @@ class SafeSessionMiddleware(SessionMiddleware):
         if cookie_data_string and request.session.get(SESSION_KEY):
 
             user_id = self.get_user_id_from_session(request)
-            if safe_cookie_data.verify(user_id):  # Step 4
+            if self._verify(safe_cookie_data, cookie_data_string, user_id):  # Step 4
                 request.safe_cookie_verified_user_id = user_id  # Step 5
+                request.safe_cookie_verified_data = safe_cookie_data
             else:
                 return self._on_user_authentication_failed(request)
 
@@ -308,7 +377,11 @@ class SafeSessionMiddleware(SessionMiddleware):
 
         Step 3. If a cookie is being sent with the response, update
         the cookie by replacing its session_id with a safe_cookie_data
-        that binds the session and its corresponding user.
+        that binds the session and its corresponding user. If neither
+        the session nor its user changed since the request was verified,
+        the safe_cookie_data of the request is reused rather than signed
+        again, unless it is older than SAFE_COOKIE_REUSE_AGE_FRACTION of
+        SESSION_COOKIE_AGE. A reused cookie expires with its signature.
 
         Step 4. Delete the cookie, if it's marked for deletion.
 
@@ -325,7 +398,8 @@ class SafeSessionMiddleware(SessionMiddleware):
                     # Use the user_id marked in the session instead of the
                     # one in the request in case the user is not set in the
                     # request, for example during Anonymous API access.
-                    self.update_with_safe_session_cookie(response.cookies, user_id_in_session)  # Step 3
+                    if not self._reuse_safe_session_cookie(request, response.cookies, user_id_in_session):
+                        self.update_with_safe_session_cookie(response.cookies, user_id_in_session)  # Step 3
 
             except SafeCookieError:
                 _mark_cookie_for_deletion(request)
@@ -335,6 +409,50 @@ class SafeSessionMiddleware(SessionMiddleware):
 
         return response
 
+    @staticmethod
+    def _verify(safe_cookie_data, cookie_data_string, user_id):
+        """
+        Verifies that the safe_cookie_data parsed from cookie_data_string
+        is bound to the user, unless it was already verified for the user
+        by this process.
+        """
+        if (cookie_data_string, user_id) in VERIFIED_COOKIES:
+            return True
+        if not safe_cookie_data.verify(user_id):
+            return False
+        signed_at = safe_cookie_data.signed_at()
+        if signed_at is not None:
+            VERIFIED_COOKIES.add(cookie_data_string, user_id, signed_at + settings.SESSION_COOKIE_AGE)
+        return True
+
+    @staticmethod
+    def _reuse_safe_session_cookie(request, cookies, user_id):
+        """
+        Puts the safe_cookie_data verified when processing the request in
+        the session cookie, if it is still bound to the session and user
+        of the cookie and isn't getting old. Returns whether it did.
+
+        The cookie then expires no later than its signature, which
+        SafeCookieData.verify rejects SESSION_COOKIE_AGE after signing.
+        """
+        safe_cookie_data = getattr(request, 'safe_cookie_verified_data', None)
+        if safe_cookie_data is None or request.safe_cookie_verified_user_id != user_id:
+            return False
+        cookie = cookies[settings.SESSION_COOKIE_NAME]
+        if cookie.value != safe_cookie_data.session_id:
+            return False
+        signed_at = safe_cookie_data.signed_at()
+        now = time.time()
+        if signed_at is None or now - signed_at > settings.SESSION_COOKIE_AGE * SAFE_COOKIE_REUSE_AGE_FRACTION:
+            return False
+
+        cookies[settings.SESSION_COOKIE_NAME] = unicode(safe_cookie_data)
+        max_age = int(signed_at + settings.SESSION_COOKIE_AGE - now)
+        if cookie['max-age'] and int(cookie['max-age']) > max_age:
+            cookie['max-age'] = max_age
+            cookie['expires'] = cookie_date(now + max_age)
+        return True
+
     @staticmethod
     def _on_user_authentication_failed(request):
         """
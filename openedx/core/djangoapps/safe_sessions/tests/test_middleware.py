@@ -3,6 +3,8 @@
 """
 Unit tests for SafeSessionMiddleware
 """
+import time
+
 import ddt
 from django.conf import settings
 from django.contrib.auth import SESSION_KEY
@@ -16,7 +18,7 @@ from nose.plugins.attrib import attr
 
 from student.tests.factories import UserFactory
 
-from ..middleware import SafeSessionMiddleware, SafeCookieData
+from ..middleware import SafeSessionMiddleware, SafeCookieData, VerifiedCookies, VERIFIED_COOKIES
 from .test_utils import TestSafeSessionsLogMixin
 
 
@@ -248,6 +250,8 @@ class TestSafeSessionMiddleware(TestSafeSessionsLogMixin, TestCase):
         self.request = create_mock_request()
         self.client.response = HttpResponse()
         self.client.response.cookies = SimpleCookie()
+        VERIFIED_COOKIES.clear()
+        self.addCleanup(VERIFIED_COOKIES.clear)
 
     def cookies_from_request_to_response(self):
         """
@@ -321,3 +325,90 @@ class TestSafeSessionMiddleware(TestSafeSessionsLogMixin, TestCase):
     def test_error_from_mobile_app(self):
         self.request.META = {'HTTP_USER_AGENT': 'open edX Mobile App Version 2.1'}
         self.verify_error(401)
+
+    def test_verified_cookie_is_remembered(self):
+        self.verify_success()
+        cookie_data_string = unicode(self.request.safe_cookie_verified_data)
+
+        self.request = create_mock_request()
+        self.request.COOKIES[settings.SESSION_COOKIE_NAME] = cookie_data_string
+        with patch.object(SafeCookieData, 'verify') as mock_verify:
+            self.assertIsNone(SafeSessionMiddleware().process_request(self.request))
+        self.assertFalse(mock_verify.called)
+        self.assertEquals(self.request.safe_cookie_verified_user_id, self.user.id)
+
+    def test_unchanged_cookie_is_reused(self):
+        with patch.object(SafeCookieData, 'create', wraps=SafeCookieData.create) as mock_create:
+            self.verify_success()
+        self.assertEquals(mock_create.call_count, 1)
+        self.assertEquals(
+            self.client.response.cookies[settings.SESSION_COOKIE_NAME].value,
+            unicode(self.request.safe_cookie_verified_data),
+        )
+
+    def test_reused_cookie_expires_with_its_signature(self):
+        self.client.login(username=self.user.username, password='test')
+        self.request.user = self.user
+        session_id = self.client.session.session_key
+        signed_at = int(time.time()) - 100
+
+        with patch.object(SafeCookieData, 'signed_at', return_value=signed_at):
+            self.request.COOKIES[settings.SESSION_COOKIE_NAME] = unicode(
+                SafeCookieData.create(session_id, self.user.id)
+            )
+            self.assertIsNone(SafeSessionMiddleware().process_request(self.request))
+            self.client.response.set_cookie(
+                settings.SESSION_COOKIE_NAME, session_id, max_age=settings.SESSION_COOKIE_AGE
+            )
+            SafeSessionMiddleware().process_response(self.request, self.client.response)
+
+        cookie = self.client.response.cookies[settings.SESSION_COOKIE_NAME]
+        self.assertEquals(cookie.value, unicode(self.request.safe_cookie_verified_data))
+        self.assertLessEqual(int(cookie['max-age']), settings.SESSION_COOKIE_AGE - 100)
+        self.assertGreater(int(cookie['max-age']), settings.SESSION_COOKIE_AGE - 110)
+
+    def test_old_cookie_is_signed_again(self):
+        with patch.object(SafeCookieData, 'signed_at', return_value=0):
+            with patch.object(SafeCookieData, 'create', wraps=SafeCookieData.create) as mock_create:
+                self.verify_success()
+        self.assertEquals(mock_create.call_count, 2)
+
+    def test_new_session_cookie_is_signed_again(self):
+        self.client.login(username=self.user.username, password='test')
+        self.request.user = self.user
+        self.request.COOKIES[settings.SESSION_COOKIE_NAME] = unicode(
+            SafeCookieData.create(self.client.session.session_key, self.user.id)
+        )
+        self.assertIsNone(SafeSessionMiddleware().process_request(self.request))
+        self.client.response.cookies[settings.SESSION_COOKIE_NAME] = 'new_session_id'
+
+        SafeSessionMiddleware().process_response(self.request, self.client.response)
+        safe_cookie_data = SafeCookieData.parse(self.client.response.cookies[settings.SESSION_COOKIE_NAME].value)
+        self.assertEquals(safe_cookie_data.session_id, 'new_session_id')
+        self.assertTrue(safe_cookie_data.verify(self.user.id))
+
+
+@attr(shard=2)
+class TestVerifiedCookies(TestCase):
+    """
+    Test class for VerifiedCookies
+    """
+    @patch('time.time', return_value=1000)
+    def test_expiration(self, _mock_time):
+        verified_cookies = VerifiedCookies(2)
+        verified_cookies.add('cookie', 1, 1001)
+        verified_cookies.add('expired_cookie', 1, 1000)
+        self.assertIn(('cookie', 1), verified_cookies)
+        self.assertNotIn(('cookie', 2), verified_cookies)
+        self.assertNotIn(('expired_cookie', 1), verified_cookies)
+
+    @patch('time.time', return_value=1000)
+    def test_least_recently_used_is_forgotten(self, _mock_time):
+        verified_cookies = VerifiedCookies(2)
+        verified_cookies.add('first', 1, 2000)
+        verified_cookies.add('second', 1, 2000)
+        self.assertIn(('first', 1), verified_cookies)
+        verified_cookies.add('third', 1, 2000)
+        self.assertIn(('first', 1), verified_cookies)
+        self.assertNotIn(('second', 1), verified_cookies)
+        self.assertIn(('third', 1), verified_cookies)
@@ -8,7 +8,7 @@ from pytz import UTC
 from django.core.exceptions import ObjectDoesNotExist
 from django.conf import settings
 from django.core.validators import validate_email, validate_slug, ValidationError
-from openedx.core.djangoapps.user_api.preferences.api import update_user_preferences
+from openedx.core.djangoapps.user_api.preferences.api import get_users_preferences, update_user_preferences
 from openedx.core.djangoapps.user_api.errors import PreferenceValidationError
 
 from student.models import User, UserProfile, Registration
@@ -26,7 +26,7 @@ from ..forms import PasswordResetFormNoActive
 from ..helpers import intercept_errors
 
 from . import (
-    EMAIL_MIN_LENGTH, EMAIL_MAX_LENGTH, PASSWORD_MIN_LENGTH, PASSWORD_MAX_LENGTH,
+    ACCOUNT_VISIBILITY_PREF_KEY, EMAIL_MIN_LENGTH, EMAIL_MAX_LENGTH, PASSWORD_MIN_LENGTH, PASSWORD_MAX_LENGTH,
     USERNAME_MIN_LENGTH, USERNAME_MAX_LENGTH
 )
 from .serializers import (
@@ -72,10 +72,21 @@ def get_account_settings(request, usernames=None, configuration=None, view=None)
     requesting_user = request.user
     usernames = usernames or [requesting_user.username]
 
-    requested_users = User.objects.select_related('profile').filter(username__in=usernames)
+    requested_users = User.objects.select_related('profile').prefetch_related(
+        'profile__language_proficiencies'
+    ).filter(username__in=usernames)
     if not requested_users:
         raise UserNotFound()
 
+    # Load the visibility preferences of all of the users at once rather
+    # than once for each user being serialized. Profiles that require
+    # parental consent are always private, so their preference is not needed.
+    preferences = get_users_preferences(
+        [user for user in requested_users if not user.profile.requires_parental_consent()],
+        preference_keys=[ACCOUNT_VISIBILITY_PREF_KEY],
+        use_request_cache=True,
+    )
+
     serialized_users = []
     for user in requested_users:
         has_full_access = requesting_user.is_staff or requesting_user.username == user.username
@@ -87,6 +98,7 @@ def get_account_settings(request, usernames=None, configuration=None, view=None)
             user,
             configuration=configuration,
             custom_fields=admin_fields,
+            preferences=preferences.get(user.id, {}),
             context={'request': request}
         ).data)
 
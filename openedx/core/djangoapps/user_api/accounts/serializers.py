@@ -55,6 +55,9 @@ class UserReadOnlySerializer(serializers.Serializer):
         # Don't pass the 'custom_fields' arg up to the superclass
         self.custom_fields = kwargs.pop('custom_fields', [])
 
+        # Don't pass the 'preferences' arg up to the superclass
+        self.preferences = kwargs.pop('preferences', None)
+
         super(UserReadOnlySerializer, self).__init__(*args, **kwargs)
 
     def to_representation(self, user):
@@ -97,13 +100,13 @@ class UserReadOnlySerializer(serializers.Serializer):
             "mailing_address": profile.mailing_address,
             "requires_parental_consent": profile.requires_parental_consent(),
             "accomplishments_shared": accomplishments_shared,
-            "account_privacy": get_profile_visibility(profile, user, self.configuration),
+            "account_privacy": get_profile_visibility(profile, user, self.configuration, self.preferences),
         }
 
         if self.custom_fields:
             fields = self.custom_fields
         else:
-            fields = _visible_fields(profile, user, self.configuration)
+            fields = _visible_fields(profile, user, self.configuration, self.preferences)
 
         return self._filter_fields(
             fields,
@@ -240,34 +243,43 @@ class AccountLegacyProfileSerializer(serializers.HyperlinkedModelSerializer, Rea
         return instance
 
 
-def get_profile_visibility(user_profile, user, configuration=None):
-    """Returns the visibility level for the specified user profile."""
+def get_profile_visibility(user_profile, user, configuration=None, preferences=None):
+    """
+    Returns the visibility level for the specified user profile.
+
+    If given, `preferences` is a dict of the user's preferences already
+    loaded by the caller, which is used instead of querying for them.
+    """
     if user_profile.requires_parental_consent():
         return PRIVATE_VISIBILITY
 
     if not configuration:
         configuration = settings.ACCOUNT_VISIBILITY_CONFIGURATION
 
-    # Calling UserPreference directly because the requesting user may be different from existing_user
-    # (and does not have to be is_staff).
-    profile_privacy = UserPreference.get_value(user, ACCOUNT_VISIBILITY_PREF_KEY)
+    if preferences is not None:
+        profile_privacy = preferences.get(ACCOUNT_VISIBILITY_PREF_KEY)
+    else:
+        # Calling UserPreference directly because the requesting user may be different from existing_user
+        # (and does not have to be is_staff).
+        profile_privacy = UserPreference.get_value(user, ACCOUNT_VISIBILITY_PREF_KEY)
     return profile_privacy if profile_privacy else configuration.get('default_visibility')
 
 
-def _visible_fields(user_profile, user, configuration=None):
+def _visible_fields(user_profile, user, configuration=None, preferences=None):
     """
     Return what fields should be visible based on user settings
 
     :param user_profile: User profile object
     :param user: User object
     :param configuration: A visibility configuration dictionary.
+    :param preferences: An optional dict of the user's already loaded preferences.
     :return: whitelist List of fields to be shown
     """
 
     if not configuration:
         configuration = settings.ACCOUNT_VISIBILITY_CONFIGURATION
 
-    profile_visibility = get_profile_visibility(user_profile, user, configuration)
+    profile_visibility = get_profile_visibility(user_profile, user, configuration, preferences)
     if profile_visibility == ALL_USERS_VISIBILITY:
         return configuration.get('shareable_fields')
     else:
@@ -8,6 +8,7 @@ from django.db.models.signals import post_delete, pre_save, post_save
 from django.dispatch import receiver
 from model_utils.models import TimeStampedModel
 
+import request_cache
 from util.model_utils import get_changed_fields_dict, emit_setting_changed_event
 from xmodule_django.models import CourseKeyField
 
@@ -19,6 +20,10 @@ from xmodule_django.models import CourseKeyField
 # create an alias in "user_api".
 from student.models import UserProfile, Registration, PendingEmailChange  # pylint: disable=unused-import
 
+# Name of the request cache holding the preferences loaded by
+# user_api.preferences.api.get_users_preferences, keyed by user id.
+PREFERENCES_REQUEST_CACHE_NAME = 'user_api.preferences'
+
 
 class UserPreference(models.Model):
     """A user's preference, stored as generic text to be processed by client"""
@@ -74,6 +79,7 @@ def post_save_callback(sender, **kwargs):
         user_preference._old_value, user_preference.value
     )
     user_preference._old_value = None
+    request_cache.get_cache(PREFERENCES_REQUEST_CACHE_NAME).pop(user_preference.user_id, None)
 
 
 @receiver(post_delete, sender=UserPreference)
@@ -85,6 +91,7 @@ def post_delete_callback(sender, **kwargs):
     emit_setting_changed_event(
         user_preference.user, sender._meta.db_table, user_preference.key, user_preference.value, None
     )
+    request_cache.get_cache(PREFERENCES_REQUEST_CACHE_NAME).pop(user_preference.user_id, None)
 
 
 class UserCourseTag(models.Model):
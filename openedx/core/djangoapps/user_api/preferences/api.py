@@ -15,17 +15,21 @@ from django.utils.translation import ugettext_noop
 from openedx.core.lib.time_zone_utils import get_display_time_zone
 from pytz import common_timezones, common_timezones_set, country_timezones
 from student.models import User, UserProfile
+import request_cache
 from request_cache import get_request_or_stub
 from ..errors import (
     UserAPIInternalError, UserAPIRequestError, UserNotFound, UserNotAuthorized,
     PreferenceValidationError, PreferenceUpdateError, CountryCodeError
 )
 from ..helpers import intercept_errors
-from ..models import UserOrgTag, UserPreference
+from ..models import PREFERENCES_REQUEST_CACHE_NAME, UserOrgTag, UserPreference
 from ..serializers import UserSerializer, RawUserPreferenceSerializer
 
 log = logging.getLogger(__name__)
 
+# Maximum number of users whose preferences are loaded with a single query.
+PREFERENCES_BATCH_SIZE = 1000
+
 
 @intercept_errors(UserAPIInternalError, ignore_errors=[UserAPIRequestError])
 def get_user_preference(requesting_user, preference_key, username=None):
@@ -86,6 +90,72 @@ def get_user_preferences(requesting_user, username=None):
     return user_serializer.data["preferences"]
 
 
+def get_users_preferences(users, preference_keys=None, use_request_cache=False):
+    """Returns the preferences of several users, loaded with one query per chunk of users.
+
+    Note:
+        This method provides no authorization of access to the user preferences. It
+        is meant for code that needs preferences such as languages or time zones
+        for a whole page of users.
+
+    Args:
+        users (iterable): The users (or user ids) whose preferences should be returned.
+        preference_keys (iterable): Optional keys of the preferences to return. If not
+            specified, all of the users' preferences are returned.
+        use_request_cache (bool): Whether to reuse and remember the preferences loaded
+            during the current request, so that repeated lookups for the same users
+            don't query the database again.
+
+    Returns:
+        A dict mapping each user id to a dict of the user's preference values, keyed
+        by preference key. Preferences the users have not set are omitted.
+    """
+    user_ids = set(user if isinstance(user, (int, long)) else user.id for user in users)
+    if preference_keys is not None:
+        preference_keys = set(preference_keys)
+
+    cached_preferences = request_cache.get_cache(PREFERENCES_REQUEST_CACHE_NAME) if use_request_cache else {}
+    preferences = {}
+    for user_id in user_ids:
+        loaded_keys, values = cached_preferences.get(user_id, (set(), {}))
+        if loaded_keys is None or (preference_keys is not None and preference_keys <= loaded_keys):
+            preferences[user_id] = _filter_preferences(values, preference_keys)
+
+    missing_user_ids = sorted(user_ids - set(preferences))
+    loaded_preferences = {user_id: {} for user_id in missing_user_ids}
+    for index in range(0, len(missing_user_ids), PREFERENCES_BATCH_SIZE):
+        user_preferences = UserPreference.objects.filter(
+            user_id__in=missing_user_ids[index:index + PREFERENCES_BATCH_SIZE]
+        )
+        if preference_keys is not None:
+            user_preferences = user_preferences.filter(key__in=preference_keys)
+        for user_id, key, value in user_preferences.values_list('user_id', 'key', 'value'):
+            loaded_preferences[user_id][key] = value
+
+    for user_id, values in loaded_preferences.iteritems():
+        preferences[user_id] = values
+        if use_request_cache:
+            if preference_keys is None:
+                cached_preferences[user_id] = (None, dict(values))
+            else:
+                loaded_keys, cached_values = cached_preferences.get(user_id, (set(), {}))
+                cached_values = dict(cached_values)
+                cached_values.update(values)
+                cached_preferences[user_id] = (loaded_keys | preference_keys, cached_values)
+
+    return preferences
+
+
+def _filter_preferences(values, preference_keys):
+    """
+    Returns the subset of the given preference values with the given keys, or all of
+    them if preference_keys is None.
+    """
+    if preference_keys is None:
+        return dict(values)
+    return {key: value for key, value in values.iteritems() if key in preference_keys}
+
+
 @intercept_errors(UserAPIInternalError, ignore_errors=[UserAPIRequestError])
 def update_user_preferences(requesting_user, update, user=None):
     """Update the user preferences for the given user.
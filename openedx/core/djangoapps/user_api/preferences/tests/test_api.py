@@ -16,6 +16,7 @@ from django.test.utils import override_settings
 from dateutil.parser import parse as parse_datetime
 
 from openedx.core.lib.time_zone_utils import get_display_time_zone
+from request_cache.middleware import RequestCache
 from student.tests.factories import UserFactory
 
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
@@ -33,6 +34,7 @@ from ...models import UserProfile, UserOrgTag
 from ...preferences.api import (
     get_user_preference,
     get_user_preferences,
+    get_users_preferences,
     set_user_preference,
     update_user_preferences,
     delete_user_preference,
@@ -330,6 +332,73 @@ class TestPreferenceAPI(TestCase):
         )
 
 
+@attr(shard=2)
+@unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Account APIs are only supported in LMS')
+class GetUsersPreferencesTest(TestCase):
+    """
+    Tests for get_users_preferences.
+    """
+    def setUp(self):
+        super(GetUsersPreferencesTest, self).setUp()
+        self.users = [UserFactory.create() for __ in range(3)]
+        set_user_preference(self.users[0], "time_zone", "Asia/Tokyo")
+        set_user_preference(self.users[0], "pref-lang", "ja")
+        set_user_preference(self.users[1], "pref-lang", "fr")
+        RequestCache.clear_request_cache()
+        self.addCleanup(RequestCache.clear_request_cache)
+
+    def test_get_users_preferences(self):
+        with self.assertNumQueries(1):
+            preferences = get_users_preferences(self.users)
+        self.assertEqual(preferences, {
+            self.users[0].id: {"time_zone": "Asia/Tokyo", "pref-lang": "ja"},
+            self.users[1].id: {"pref-lang": "fr"},
+            self.users[2].id: {},
+        })
+
+    def test_preference_keys(self):
+        user_ids = [user.id for user in self.users]
+        with self.assertNumQueries(1):
+            preferences = get_users_preferences(user_ids, preference_keys=["time_zone"])
+        self.assertEqual(preferences, {
+            self.users[0].id: {"time_zone": "Asia/Tokyo"},
+            self.users[1].id: {},
+            self.users[2].id: {},
+        })
+
+    @patch('openedx.core.djangoapps.user_api.preferences.api.PREFERENCES_BATCH_SIZE', 2)
+    def test_batches(self):
+        with self.assertNumQueries(2):
+            preferences = get_users_preferences(self.users, preference_keys=["pref-lang"])
+        self.assertEqual(
+            preferences,
+            {self.users[0].id: {"pref-lang": "ja"}, self.users[1].id: {"pref-lang": "fr"}, self.users[2].id: {}}
+        )
+
+    def test_request_cache(self):
+        get_users_preferences(self.users, preference_keys=["pref-lang"], use_request_cache=True)
+        with self.assertNumQueries(0):
+            preferences = get_users_preferences(self.users[:2], preference_keys=["pref-lang"], use_request_cache=True)
+        self.assertEqual(preferences, {self.users[0].id: {"pref-lang": "ja"}, self.users[1].id: {"pref-lang": "fr"}})
+
+        # Keys that haven't been loaded yet are queried for.
+        with self.assertNumQueries(1):
+            preferences = get_users_preferences(self.users[:1], preference_keys=["time_zone"], use_request_cache=True)
+        self.assertEqual(preferences, {self.users[0].id: {"time_zone": "Asia/Tokyo"}})
+
+        # Without the request cache, the preferences are always queried for.
+        with self.assertNumQueries(1):
+            get_users_preferences(self.users, preference_keys=["pref-lang"])
+
+    def test_request_cache_is_invalidated(self):
+        get_users_preferences(self.users, use_request_cache=True)
+        set_user_preference(self.users[1], "pref-lang", "de")
+        with self.assertNumQueries(1):
+            preferences = get_users_preferences(self.users, use_request_cache=True)
+        self.assertEqual(preferences[self.users[1].id], {"pref-lang": "de"})
+        self.assertEqual(preferences[self.users[0].id], {"time_zone": "Asia/Tokyo", "pref-lang": "ja"})
+
+
 @attr(shard=2)
 @ddt.ddt
 class UpdateEmailOptInTests(ModuleStoreTestCase):
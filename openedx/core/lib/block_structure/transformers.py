@@ -42,6 +42,7 @@ class BlockStructureTransformers(object):
         """
         self.usage_info = usage_info
         self._transformers = {'supports_filter': [], 'no_filter': []}
+        self._ordered_transformers = []
         if transformers:
             self.__iadd__(transformers)
 
@@ -64,12 +65,19 @@ class BlockStructureTransformers(object):
             )
 
         for transformer in transformers:
+            self._ordered_transformers.append(transformer)
             if isinstance(transformer, FilteringTransformerMixin):
                 self._transformers['supports_filter'].append(transformer)
             else:
                 self._transformers['no_filter'].append(transformer)
         return self
 
+    def __iter__(self):
+        """
+        Iterates over the transformers in the order they were added.
+        """
+        return iter(self._ordered_transformers)
+
     @classmethod
     def collect(cls, block_structure):
         """
@@ -1,18 +1,59 @@
-"""Helper functions to get data from APIs"""
+"""Helper functions to get data from APIs
+
+Requests to the APIs are made with a JWT reused by the process until half of
+its lifetime has elapsed, and through a pool of connections shared by the
+process.
+
+Data is cached for the `cache_ttl` of the API's configuration, and kept
+EDX_API_DATA_STALE_TTL seconds longer: stale data is served immediately while
+a background thread refreshes it, so that a slow API doesn't slow down the
+pages using it. Concurrent requests for the same data missing from the cache
+are coalesced, only one of them hitting the API.
+"""
 from __future__ import unicode_literals
+from collections import namedtuple
 import logging
+import threading
+from time import time
 
 from django.conf import settings
 from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
 from edx_rest_api_client.client import EdxRestApiClient
 from provider.oauth2.models import Client
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 from openedx.core.lib.token_utils import JwtBuilder
+from student.models import UserProfile
 
 
 log = logging.getLogger(__name__)
 
+JWT_SCOPES = ['email', 'profile']
+
+# The number of JWTs kept by the process, so that the memory they use is bounded.
+MAX_CACHED_JWTS = 10000
+
+# How long the id and secret of the OAuth2 clients are cached, in seconds.
+CLIENT_CREDENTIALS_CACHE_TTL = 5 * 60
+
+# How long a background refresh of cached data may take, in seconds, before
+# another one can be started.
+REFRESH_LOCK_TIMEOUT = 60
+
+# The number of locks coalescing the requests for data missing from the cache.
+# Requests for different data may share a lock.
+FETCH_LOCK_STRIPES = 64
+
+CachedData = namedtuple('CachedData', ['data', 'fresh_until'])
+
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+_JWTS = {}
+_JWTS_LOCK = threading.Lock()
+_FETCH_LOCKS = [threading.Lock() for __ in range(FETCH_LOCK_STRIPES)]
+
 
 def get_edx_api_data(api_config, user, resource,
                      api=None, resource_id=None, querystring=None, cache_key=None):
@@ -42,37 +83,100 @@ def get_edx_api_data(api_config, user, resource,
         log.warning('%s configuration is disabled.', api_config.API_NAME)
         return no_data
 
-    if cache_key:
-        cache_key = '{}.{}'.format(cache_key, resource_id) if resource_id else cache_key
+    fetch_args = (api_config, user, resource, api, resource_id, querystring)
+    if not cache_key:
+        results = _fetch(*fetch_args)
+        return results if results is not None else no_data
+
+    cache_key = '{}.{}'.format(cache_key, resource_id) if resource_id else cache_key
+
+    cached = _get_cached_data(cache_key)
+    if cached is None:
+        with _FETCH_LOCKS[hash(cache_key) % FETCH_LOCK_STRIPES]:
+            # Another thread may have cached the data while this one was waiting for the lock.
+            cached = _get_cached_data(cache_key)
+            if cached is None:
+                results = _fetch(*fetch_args)
+                if results is None:
+                    return no_data
+                _set_cached_data(cache_key, results, api_config.cache_ttl)
+                return results
+
+    if cached.fresh_until <= time():
+        refresh_lock_key = '{}.refreshing'.format(cache_key)
+        if cache.add(refresh_lock_key, True, REFRESH_LOCK_TIMEOUT):
+            _run_in_background(_refresh, fetch_args, cache_key, refresh_lock_key)
 
-        cached = cache.get(cache_key)
-        if cached:
-            return cached
+    return cached.data
 
+
+def get_jwt(user, secret=None, aud=None):
+    """Returns a JWT for the user, with the email and profile scopes.
+
+    The JWTs built by the process are reused until half of their lifetime has elapsed.
+
+    Keyword Arguments:
+        secret (string): Overrides configured JWT secret (signing) key.
+        aud (string): Overrides configured JWT audience claim.
+    """
     try:
-        if not api:
-            # TODO: Use the system's JWT_AUDIENCE and JWT_SECRET_KEY instead of client ID and name.
-            client_name = api_config.OAUTH2_CLIENT_NAME
+        # Some users (e.g., service users) may not have user profiles.
+        name = UserProfile.objects.get(user=user).name
+    except UserProfile.DoesNotExist:
+        name = None
+
+    builder = JwtBuilder(user, secret=secret)
+    # The key holds all the claims about the user, so that changes to them are signed right away.
+    key = (user.id, user.username, user.email, name, user.is_staff, secret, aud) + tuple(
+        builder.jwt_auth.get(name) for name in ('JWT_ISSUER', 'JWT_AUDIENCE', 'JWT_SECRET_KEY')
+    )
+    now = time()
+
+    with _JWTS_LOCK:
+        cached = _JWTS.get(key)
+    if cached and cached[1] > now:
+        return cached[0]
+
+    expires_in = settings.OAUTH_ID_TOKEN_EXPIRATION
+    jwt = builder.build_token(JWT_SCOPES, expires_in, aud=aud)
+
+    with _JWTS_LOCK:
+        if len(_JWTS) >= MAX_CACHED_JWTS:
+            _JWTS.clear()
+        _JWTS[key] = (jwt, now + expires_in / 2)
+    return jwt
 
-            try:
-                client = Client.objects.get(name=client_name)
-            except Client.DoesNotExist:
-                raise ImproperlyConfigured(
-                    'OAuth2 Client with name [{}] does not exist.'.format(client_name)
-                )
 
-            scopes = ['email', 'profile']
-            expires_in = settings.OAUTH_ID_TOKEN_EXPIRATION
-            jwt = JwtBuilder(user, secret=client.client_secret).build_token(scopes, expires_in, aud=client.client_id)
+def create_api_client(url, jwt):
+    """Returns an API client authenticating with the JWT, whose requests use the connections pooled by the process."""
+    session = Session()
+    session.mount('http://', _ADAPTER)
+    session.mount('https://', _ADAPTER)
+    return EdxRestApiClient(url, jwt=jwt, session=session)
 
-            api = EdxRestApiClient(api_config.internal_api_url, jwt=jwt)
+
+def clear_jwts():
+    """Forget the JWTs built by the process."""
+    with _JWTS_LOCK:
+        _JWTS.clear()
+
+
+def _fetch(api_config, user, resource, api, resource_id, querystring):
+    """Requests the data from the API, returning None if it can't be retrieved."""
+    no_data = []
+
+    try:
+        if not api:
+            # TODO: Use the system's JWT_AUDIENCE and JWT_SECRET_KEY instead of client ID and name.
+            client_id, client_secret = _get_client_credentials(api_config.OAUTH2_CLIENT_NAME)
+            api = create_api_client(api_config.internal_api_url, get_jwt(user, secret=client_secret, aud=client_id))
     except:  # pylint: disable=bare-except
         log.exception('Failed to initialize the %s API client.', api_config.API_NAME)
-        return no_data
+        return None
 
     try:
         endpoint = getattr(api, resource)
-        querystring = querystring if querystring else {}
+        querystring = dict(querystring) if querystring else {}
         response = endpoint(resource_id).get(**querystring)
 
         if resource_id:
@@ -81,14 +185,65 @@ def get_edx_api_data(api_config, user, resource,
             results = _traverse_pagination(response, endpoint, querystring, no_data)
     except:  # pylint: disable=bare-except
         log.exception('Failed to retrieve data from the %s API.', api_config.API_NAME)
-        return no_data
-
-    if cache_key:
-        cache.set(cache_key, results, api_config.cache_ttl)
+        return None
 
     return results
 
 
+def _refresh(fetch_args, cache_key, refresh_lock_key):
+    """Requests the data from the API and caches it."""
+    api_config = fetch_args[0]
+    try:
+        results = _fetch(*fetch_args)
+        if results is not None:
+            _set_cached_data(cache_key, results, api_config.cache_ttl)
+    finally:
+        cache.delete(refresh_lock_key)
+
+
+def _run_in_background(function, *args):
+    """Calls the function in a new thread, which closes its database connection when done."""
+    def run():  # pylint: disable=missing-docstring
+        try:
+            function(*args)
+        except:  # pylint: disable=bare-except
+            log.exception('Failed to refresh cached API data.')
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=run, name='edx-api-data-refresh')
+    thread.daemon = True
+    thread.start()
+
+
+def _get_cached_data(cache_key):
+    """Returns the CachedData stored at the cache key, or None."""
+    cached = cache.get(cache_key)
+    return cached if isinstance(cached, CachedData) else None
+
+
+def _set_cached_data(cache_key, data, cache_ttl):
+    """Caches data, fresh for `cache_ttl` seconds and then served stale for EDX_API_DATA_STALE_TTL seconds."""
+    cached = CachedData(data=data, fresh_until=time() + cache_ttl)
+    cache.set(cache_key, cached, cache_ttl + settings.EDX_API_DATA_STALE_TTL)
+
+
+def _get_client_credentials(client_name):
+    """Returns the id and secret of the OAuth2 client with the given name."""
+    cache_key = 'edx_api_utils.oauth2_client.{}'.format(client_name)
+    credentials = cache.get(cache_key)
+    if credentials is None:
+        try:
+            client = Client.objects.get(name=client_name)
+        except Client.DoesNotExist:
+            raise ImproperlyConfigured(
+                'OAuth2 Client with name [{}] does not exist.'.format(client_name)
+            )
+        credentials = (client.client_id, client.client_secret)
+        cache.set(cache_key, credentials, CLIENT_CREDENTIALS_CACHE_TTL)
+    return credentials
+
+
 def _traverse_pagination(response, endpoint, querystring, no_data):
     """Traverse a paginated API response.
 
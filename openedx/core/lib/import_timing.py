@@ -0,0 +1,155 @@
+"""
+Timing of the imports of the modules loaded while a process starts.
+
+Python 2 has no equivalent of `python -X importtime`, so an ImportTimer
+replaces the `__import__` builtin while it is installed and times each import
+that loads new modules. The time of an import includes the time of the
+imports it triggers, which its self time doesn't.
+
+The wsgi applications of the LMS and Studio install an ImportTimer when the
+EDX_IMPORT_TIME_REPORT environment variable is set, and report the modules
+that took the longest to import once they have started. If the variable is a
+path rather than "1", the time of every import is also written to that file,
+one tab-separated line per module.
+
+The import lock of Python 2 serializes imports, but the imports of modules
+that are already loaded don't take it, so the times are only reliable while
+a single thread is importing, which is the case during startup.
+"""
+import __builtin__
+import logging
+import os
+import sys
+from time import time
+
+log = logging.getLogger(__name__)
+
+ENVIRONMENT_VARIABLE = 'EDX_IMPORT_TIME_REPORT'
+
+# The number of modules logged by report(), the slowest first.
+REPORTED_MODULES = 30
+
+_TIMER = None
+
+
+class ImportTimer(object):
+    """
+    Times the imports of new modules while installed.
+    """
+    def __init__(self):
+        # (total time, self time) of the imports, keyed by module name.
+        self.imports = {}
+        self.started = None
+        self.duration = None
+        self._nested_times = []
+        self._original_import = None
+
+    def install(self):
+        """
+        Start timing the imports.
+        """
+        self._original_import = __builtin__.__import__
+        __builtin__.__import__ = self._import
+        self.started = time()
+
+    def uninstall(self):
+        """
+        Stop timing the imports.
+        """
+        __builtin__.__import__ = self._original_import
+        self.duration = time() - self.started
+
+    def slowest_imports(self, limit=None):
+        """
+        Return the (module name, total time, self time) of the imports, by decreasing self time.
+        """
+        imports = sorted(
+            ((name, total, self_time) for name, (total, self_time) in self.imports.iteritems()),
+            key=lambda item: item[2],
+            reverse=True,
+        )
+        return imports[:limit] if limit is not None else imports
+
+    def _import(self, name, globals=None, locals=None, fromlist=None, level=-1):  # pylint: disable=redefined-builtin
+        """
+        Time an import, counting it if it loaded new modules.
+        """
+        # Python 2 adds a None entry to sys.modules when an implicit relative import
+        # fails, so imports of modules already loaded can grow sys.modules too.
+        loaded = sys.modules.get(_module_name(name, globals, level)) is not None and not fromlist
+        modules_count = len(sys.modules)
+        self._nested_times.append(0.0)
+        start = time()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            duration = time() - start
+            nested_time = self._nested_times.pop()
+            if len(sys.modules) > modules_count and not loaded:
+                module_name = _module_name(name, globals, level)
+                total, self_time = self.imports.get(module_name, (0.0, 0.0))
+                self.imports[module_name] = (total + duration, self_time + duration - nested_time)
+                if self._nested_times:
+                    self._nested_times[-1] += duration
+
+
+def start_from_environment():
+    """
+    Install an ImportTimer if the EDX_IMPORT_TIME_REPORT environment variable is set.
+    """
+    global _TIMER  # pylint: disable=global-statement
+    if os.environ.get(ENVIRONMENT_VARIABLE) and _TIMER is None:
+        _TIMER = ImportTimer()
+        _TIMER.install()
+
+
+def report():
+    """
+    Uninstall the ImportTimer installed by start_from_environment, log the
+    slowest imports and write all of them to the file named by the
+    EDX_IMPORT_TIME_REPORT environment variable, if it is a path.
+    """
+    global _TIMER  # pylint: disable=global-statement
+    if _TIMER is None:
+        return
+    timer, _TIMER = _TIMER, None
+    timer.uninstall()
+
+    log.info(
+        u"Imported %d modules in %.3fs. Slowest imports (module, total ms, self ms):\n%s",
+        len(timer.imports),
+        timer.duration,
+        u'\n'.join(
+            u'{}\t{:.1f}\t{:.1f}'.format(name, total * 1000, self_time * 1000)
+            for name, total, self_time in timer.slowest_imports(REPORTED_MODULES)
+        ),
+    )
+
+    path = os.environ.get(ENVIRONMENT_VARIABLE)
+    if path and path != '1':
+        with open(path, 'w') as report_file:
+            for name, total, self_time in timer.slowest_imports():
+                report_file.write('{}\t{:.6f}\t{:.6f}\n'.format(name, total, self_time))
+
+
+def _module_name(name, globals, level):  # pylint: disable=redefined-builtin
+    """
+    Return the name of the module imported by `import name` in the module of `globals`.
+    """
+    if level == 0 or not globals:
+        return name
+
+    package = globals.get('__package__')
+    if not package:
+        module = globals.get('__name__', '')
+        package = module if '__path__' in globals else module.rpartition('.')[0]
+    if level > 0:
+        for __ in range(level - 1):
+            package = package.rpartition('.')[0]
+        return '.'.join(part for part in (package, name) if part)
+
+    # Implicit relative imports try the package first.
+    relative_name = '{}.{}'.format(package, name)
+    if package and sys.modules.get(relative_name) is not None:
+        return relative_name
+    return name
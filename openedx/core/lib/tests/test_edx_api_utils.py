@@ -1,6 +1,10 @@
 """Tests covering edX API utilities."""
 import json
+import threading
+import time
+import unittest
 
+from django.conf import settings
 from django.core.cache import cache
 from django.test.utils import override_settings
 import httpretty
@@ -9,12 +13,15 @@ from nose.plugins.attrib import attr
 from edx_oauth2_provider.tests.factories import ClientFactory
 from provider.constants import CONFIDENTIAL
 
+from openedx.core.djangoapps.catalog.tests.mixins import CatalogIntegrationMixin
+from openedx.core.djangoapps.catalog.utils import get_programs
 from openedx.core.djangoapps.commerce.utils import ecommerce_api_client
 from openedx.core.djangoapps.programs.models import ProgramsApiConfig
 from openedx.core.djangoapps.programs.tests.mixins import ProgramsApiConfigMixin
 from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
-from openedx.core.lib.edx_api_utils import get_edx_api_data
+from openedx.core.lib.edx_api_utils import clear_jwts, get_edx_api_data
 from student.tests.factories import UserFactory
+from terrain.stubs.catalog import StubCatalogService
 
 
 UTILITY_MODULE = 'openedx.core.lib.edx_api_utils'
@@ -36,6 +43,7 @@ class TestGetEdxApiData(ProgramsApiConfigMixin, CacheIsolationTestCase):
         ClientFactory(name=ProgramsApiConfig.OAUTH2_CLIENT_NAME, client_type=CONFIDENTIAL)
 
         cache.clear()
+        clear_jwts()
 
     def _mock_programs_api(self, responses, url=None):
         """Helper for mocking out Programs API URLs."""
@@ -210,3 +218,160 @@ class TestGetEdxApiData(ProgramsApiConfigMixin, CacheIsolationTestCase):
         with mock.patch('openedx.core.lib.edx_api_utils.EdxRestApiClient.__init__') as mock_init:
             get_edx_api_data(program_config, self.user, 'orders', api=api)
             self.assertFalse(mock_init.called)
+
+    def test_empty_data_cached(self):
+        """Verify that empty data is cached like any other data."""
+        program_config = self.create_programs_config(cache_ttl=5)
+
+        self._mock_programs_api(
+            [httpretty.Response(body=json.dumps({'next': None, 'results': []}), content_type='application/json')]
+        )
+
+        cache_key = ProgramsApiConfig.current().CACHE_KEY
+        for __ in range(2):
+            self.assertEqual(get_edx_api_data(program_config, self.user, 'programs', cache_key=cache_key), [])
+
+        self._assert_num_requests(1)
+
+    @mock.patch(UTILITY_MODULE + '._run_in_background', side_effect=lambda function, *args: function(*args))
+    def test_stale_data_refreshed(self, mock_run_in_background):
+        """Verify that stale data is served while it is refreshed."""
+        program_config = self.create_programs_config(cache_ttl=5)
+
+        self._mock_programs_api([
+            httpretty.Response(body=json.dumps({'next': None, 'results': [data]}), content_type='application/json')
+            for data in ('stale', 'fresh')
+        ])
+
+        cache_key = ProgramsApiConfig.current().CACHE_KEY
+        self.assertEqual(get_edx_api_data(program_config, self.user, 'programs', cache_key=cache_key), ['stale'])
+        self.assertFalse(mock_run_in_background.called)
+
+        with mock.patch(UTILITY_MODULE + '.time', return_value=time.time() + 10):
+            self.assertEqual(get_edx_api_data(program_config, self.user, 'programs', cache_key=cache_key), ['stale'])
+            self.assertEqual(mock_run_in_background.call_count, 1)
+
+            self.assertEqual(get_edx_api_data(program_config, self.user, 'programs', cache_key=cache_key), ['fresh'])
+            self.assertEqual(mock_run_in_background.call_count, 1)
+
+        self._assert_num_requests(2)
+
+    @mock.patch(UTILITY_MODULE + '._run_in_background')
+    def test_single_refresh(self, mock_run_in_background):
+        """Verify that stale data is only refreshed once at a time."""
+        program_config = self.create_programs_config(cache_ttl=5)
+
+        self._mock_programs_api(
+            [httpretty.Response(body=json.dumps({'next': None, 'results': ['data']}), content_type='application/json')]
+        )
+
+        cache_key = ProgramsApiConfig.current().CACHE_KEY
+        get_edx_api_data(program_config, self.user, 'programs', cache_key=cache_key)
+
+        with mock.patch(UTILITY_MODULE + '.time', return_value=time.time() + 10):
+            for __ in range(3):
+                self.assertEqual(
+                    get_edx_api_data(program_config, self.user, 'programs', cache_key=cache_key), ['data']
+                )
+
+        self.assertEqual(mock_run_in_background.call_count, 1)
+
+    def test_concurrent_requests_coalesced(self):
+        """Verify that concurrent requests for data missing from the cache only hit the API once."""
+        program_config = self.create_programs_config(cache_ttl=5)
+        cache_key = ProgramsApiConfig.current().CACHE_KEY
+
+        def fetch(*args):  # pylint: disable=unused-argument
+            """Simulate a slow API."""
+            time.sleep(0.1)
+            return ['data']
+
+        results = []
+        with mock.patch(UTILITY_MODULE + '._fetch', side_effect=fetch) as mock_fetch:
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        get_edx_api_data(program_config, self.user, 'programs', cache_key=cache_key)
+                    )
+                )
+                for __ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(results, [['data']] * 5)
+        self.assertEqual(mock_fetch.call_count, 1)
+
+    @mock.patch(UTILITY_MODULE + '.JwtBuilder.build_token', return_value='token')
+    def test_jwt_reused(self, mock_build_token):
+        """Verify that the JWT is reused across requests."""
+        program_config = self.create_programs_config()
+
+        self._mock_programs_api([
+            httpretty.Response(body=json.dumps({'next': None, 'results': ['data']}), content_type='application/json')
+        ])
+
+        for __ in range(2):
+            get_edx_api_data(program_config, self.user, 'programs')
+
+        self.assertEqual(mock_build_token.call_count, 1)
+        self.assertEqual(httpretty.last_request().headers['Authorization'], 'JWT token')
+
+    @mock.patch(UTILITY_MODULE + '.JwtBuilder.build_token', return_value='token')
+    def test_jwt_not_reused_after_user_change(self, mock_build_token):
+        """Verify that a new JWT is built when the staff status or the name of the user changes."""
+        program_config = self.create_programs_config()
+
+        self._mock_programs_api([
+            httpretty.Response(body=json.dumps({'next': None, 'results': ['data']}), content_type='application/json')
+        ])
+
+        get_edx_api_data(program_config, self.user, 'programs')
+
+        self.user.is_staff = True
+        self.user.save()
+        get_edx_api_data(program_config, self.user, 'programs')
+
+        self.user.profile.name = 'New Name'
+        self.user.profile.save()
+        get_edx_api_data(program_config, self.user, 'programs')
+
+        self.assertEqual(mock_build_token.call_count, 3)
+
+
+@attr(shard=2)
+@unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
+class TestGetEdxApiDataFromStubService(CatalogIntegrationMixin, CacheIsolationTestCase):
+    """Tests of edX API data retrieval against a stub catalog service."""
+
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(TestGetEdxApiDataFromStubService, self).setUp()
+
+        self.user = UserFactory()
+        self.server = StubCatalogService()
+        self.addCleanup(self.server.shutdown)
+        self.create_catalog_integration(
+            internal_api_url='http://127.0.0.1:{}/api/v1/'.format(self.server.port),
+            cache_ttl=5,
+        )
+
+    def _set_programs(self, programs):
+        """Set the programs served by the stub service."""
+        self.server.config['catalog.programs'] = {'next': None, 'results': programs}
+
+    @mock.patch(UTILITY_MODULE + '._run_in_background', side_effect=lambda function, *args: function(*args))
+    def test_get_programs(self, _mock_run_in_background):
+        self._set_programs([{'uuid': 'first'}])
+        self.assertEqual(get_programs(self.user), [{'uuid': 'first'}])
+
+        self._set_programs([{'uuid': 'second'}])
+        self.assertEqual(get_programs(self.user), [{'uuid': 'first'}])
+
+        with mock.patch(UTILITY_MODULE + '.time', return_value=time.time() + 10):
+            # The stale programs are served while they are refreshed.
+            self.assertEqual(get_programs(self.user), [{'uuid': 'first'}])
+            self.assertEqual(get_programs(self.user), [{'uuid': 'second'}])
@@ -0,0 +1,57 @@
+"""Tests of the timing of imports."""
+import sys
+from unittest import TestCase
+
+from mock import patch
+
+from openedx.core.lib import import_timing
+
+
+class ImportTimerTest(TestCase):
+    """
+    Tests of the ImportTimer.
+    """
+    def setUp(self):
+        super(ImportTimerTest, self).setUp()
+        for name in ('xml.dom.minidom', 'xml.dom.domreg'):
+            self.addCleanup(sys.modules.pop, name, None)
+            sys.modules.pop(name, None)
+
+    def test_new_modules_are_timed(self):
+        timer = import_timing.ImportTimer()
+        timer.install()
+        try:
+            import xml.dom.minidom  # pylint: disable=unused-variable
+            import sys as already_imported  # pylint: disable=reimported, unused-variable
+        finally:
+            timer.uninstall()
+
+        self.assertIn('xml.dom.minidom', timer.imports)
+        self.assertNotIn('sys', timer.imports)
+        total, self_time = timer.imports['xml.dom.minidom']
+        self.assertLessEqual(self_time, total)
+        self.assertEqual(timer.slowest_imports(1)[0][2], max(times[1] for times in timer.imports.itervalues()))
+
+    def test_module_name(self):  # pylint: disable=protected-access
+        package_globals = {'__name__': 'xml.dom', '__path__': []}
+        module_globals = {'__name__': 'xml.dom.minidom'}
+        self.assertEqual(import_timing._module_name('os', module_globals, 0), 'os')
+        self.assertEqual(import_timing._module_name('domreg', module_globals, 1), 'xml.dom.domreg')
+        self.assertEqual(import_timing._module_name('sax', package_globals, 2), 'xml.sax')
+
+    @patch.dict('os.environ', {import_timing.ENVIRONMENT_VARIABLE: '1'})
+    @patch('openedx.core.lib.import_timing.log')
+    def test_report(self, mock_log):
+        import_timing.start_from_environment()
+        try:
+            import xml.dom.minidom  # pylint: disable=unused-variable
+        finally:
+            import_timing.report()
+
+        self.assertIs(import_timing._TIMER, None)  # pylint: disable=protected-access
+        self.assertIn('xml.dom.minidom', mock_log.info.call_args[0][3])
+
+    def test_report_without_timer(self):
+        with patch('openedx.core.lib.import_timing.log') as mock_log:
+            import_timing.report()
+        self.assertFalse(mock_log.info.called)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""
+Measure how long the LMS or Studio takes to serve its first request.
+
+Each run starts a new python process which loads the wsgi application of the
+service, then sends it a request. The times to load the application and to
+serve the first request are reported for every run, with their median.
+
+Run from the root of edx-platform, e.g.:
+
+    python scripts/benchmark_startup.py lms --settings=lms.envs.aws --runs=5
+
+Set the EDX_IMPORT_TIME_REPORT environment variable to also log the slowest
+imports of each run (see openedx/core/lib/import_timing.py), and the
+LAZY_STARTUP setting to compare the lazy and eager startups of the LMS.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# The program run by each process. It prints the timings as JSON on its last line.
+RUN = '''
+import json
+import sys
+from time import time
+from wsgiref.util import setup_testing_defaults
+
+start = time()
+from {service}.wsgi import application
+loaded = time()
+
+environ = {{'PATH_INFO': {path!r}, 'HTTP_HOST': {host!r}}}
+setup_testing_defaults(environ)
+statuses = []
+response = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+for __ in response:
+    pass
+if hasattr(response, 'close'):
+    response.close()
+served = time()
+
+sys.stdout.write('\\n' + json.dumps({{
+    'load': loaded - start,
+    'first_request': served - loaded,
+    'total': served - start,
+    'status': statuses[0],
+}}) + '\\n')
+'''
+
+
+def median(values):
+    """Return the median of the values."""
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def run_once(args):
+    """Start a process serving one request, and return its timings."""
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=args.settings)
+    program = RUN.format(service=args.service, path=args.path, host=args.host)
+    output = subprocess.check_output([sys.executable, '-c', program], env=env)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Measure the time to first request of the LMS or Studio.")
+    parser.add_argument('service', choices=['lms', 'cms'])
+    parser.add_argument('--settings', help="Django settings module (default: <service>.envs.aws)")
+    parser.add_argument('--runs', type=int, default=3, help="Number of processes to start")
+    parser.add_argument('--path', default='/heartbeat', help="Path of the first request")
+    parser.add_argument('--host', default='localhost', help="Host of the first request")
+    args = parser.parse_args(argv)
+    args.settings = args.settings or '{}.envs.aws'.format(args.service)
+
+    timings = []
+    for run in range(1, args.runs + 1):
+        timing = run_once(args)
+        timings.append(timing)
+        print "Run {}: load {load:.2f}s, first request ({status}) in {first_request:.2f}s, total {total:.2f}s".format(
+            run, **timing
+        )
+
+    print "Median: load {:.2f}s, first request in {:.2f}s, total {:.2f}s".format(
+        *[median([run_timing[key] for run_timing in timings]) for key in ('load', 'first_request', 'total')]
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
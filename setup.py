@@ -53,6 +53,8 @@ setup(
             "course_blocks_api = lms.djangoapps.course_api.blocks.transformers.blocks_api:BlocksAPITransformer",
             "milestones = lms.djangoapps.course_api.blocks.transformers.milestones:MilestonesTransformer",
             "grades = lms.djangoapps.grades.transformer:GradesTransformer",
+            "bookmarks = openedx.core.djangoapps.bookmarks.transformer:BookmarksTransformer",
+            "video_outline = lms.djangoapps.mobile_api.video_outlines.transformer:VideoOutlineTransformer",
         ],
     }
 )